@@ -0,0 +1,21 @@
+# [advice from AI] 처리 대기열 한도 확인 - 작업을 대기열에 넣는 API가 함께 사용 (업로드, 재시도)
+from fastapi import HTTPException
+
+from backend.config import get_settings
+from backend.core.scheduler import get_scheduler
+
+
+def check_queue_capacity(incoming: int = 1):
+    """새로 대기할 작업(incoming개)을 더하면 처리 대기열이 max_queue_depth를 넘을 때 503 에러 (Retry-After로 재시도 시점 안내)"""
+    settings = get_settings()
+    depth = get_scheduler().queue_depth
+    if settings.max_queue_depth and incoming > 0 and depth + incoming > settings.max_queue_depth:
+        raise HTTPException(
+            status_code=503,
+            detail=(
+                f"처리 대기 중인 작업이 너무 많습니다. ({depth}건"
+                + (f", 새로 등록할 작업 {incoming}건" if incoming > 1 else "")
+                + ") 잠시 후 다시 시도해주세요."
+            ),
+            headers={"Retry-After": str(settings.queue_retry_after)},
+        )
@@ -0,0 +1,324 @@
+# [advice from AI] 파일 Range 응답 모듈 (다중/접미 Range, ETag, 조건부 요청, zero-copy 전송)
+import os
+import hashlib
+import secrets
+from email.utils import formatdate, parsedate_to_datetime
+from typing import List, Mapping, Optional, Tuple
+from urllib.parse import quote
+
+import anyio
+from fastapi import Request
+from fastapi.responses import Response
+from starlette.types import Receive, Scope, Send
+
+
+# 파일을 읽어 보내는 단위 (zero-copy 미지원 서버)
+RANGE_CHUNK_SIZE = 1024 * 1024
+
+# 한 요청에서 허용하는 최대 Range 수 (초과하면 전체 파일 응답)
+MAX_RANGES = 16
+
+ByteRange = Tuple[int, int]
+
+
+class RangeNotSatisfiable(Exception):
+    """만족할 수 있는 Range가 없음 (416)"""
+
+
+def make_etag(*parts) -> str:
+    """구성 요소로 강한 ETag 생성 (따옴표 포함)"""
+    raw = "|".join(str(part) for part in parts).encode("utf-8")
+    return f'"{hashlib.sha1(raw).hexdigest()[:32]}"'
+
+
+def parse_range_header(header: str, size: int) -> Optional[List[ByteRange]]:
+    """
+    Range 헤더 해석 (bytes=0-99, bytes=100-, bytes=-500, 쉼표로 여러 개)
+
+    겹치거나 붙어 있는 구간은 합치고 시작 위치 순으로 정렬한다.
+
+    Args:
+        header: Range 헤더 값
+        size: 파일 크기
+
+    Returns:
+        (시작, 끝) 목록 (끝 포함). 형식이 잘못됐거나 너무 많으면 None (전체 응답)
+
+    Raises:
+        RangeNotSatisfiable: 파일 범위 안의 구간이 하나도 없을 때
+    """
+    unit, sep, spec = header.partition("=")
+    if not sep or unit.strip().lower() != "bytes":
+        return None
+
+    ranges: List[ByteRange] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start_str, dash, end_str = part.partition("-")
+        if not dash:
+            return None
+        try:
+            if not start_str.strip():
+                # 접미 Range: 마지막 N바이트
+                suffix = int(end_str)
+                if suffix <= 0:
+                    continue
+                start, end = max(0, size - suffix), size - 1
+            else:
+                start = int(start_str)
+                end = int(end_str) if end_str.strip() else None
+                if end is not None and end < start:
+                    return None
+                if start >= size:
+                    continue
+                end = size - 1 if end is None else min(end, size - 1)
+        except ValueError:
+            return None
+        if size > 0:
+            ranges.append((start, end))
+
+    if not ranges:
+        raise RangeNotSatisfiable()
+
+    ranges.sort()
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        last_start, last_end = merged[-1]
+        if start <= last_end + 1:
+            merged[-1] = (last_start, max(last_end, end))
+        else:
+            merged.append((start, end))
+
+    if len(merged) > MAX_RANGES:
+        return None
+    return merged
+
+
+def _etag_matches(header: str, etag: str, weak: bool) -> bool:
+    """If-None-Match / If-Range 의 ETag 비교 (weak=True면 W/ 접두어 무시)"""
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if weak and candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def matches_if_none_match(request: Request, etag: str) -> bool:
+    """If-None-Match가 ETag와 일치하는지 (메모리에서 만든 응답의 304 처리용)"""
+    header = request.headers.get("if-none-match")
+    return header is not None and _etag_matches(header, etag, weak=True)
+
+
+def _not_modified_since(header: str, mtime: float) -> bool:
+    """If-Modified-Since 이후 변경이 없는지 확인"""
+    try:
+        since = parsedate_to_datetime(header).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return False
+    return int(mtime) <= since
+
+
+def content_disposition(filename: str, disposition: str = "attachment") -> str:
+    """Content-Disposition 헤더 (한글 파일명은 RFC 5987)"""
+    encoded = quote(filename)
+    if encoded != filename:
+        return f"{disposition}; filename*=UTF-8''{encoded}"
+    return f'{disposition}; filename="{filename}"'
+
+
+class FilePartsResponse(Response):
+    """
+    (앞부분 바이트, 파일 구간) 목록을 이어 붙여 보내는 응답
+
+    서버가 http.response.zerocopysend 확장을 지원하면 파일 구간은 파일
+    디스크립터로 바로 전송하고, 아니면 RANGE_CHUNK_SIZE 단위로 스레드에서 읽어 보낸다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        parts: List[Tuple[bytes, Optional[ByteRange]]],
+        trailer: bytes = b"",
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: str = "application/octet-stream",
+    ):
+        self.path = path
+        self.background = None
+        self.status_code = status_code
+        self.media_type = media_type
+        self._parts = parts
+        self._trailer = trailer
+
+        content_length = len(trailer) + sum(
+            len(head) + (byte_range[1] - byte_range[0] + 1 if byte_range else 0)
+            for head, byte_range in parts
+        )
+        response_headers = dict(headers or {})
+        response_headers["content-length"] = str(content_length)
+        self.init_headers(response_headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+        if scope["method"].upper() == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        zero_copy = "http.response.zerocopysend" in scope.get("extensions", {})
+
+        with open(self.path, "rb") as file:
+            for head, byte_range in self._parts:
+                if head:
+                    await send({"type": "http.response.body", "body": head, "more_body": True})
+                if byte_range is None:
+                    continue
+                start, end = byte_range
+                if zero_copy:
+                    await send({
+                        "type": "http.response.zerocopysend",
+                        "file": file,
+                        "offset": start,
+                        "count": end - start + 1,
+                        "more_body": True,
+                    })
+                    continue
+                await anyio.to_thread.run_sync(file.seek, start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = await anyio.to_thread.run_sync(file.read, min(RANGE_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+
+        await send({"type": "http.response.body", "body": self._trailer, "more_body": False})
+
+
+class RangeFileResponse(FilePartsResponse):
+    """
+    파일 전체 또는 일부(Range)를 보내는 응답
+
+    - 구간 1개: 206 + Content-Range
+    - 구간 여러 개: 206 multipart/byteranges
+    """
+
+    def __init__(
+        self,
+        path: str,
+        size: int,
+        ranges: Optional[List[ByteRange]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: str = "application/octet-stream",
+    ):
+        response_headers = dict(headers or {})
+        response_headers["accept-ranges"] = "bytes"
+        # (앞부분 바이트, 파일 구간) 목록 + 마지막 바이트
+        parts: List[Tuple[bytes, Optional[ByteRange]]] = []
+        trailer = b""
+
+        if not ranges:
+            status_code = 200
+            parts.append((b"", (0, size - 1) if size else None))
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            status_code = 206
+            parts.append((b"", (start, end)))
+            response_headers["content-range"] = f"bytes {start}-{end}/{size}"
+        else:
+            boundary = secrets.token_hex(12)
+            status_code = 206
+            for index, (start, end) in enumerate(ranges):
+                head = (
+                    ("\r\n" if index else "")
+                    + f"--{boundary}\r\n"
+                    + f"Content-Type: {media_type}\r\n"
+                    + f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+                ).encode("latin-1")
+                parts.append((head, (start, end)))
+            trailer = f"\r\n--{boundary}--\r\n".encode("latin-1")
+            media_type = f"multipart/byteranges; boundary={boundary}"
+
+        super().__init__(
+            path,
+            parts,
+            trailer=trailer,
+            status_code=status_code,
+            headers=response_headers,
+            media_type=media_type,
+        )
+
+
+def serve_file(
+    request: Request,
+    path: str,
+    media_type: str,
+    etag: str,
+    filename: Optional[str] = None,
+    disposition: str = "attachment",
+) -> Response:
+    """
+    조건부 요청/Range를 처리하여 파일 응답 생성
+
+    - If-None-Match(없으면 If-Modified-Since)가 일치하면 304
+    - If-Range가 현재 ETag/수정 시각과 다르면 Range를 무시하고 전체 응답
+    - 만족할 수 없는 Range는 416
+
+    Args:
+        request: 요청 (헤더 확인용)
+        path: 파일 경로
+        media_type: Content-Type
+        etag: 강한 ETag (make_etag)
+        filename: 다운로드 파일명 (있으면 Content-Disposition 추가)
+        disposition: attachment 또는 inline
+    """
+    stat = os.stat(path)
+    size = stat.st_size
+    last_modified = formatdate(stat.st_mtime, usegmt=True)
+
+    headers = {
+        "etag": etag,
+        "last-modified": last_modified,
+        "cache-control": "no-cache",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, etag, weak=True)
+    else:
+        not_modified = bool(if_modified_since) and _not_modified_since(if_modified_since, stat.st_mtime)
+    if not_modified and request.method in ("GET", "HEAD"):
+        return Response(status_code=304, headers=headers)
+
+    if filename:
+        headers["content-disposition"] = content_disposition(filename, disposition)
+
+    ranges = None
+    range_header = request.headers.get("range")
+    if range_header and request.method in ("GET", "HEAD"):
+        if_range = request.headers.get("if-range")
+        range_valid = (
+            not if_range
+            or (if_range.startswith(('"', 'W/')) and _etag_matches(if_range, etag, weak=False))
+            or if_range == last_modified
+        )
+        if range_valid:
+            try:
+                ranges = parse_range_header(range_header, size)
+            except RangeNotSatisfiable:
+                return Response(
+                    status_code=416,
+                    headers={"content-range": f"bytes */{size}", "accept-ranges": "bytes"},
+                )
+
+    return RangeFileResponse(path, size, ranges=ranges, headers=headers, media_type=media_type)
@@ -0,0 +1,166 @@
+# [advice from AI] 배치 API 라우터 - 함께 등록한 작업들의 진행 상황 조회와 배치 단위 재시도/삭제/다운로드
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, desc
+from typing import List
+import asyncio
+
+from backend.database import get_db, get_read_db
+from backend.api.ranges import content_disposition
+from backend.api.queue import check_queue_capacity
+from backend.models.job import Job, JobStatus
+from backend.models.batch import Batch, BatchResponse
+from backend.core.bulk import (
+    delete_jobs, reset_failed_jobs, cancel_jobs, promote_cache_followers, remove_deleted_files,
+)
+from backend.core.events import publish_bulk
+from backend.core.scheduler import get_scheduler
+from backend.core.storage import job_zip_entries
+from backend.core.zipstream import iter_zip
+
+router = APIRouter()
+
+
+async def _get_batch(db: AsyncSession, batch_id: str) -> Batch:
+    """배치 조회 (없으면 404)"""
+    batch = await db.get(Batch, batch_id)
+    if not batch:
+        raise HTTPException(status_code=404, detail="배치를 찾을 수 없습니다.")
+    return batch
+
+
+@router.get("/", response_model=List[BatchResponse])
+async def list_batches(
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """배치 목록 (최신순)"""
+    result = await db.execute(select(Batch).order_by(desc(Batch.created_at)).limit(limit))
+    return [BatchResponse.from_batch(batch) for batch in result.scalars().all()]
+
+
+@router.get("/{batch_id}", response_model=BatchResponse)
+async def get_batch(
+    batch_id: str,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    배치 진행 상황 (상태별 작업 수, 전체 진행률, 예상 남은 시간)
+
+    집계는 작업 변경 트리거가 배치 행에 미리 반영해 두므로 기본 키 조회 한 번으로 끝난다.
+    """
+    return BatchResponse.from_batch(await _get_batch(db, batch_id))
+
+
+@router.post("/{batch_id}/retry", response_model=BatchResponse)
+async def retry_batch(
+    batch_id: str,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    배치의 실패한 작업을 모두 재시도 (UPDATE 한 번 후 스케줄러 대기열에 추가)
+
+    되돌린 작업 수만큼 대기열 한도를 넘으면 503 (UPDATE는 커밋하지 않고 롤백)
+    """
+    batch = await _get_batch(db, batch_id)
+
+    rows = await reset_failed_jobs(db, Job.batch_id == batch_id)
+    check_queue_capacity(len(rows))
+    await db.commit()
+
+    publish_bulk(rows, "updated", status=JobStatus.PENDING, progress=0, error_message=None)
+    get_scheduler().submit_many(rows)
+
+    # 트리거가 갱신한 집계 다시 읽기
+    await db.refresh(batch)
+    return BatchResponse.from_batch(batch)
+
+
+@router.post("/{batch_id}/cancel", response_model=BatchResponse)
+async def cancel_batch(
+    batch_id: str,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    배치의 끝나지 않은 작업 모두 취소 (UPDATE 한 번)
+
+    대기 중인 작업은 대기열에서 빼고, 처리 중인 작업은 진행 중인 TTS 요청을 끊는다.
+    """
+    batch = await _get_batch(db, batch_id)
+
+    rows = await cancel_jobs(db, Job.batch_id == batch_id)
+    promoted = await promote_cache_followers(db, [row.id for row in rows])
+    await db.commit()
+
+    get_scheduler().cancel_many([row.id for row in rows])
+    get_scheduler().submit_many(promoted)
+    publish_bulk(rows, "updated", status=JobStatus.CANCELLED)
+
+    await db.refresh(batch)
+    return BatchResponse.from_batch(batch)
+
+
+@router.delete("/{batch_id}")
+async def delete_batch(
+    batch_id: str,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    배치와 소속 작업 모두 삭제 (파일 포함)
+
+    작업은 DELETE 한 번으로 지우고, 파일은 커밋 후 스레드에서 삭제한다.
+    """
+    await _get_batch(db, batch_id)
+
+    rows = await delete_jobs(db, Job.batch_id == batch_id)
+    await db.execute(delete(Batch).where(Batch.id == batch_id))
+    promoted = await promote_cache_followers(db, [row.id for row in rows])
+    await db.commit()
+
+    get_scheduler().cancel_many([row.id for row in rows])
+    get_scheduler().submit_many(promoted)
+    publish_bulk(rows, "deleted")
+    await remove_deleted_files(rows)
+
+    return {
+        "message": f"배치와 {len(rows)}개 작업이 삭제되었습니다.",
+        "batch_id": batch_id,
+        "deleted_count": len(rows),
+    }
+
+
+@router.get("/{batch_id}/download")
+async def download_batch(
+    batch_id: str,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """배치의 완료된 작업 결과(WAV + JSON)를 ZIP 하나로 스트리밍"""
+    batch = await _get_batch(db, batch_id)
+
+    result = await db.execute(
+        select(Job.original_filename, Job.output_filename, Job.json_filename)
+        .where(
+            Job.batch_id == batch_id,
+            Job.status == JobStatus.COMPLETED,
+            Job.output_filename.isnot(None),
+        )
+        .order_by(Job.created_at, Job.id)
+    )
+    rows = result.all()
+
+    # 파일 존재 확인(stat)이 작업 수만큼 필요하므로 스레드에서
+    def collect():
+        used_names = set()
+        return [entry for row in rows for entry in job_zip_entries(row, used_names)]
+
+    entries = await asyncio.to_thread(collect)
+    if not entries:
+        raise HTTPException(status_code=404, detail="다운로드 가능한 파일이 없습니다.")
+
+    base_name = batch.name.split(".")[0] if batch.name else f"batch-{batch_id[:8]}"
+    return StreamingResponse(
+        iter_zip(entries),
+        media_type="application/zip",
+        headers={"Content-Disposition": content_disposition(f"{base_name or 'batch'}.zip")},
+    )
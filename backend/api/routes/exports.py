@@ -0,0 +1,147 @@
+# [advice from AI] 데이터셋 내보내기 API 라우터 (tar 샤드 + 발화 매니페스트)
+from fastapi import APIRouter, HTTPException, Depends, Request, BackgroundTasks
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, desc
+from typing import List
+import os
+import json
+import uuid
+import shutil
+
+from backend.config import get_settings
+from backend.database import get_db, get_read_db
+from backend.models.export import Export, ExportStatus, ExportCreate, ExportResponse
+from backend.core.exporter import run_export, export_path, MANIFEST_FILENAME
+from backend.api.ranges import serve_file, make_etag
+
+router = APIRouter()
+
+
+async def _get_export(db: AsyncSession, export_id: str) -> Export:
+    """내보내기 조회 (없으면 404)"""
+    export = await db.get(Export, export_id)
+    if not export:
+        raise HTTPException(status_code=404, detail="내보내기를 찾을 수 없습니다.")
+    return export
+
+
+@router.post("/", response_model=ExportResponse)
+async def create_export(
+    request: ExportCreate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    데이터셋 내보내기 시작
+    
+    작업 목록과 같은 필터(상태, 검색, 생성일)에 맞는 작업의 {id}.wav + {id}.json을
+    크기 제한 tar 샤드로 묶고, 전체 발화를 manifest.jsonl로 저장한다.
+    백그라운드에서 실행되며 진행 상황은 GET /api/exports/{id}로 확인한다.
+    """
+    settings = get_settings()
+    
+    export = Export(
+        id=str(uuid.uuid4()),
+        status=ExportStatus.PENDING,
+        filters=json.dumps(
+            request.model_dump(mode="json", exclude={"shard_size_mb"}, exclude_none=True),
+            ensure_ascii=False,
+        ),
+        shard_size_mb=request.shard_size_mb or settings.export_shard_size_mb,
+    )
+    db.add(export)
+    await db.commit()
+    await db.refresh(export)
+    
+    background_tasks.add_task(run_export, export.id)
+    
+    return ExportResponse.from_export(export)
+
+
+@router.get("/", response_model=List[ExportResponse])
+async def list_exports(
+    db: AsyncSession = Depends(get_read_db),
+):
+    """내보내기 목록 (최신순)"""
+    result = await db.execute(select(Export).order_by(desc(Export.created_at)))
+    return [ExportResponse.from_export(export) for export in result.scalars().all()]
+
+
+@router.get("/{export_id}", response_model=ExportResponse)
+async def get_export(
+    export_id: str,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """내보내기 상태/샤드 목록 조회"""
+    return ExportResponse.from_export(await _get_export(db, export_id))
+
+
+@router.api_route("/{export_id}/shards/{index}", methods=["GET", "HEAD"])
+async def download_shard(
+    export_id: str,
+    index: int,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """샤드(tar) 다운로드 - Range/이어받기 지원"""
+    export = await _get_export(db, export_id)
+    
+    if export.status != ExportStatus.COMPLETED:
+        raise HTTPException(status_code=400, detail="아직 완료되지 않은 내보내기입니다.")
+    
+    shard = next((item for item in export.load_shards() if item["index"] == index), None)
+    path = export_path(export_id, shard["filename"]) if shard else None
+    if not path or not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="샤드를 찾을 수 없습니다.")
+    
+    return serve_file(
+        request,
+        path,
+        "application/x-tar",
+        make_etag(export_id, shard["sha256"]),
+        filename=f"export-{export_id[:8]}-{shard['filename']}",
+    )
+
+
+@router.api_route("/{export_id}/manifest", methods=["GET", "HEAD"])
+async def download_manifest(
+    export_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """발화 매니페스트(JSONL) 다운로드"""
+    export = await _get_export(db, export_id)
+    
+    if export.status != ExportStatus.COMPLETED:
+        raise HTTPException(status_code=400, detail="아직 완료되지 않은 내보내기입니다.")
+    
+    path = export_path(export_id, MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="매니페스트를 찾을 수 없습니다.")
+    
+    stat = os.stat(path)
+    return serve_file(
+        request,
+        path,
+        "application/x-ndjson",
+        make_etag(export_id, stat.st_size, stat.st_mtime_ns),
+        filename=f"export-{export_id[:8]}-{MANIFEST_FILENAME}",
+    )
+
+
+@router.delete("/{export_id}")
+async def delete_export(
+    export_id: str,
+    db: AsyncSession = Depends(get_db),
+):
+    """내보내기 삭제 (샤드/매니페스트 파일 포함)"""
+    export = await _get_export(db, export_id)
+    
+    if export.status in (ExportStatus.PENDING, ExportStatus.RUNNING):
+        raise HTTPException(status_code=400, detail="진행 중인 내보내기는 삭제할 수 없습니다.")
+    
+    shutil.rmtree(export_path(export_id), ignore_errors=True)
+    await db.delete(export)
+    await db.commit()
+    
+    return {"message": "내보내기가 삭제되었습니다.", "id": export_id}
@@ -1,25 +1,55 @@
 # [advice from AI] 파일 관리 API 라우터 - Range 요청 지원 추가
-from fastapi import APIRouter, HTTPException, Depends, Request, Header
-from fastapi.responses import FileResponse, StreamingResponse, Response
+from fastapi import APIRouter, HTTPException, Depends, Request, Query
+from fastapi.responses import StreamingResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import List, Optional
+from typing import Iterator, List, Optional, Set, Tuple
 import os
-import zipfile
-import io
+import json
+import asyncio
 from urllib.parse import quote
 
 from backend.config import get_settings
-from backend.database import get_db
+from backend.database import get_db, get_read_db
 from backend.models.job import Job, JobStatus
+from backend.core.storage import peaks_filename, job_zip_entries
+from backend.core.bulk import promote_cache_followers, remove_deleted_files
+from backend.core.scheduler import get_scheduler
+from backend.core.peaks import read_peaks, int16_le_bytes, DEFAULT_POINTS
+from backend.core.audio_mixer import AudioMixer
+from backend.core.zipstream import ZipEntry, iter_zip, unique_arcname
+from backend.core.preview import ensure_preview, PreviewError, PREVIEW_FORMATS
+from backend.core.utterance_index import load_utterances, store_utterances_from_json
+from backend.core.wavclip import WavLayout, read_wav_layout, wav_header, clip_range
+from backend.api.ranges import (
+    serve_file,
+    make_etag,
+    matches_if_none_match,
+    content_disposition,
+    FilePartsResponse,
+)
 
 router = APIRouter()
 
 
+# [advice from AI] 출력 파일 ETag (결과 캐시 키 + 버전 + 파일 정보가 같으면 같은 값)
+def _file_etag(job: Job, file_path: str) -> str:
+    """작업 출력 파일의 강한 ETag"""
+    stat = os.stat(file_path)
+    return make_etag(
+        job.content_hash or job.id,
+        job.version or 1,
+        os.path.basename(file_path),
+        stat.st_size,
+        stat.st_mtime_ns,
+    )
+
+
 @router.get("/{job_id}/download")
 async def download_file(
     job_id: str,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     생성된 WAVE 파일 다운로드
@@ -55,22 +85,17 @@ async def download_file(
     # 다운로드 파일명 생성 (원본 이름 기반)
     download_name = f"{os.path.splitext(job.original_filename)[0]}.wav"
     
-    return FileResponse(
-        path=file_path,
-        filename=download_name,
-        media_type="audio/wav",
-    )
+    return serve_file(request, file_path, "audio/wav", _file_etag(job, file_path), filename=download_name)
 
 
-@router.get("/{job_id}/stream")
+@router.api_route("/{job_id}/stream", methods=["GET", "HEAD"])
 async def stream_audio(
     job_id: str,
     request: Request,
-    range: Optional[str] = Header(None),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
-    오디오 스트리밍 (미리 듣기용) - Range 요청 지원
+    오디오 스트리밍 (미리 듣기용) - Range/If-Range/If-None-Match 지원
     """
     settings = get_settings()
     
@@ -85,55 +110,312 @@ async def stream_audio(
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
     
-    file_size = os.path.getsize(file_path)
+    # [advice from AI] Range(다중/접미) + ETag/조건부 요청 처리 (다시 열어도 재다운로드 없음)
+    return serve_file(request, file_path, "audio/wav", _file_etag(job, file_path))
+
+
+# [advice from AI] 미리듣기 전용 저용량 오디오 (첫 요청 시 생성, 원본 WAV는 그대로 다운로드용)
+@router.api_route("/{job_id}/preview", methods=["GET", "HEAD"])
+async def stream_preview(
+    job_id: str,
+    request: Request,
+    format: Optional[str] = Query(None, pattern="^(opus|mp3)$", description="opus 또는 mp3 (없으면 설정값)"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    미리듣기 오디오 스트리밍 (Opus/MP3) - Range/If-Range/If-None-Match 지원
+    
+    처음 요청할 때 WAV를 인코딩해 미리듣기 캐시에 저장하고, 캐시가 설정 크기를
+    넘으면 오래 재생하지 않은 파일부터 삭제한다.
+    """
+    settings = get_settings()
+    
+    result = await db.execute(select(Job).where(Job.id == job_id))
+    job = result.scalar_one_or_none()
+    
+    if not job or job.status != JobStatus.COMPLETED or not job.output_filename:
+        raise HTTPException(status_code=404, detail="재생 가능한 파일이 없습니다.")
+    
+    wav_path = os.path.join(settings.output_dir, job.output_filename)
+    
+    if not os.path.exists(wav_path):
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    
+    fmt = format or settings.preview_format
+    try:
+        path = await asyncio.to_thread(ensure_preview, wav_path, fmt)
+    except PreviewError as e:
+        raise HTTPException(status_code=503, detail=f"미리듣기 파일을 만들 수 없습니다: {e}")
+    
+    # 파일 이름이 WAV 내용 + 형식 + 비트레이트로 정해지므로 그대로 ETag로 사용
+    etag = make_etag(os.path.basename(path))
+    return serve_file(request, path, PREVIEW_FORMATS[fmt][3], etag)
+
+
+# [advice from AI] 파형 피크 API (PCM 다운로드 없이 미리보기 파형/발화 마커 표시)
+def _build_peaks_from_wav(wav_path: str, peaks_path: str):
+    """피크 사이드카가 없는 기존 결과물은 WAV에서 한 번 생성"""
+    from pydub import AudioSegment
+    
+    temp_path = f"{peaks_path}.tmp"
+    AudioMixer().write_peaks(AudioSegment.from_wav(wav_path), temp_path)
+    os.replace(temp_path, peaks_path)
+
+
+@router.get("/{job_id}/peaks")
+async def get_peaks(
+    job_id: str,
+    request: Request,
+    resolution: Optional[int] = Query(None, ge=1, description="피크당 샘플(프레임) 수 (가장 가까운 레벨 선택)"),
+    points: int = Query(DEFAULT_POINTS, ge=1, le=1_000_000, description="resolution이 없을 때 최대 피크 수"),
+    format: str = Query("json", pattern="^(json|bin)$", description="json 또는 bin (int16 LE min/max 쌍)"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    파형 min/max 피크 조회
+    
+    json: {sample_rate, frames_per_peak, peak_count, duration_seconds, levels, data: [min0, max0, ...]}
+    bin: int16 리틀 엔디언 min/max 쌍 (메타데이터는 X-Peaks-* 헤더)
+    """
+    settings = get_settings()
+    
+    result = await db.execute(select(Job).where(Job.id == job_id))
+    job = result.scalar_one_or_none()
     
-    # Range 요청 처리 (브라우저 오디오 재생 지원)
-    if range:
+    if not job or job.status != JobStatus.COMPLETED or not job.output_filename:
+        raise HTTPException(status_code=404, detail="파형을 만들 수 있는 파일이 없습니다.")
+    
+    wav_path = os.path.join(settings.output_dir, job.output_filename)
+    peaks_path = os.path.join(settings.output_dir, peaks_filename(job.output_filename))
+    
+    if not os.path.exists(peaks_path):
+        if not os.path.exists(wav_path):
+            raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+        await asyncio.to_thread(_build_peaks_from_wav, wav_path, peaks_path)
+    
+    level = await asyncio.to_thread(read_peaks, peaks_path, resolution, points)
+    
+    etag = make_etag(_file_etag(job, peaks_path), level.frames_per_peak, format)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if matches_if_none_match(request, etag):
+        return Response(status_code=304, headers=headers)
+    
+    if format == "bin":
+        headers.update({
+            "X-Peaks-Sample-Rate": str(level.sample_rate),
+            "X-Peaks-Frames-Per-Peak": str(level.frames_per_peak),
+            "X-Peaks-Frame-Count": str(level.frame_count),
+        })
+        return Response(content=int16_le_bytes(level.data), media_type="application/octet-stream", headers=headers)
+    
+    return Response(
+        content=json.dumps({
+            "sample_rate": level.sample_rate,
+            "frames_per_peak": level.frames_per_peak,
+            "frame_count": level.frame_count,
+            "peak_count": level.peak_count,
+            "duration_seconds": round(level.duration_seconds, 3),
+            "levels": level.available,
+            "data": level.data.tolist(),
+        }, separators=(",", ":")),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+# [advice from AI] 발화 단위 WAV 클립 API (디코딩 없이 헤더 합성 + data 청크 구간 전송)
+def _utterance_frames(utterance: dict, sample_rate: int) -> Tuple[int, int]:
+    """발화의 (시작, 끝) 프레임 - 기록된 샘플 오프셋 우선, 없으면(이전 결과물) 타임스탬프로 계산"""
+    if "start_sample" in utterance and "end_sample" in utterance:
+        return int(utterance["start_sample"]), int(utterance["end_sample"])
+    return (
+        int(round(float(utterance.get("started_at", 0)) * sample_rate)),
+        int(round(float(utterance.get("ended_at", 0)) * sample_rate)),
+    )
+
+
+def _load_utterance_source(job: Job) -> Tuple[str, WavLayout, dict]:
+    """
+    클립을 잘라낼 WAV 경로, WAV 구조, 발화 JSON 로드
+
+    Raises:
+        HTTPException: 파일이 없거나 PCM WAV가 아닐 때
+    """
+    settings = get_settings()
+    if not job.output_filename or not job.json_filename:
+        raise HTTPException(status_code=404, detail="출력 파일이 없습니다.")
+    
+    wav_path = os.path.join(settings.output_dir, job.output_filename)
+    json_path = os.path.join(settings.output_dir, job.json_filename)
+    if not os.path.exists(wav_path) or not os.path.exists(json_path):
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    
+    try:
+        layout = read_wav_layout(wav_path)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return wav_path, layout, json.load(f)
+
+
+def _iter_utterance_entries(sources: List[Tuple[Job, str]], used_names: Set[str]) -> Iterator[ZipEntry]:
+    """
+    작업별 발화 클립 ZIP 항목 + 마지막에 manifest.jsonl (ASR 학습용)
+    
+    WAV/JSON은 ZIP을 쓰는 스레드에서 작업 순서대로 읽으므로 작업 수와 무관하게
+    한 번에 한 작업의 발화 정보만 메모리에 둔다.
+    
+    Args:
+        sources: [(작업, 폴더 이름), ...]
+        used_names: 이미 사용한 폴더 이름 (중복 방지)
+    """
+    manifest = []
+    for job, base_name in sources:
         try:
-            range_str = range.replace("bytes=", "")
-            start_str, end_str = range_str.split("-")
-            start = int(start_str) if start_str else 0
-            end = int(end_str) if end_str else file_size - 1
-            
-            if start >= file_size:
-                raise HTTPException(status_code=416, detail="Range not satisfiable")
-            
-            end = min(end, file_size - 1)
-            content_length = end - start + 1
-            
-            def iter_file():
-                with open(file_path, "rb") as f:
-                    f.seek(start)
-                    remaining = content_length
-                    while remaining > 0:
-                        chunk_size = min(8192, remaining)
-                        data = f.read(chunk_size)
-                        if not data:
-                            break
-                        remaining -= len(data)
-                        yield data
-            
-            return StreamingResponse(
-                iter_file(),
-                status_code=206,
-                media_type="audio/wav",
-                headers={
-                    "Content-Range": f"bytes {start}-{end}/{file_size}",
-                    "Accept-Ranges": "bytes",
-                    "Content-Length": str(content_length),
-                },
+            wav_path, layout, json_data = _load_utterance_source(job)
+        except HTTPException:
+            continue
+        
+        folder = unique_arcname(base_name, used_names)
+        sample_rate = int(json_data.get("sample_rate") or layout.sample_rate)
+        for utterance in json_data.get("utterances", []):
+            start, end = _utterance_frames(utterance, sample_rate)
+            offset, length = clip_range(layout, start, end)
+            turn_idx = int(utterance["turn_idx"])
+            arcname = f"{folder}/{folder}_turn{turn_idx:03d}.wav"
+            yield ZipEntry(
+                path=wav_path,
+                arcname=arcname,
+                offset=offset,
+                length=length,
+                prefix=wav_header(layout, length),
             )
-        except ValueError:
-            pass
+            manifest.append(json.dumps({
+                "audio_filepath": arcname,
+                "duration": round(length / layout.block_align / layout.sample_rate, 3),
+                "text": utterance.get("utterance", ""),
+                "role": utterance.get("role"),
+                "turn_idx": turn_idx,
+                "call_id": json_data.get("call_id", job.id),
+                "source": job.original_filename,
+            }, ensure_ascii=False))
+    
+    yield ZipEntry(
+        path=None,
+        arcname="manifest.jsonl",
+        data=("\n".join(manifest) + "\n").encode("utf-8") if manifest else b"",
+    )
+
+
+@router.get("/{job_id}/utterances/archive")
+async def download_utterance_archive(
+    job_id: str,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    작업의 모든 발화를 개별 WAV 클립으로 묶은 ZIP (스트리밍) + manifest.jsonl
+    """
+    result = await db.execute(select(Job).where(Job.id == job_id))
+    job = result.scalar_one_or_none()
     
-    # Range 요청이 없는 경우 전체 파일 반환
-    return FileResponse(
-        path=file_path,
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    
+    if job.status != JobStatus.COMPLETED:
+        raise HTTPException(status_code=400, detail="아직 완료되지 않은 작업입니다.")
+    
+    base_name = os.path.splitext(job.original_filename)[0]
+    
+    return StreamingResponse(
+        iter_zip(_iter_utterance_entries([(job, base_name)], set())),
+        media_type="application/zip",
+        headers={"Content-Disposition": content_disposition(f"{base_name}_utterances.zip")},
+    )
+
+
+@router.post("/utterances/download-batch")
+async def download_utterance_batch(
+    job_ids: List[str],
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    여러 작업의 발화 클립을 작업별 폴더로 묶은 ZIP (스트리밍) + 전체 manifest.jsonl
+    """
+    result = await db.execute(
+        select(Job).where(
+            Job.id.in_(job_ids),
+            Job.status == JobStatus.COMPLETED,
+            Job.output_filename.isnot(None),
+            Job.json_filename.isnot(None),
+        )
+    )
+    jobs = result.scalars().all()
+    
+    if not jobs:
+        raise HTTPException(status_code=404, detail="다운로드 가능한 파일이 없습니다.")
+    
+    sources = [(job, os.path.splitext(job.original_filename)[0]) for job in jobs]
+    
+    return StreamingResponse(
+        iter_zip(_iter_utterance_entries(sources, set())),
+        media_type="application/zip",
+        headers={"Content-Disposition": "attachment; filename=script2wave_utterances.zip"},
+    )
+
+
+@router.api_route("/{job_id}/utterances/{turn_idx}", methods=["GET", "HEAD"])
+async def get_utterance_clip(
+    job_id: str,
+    turn_idx: int,
+    request: Request,
+    download: bool = Query(False, description="true면 첨부 파일로 다운로드"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    발화 하나(turn_idx)의 WAV 클립
+    
+    발화 JSON의 샘플 오프셋과 WAV 헤더로 바이트 구간을 계산하고,
+    44바이트 헤더를 합성한 뒤 원본 data 청크 구간을 그대로 전송한다.
+    """
+    result = await db.execute(select(Job).where(Job.id == job_id))
+    job = result.scalar_one_or_none()
+    
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    
+    if job.status != JobStatus.COMPLETED:
+        raise HTTPException(status_code=400, detail="아직 완료되지 않은 작업입니다.")
+    
+    wav_path, layout, json_data = await asyncio.to_thread(_load_utterance_source, job)
+    
+    utterance = next(
+        (item for item in json_data.get("utterances", []) if item.get("turn_idx") == turn_idx),
+        None,
+    )
+    if utterance is None:
+        raise HTTPException(status_code=404, detail="해당 발화를 찾을 수 없습니다.")
+    
+    sample_rate = int(json_data.get("sample_rate") or layout.sample_rate)
+    start, end = _utterance_frames(utterance, sample_rate)
+    offset, length = clip_range(layout, start, end)
+    
+    etag = make_etag(_file_etag(job, wav_path), turn_idx, offset, length)
+    headers = {"etag": etag, "cache-control": "no-cache"}
+    if matches_if_none_match(request, etag):
+        return Response(status_code=304, headers=headers)
+    
+    base_name = os.path.splitext(job.original_filename)[0]
+    headers["content-disposition"] = content_disposition(
+        f"{base_name}_turn{turn_idx:03d}.wav",
+        "attachment" if download else "inline",
+    )
+    
+    return FilePartsResponse(
+        wav_path,
+        [(wav_header(layout, length), (offset, offset + length - 1) if length else None)],
+        headers=headers,
         media_type="audio/wav",
-        headers={
-            "Accept-Ranges": "bytes",
-            "Content-Length": str(file_size),
-        },
     )
 
 
@@ -141,7 +423,8 @@ async def stream_audio(
 @router.get("/{job_id}/download-json")
 async def download_json(
     job_id: str,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     발화 정보 JSON 파일 다운로드
@@ -177,23 +460,17 @@ async def download_json(
     # 다운로드 파일명 생성 (원본 이름 기반)
     download_name = f"{os.path.splitext(job.original_filename)[0]}.json"
     
-    return FileResponse(
-        path=file_path,
-        filename=download_name,
-        media_type="application/json",
-    )
+    return serve_file(request, file_path, "application/json", _file_etag(job, file_path), filename=download_name)
 
 
 @router.get("/{job_id}/download-all")
 async def download_all(
     job_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     WAV + JSON 파일 함께 다운로드 (ZIP)
     """
-    settings = get_settings()
-    
     result = await db.execute(select(Job).where(Job.id == job_id))
     job = result.scalar_one_or_none()
     
@@ -205,33 +482,17 @@ async def download_all(
     
     base_name = os.path.splitext(job.original_filename)[0]
     
-    # ZIP 파일 생성
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        # WAV 파일 추가
-        if job.output_filename:
-            wav_path = os.path.join(settings.output_dir, job.output_filename)
-            if os.path.exists(wav_path):
-                zip_file.write(wav_path, f"{base_name}.wav")
-        
-        # JSON 파일 추가
-        if job.json_filename:
-            json_path = os.path.join(settings.output_dir, job.json_filename)
-            if os.path.exists(json_path):
-                zip_file.write(json_path, f"{base_name}.json")
-    
-    zip_buffer.seek(0)
-    zip_content = zip_buffer.getvalue()
+    # [advice from AI] ZIP을 메모리에 만들지 않고 파일을 읽는 대로 스트리밍
+    entries = job_zip_entries(job, set())
     
     # [advice from AI] 한글 파일명 인코딩 (RFC 5987)
     encoded_filename = quote(f"{base_name}.zip")
     
-    return Response(
-        content=zip_content,
+    return StreamingResponse(
+        iter_zip(entries),
         media_type="application/zip",
         headers={
             "Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}",
-            "Content-Length": str(len(zip_content)),
         },
     )
 
@@ -239,13 +500,11 @@ async def download_all(
 @router.post("/download-batch")
 async def download_batch(
     job_ids: List[str],
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     여러 파일 일괄 다운로드 (ZIP)
     """
-    settings = get_settings()
-    
     # 완료된 작업만 필터링
     result = await db.execute(
         select(Job).where(
@@ -262,33 +521,15 @@ async def download_batch(
             detail="다운로드 가능한 파일이 없습니다."
         )
     
-    # [advice from AI] ZIP 파일 생성 - WAV와 JSON 모두 포함
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        for job in jobs:
-            base_name = os.path.splitext(job.original_filename)[0]
-            
-            # WAV 파일 추가
-            if job.output_filename:
-                wav_path = os.path.join(settings.output_dir, job.output_filename)
-                if os.path.exists(wav_path):
-                    zip_file.write(wav_path, f"{base_name}.wav")
-            
-            # JSON 파일 추가
-            if job.json_filename:
-                json_path = os.path.join(settings.output_dir, job.json_filename)
-                if os.path.exists(json_path):
-                    zip_file.write(json_path, f"{base_name}.json")
-    
-    zip_buffer.seek(0)
-    zip_content = zip_buffer.getvalue()
+    # [advice from AI] WAV와 JSON 모두 포함, 파일을 읽는 대로 ZIP 스트리밍
+    used_names = set()
+    entries = [entry for job in jobs for entry in job_zip_entries(job, used_names)]
     
-    return Response(
-        content=zip_content,
+    return StreamingResponse(
+        iter_zip(entries),
         media_type="application/zip",
         headers={
             "Content-Disposition": "attachment; filename=script2wave_batch.zip",
-            "Content-Length": str(len(zip_content)),
         },
     )
 
@@ -301,34 +542,19 @@ async def delete_file(
     """
     작업 및 관련 파일 삭제
     """
-    settings = get_settings()
-    
     result = await db.execute(select(Job).where(Job.id == job_id))
     job = result.scalar_one_or_none()
     
     if not job:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
     
-    # 업로드 파일 삭제
-    upload_path = os.path.join(settings.upload_dir, job.filename)
-    if os.path.exists(upload_path):
-        os.remove(upload_path)
-    
-    # 출력 WAV 파일 삭제
-    if job.output_filename:
-        output_path = os.path.join(settings.output_dir, job.output_filename)
-        if os.path.exists(output_path):
-            os.remove(output_path)
-    
-    # [advice from AI] 출력 JSON 파일 삭제
-    if job.json_filename:
-        json_path = os.path.join(settings.output_dir, job.json_filename)
-        if os.path.exists(json_path):
-            os.remove(json_path)
-    
-    # DB에서 삭제
+    # DB에서 삭제 후 [advice from AI] 업로드/출력/세그먼트 파일 삭제 (스레드 풀)
     await db.delete(job)
+    promoted = await promote_cache_followers(db, [job_id])
     await db.commit()
+    get_scheduler().cancel(job_id)
+    get_scheduler().submit_many(promoted)
+    await remove_deleted_files([job])
     
     return {"message": "작업이 삭제되었습니다.", "job_id": job_id}
 
@@ -336,7 +562,7 @@ async def delete_file(
 @router.get("/{job_id}/original")
 async def get_original_content(
     job_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     원본 대화록 내용 조회
@@ -372,8 +598,10 @@ async def get_json_preview(
 ):
     """
     발화 정보 JSON 내용 조회 (미리보기) + 파일 크기 정보
+    
+    발화는 utterances 테이블에서 읽는다. 색인 전에 만들어진 결과물은
+    처음 조회할 때 JSON 파일로 한 번 색인한다.
     """
-    import json
     settings = get_settings()
     
     result = await db.execute(select(Job).where(Job.id == job_id))
@@ -393,8 +621,16 @@ async def get_json_preview(
     if not os.path.exists(json_path):
         raise HTTPException(status_code=404, detail="JSON 파일을 찾을 수 없습니다.")
     
-    with open(json_path, 'r', encoding='utf-8') as f:
-        json_data = json.load(f)
+    utterances = await load_utterances(db, job_id)
+    if not utterances and await store_utterances_from_json(db, job_id, json_path):
+        await db.commit()
+        utterances = await load_utterances(db, job_id)
+    
+    json_data = {
+        "call_id": job.id,
+        "audio_file": job.output_filename,
+        "utterances": utterances,
+    }
     
     # 파일 크기 정보 추가
     wav_size = 0
@@ -412,4 +648,3 @@ async def get_json_preview(
     }
     
     return json_data
-
@@ -1,132 +1,242 @@
 # [advice from AI] 작업 관리 API 라우터 - 실사용 버전 강화
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import StreamingResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc, asc, or_
-from typing import Optional, List
-from datetime import datetime, timedelta
+from sqlalchemy import select, func, case
+from sqlalchemy.orm import undefer
+from typing import Optional, List, Tuple
+from collections import OrderedDict
+from datetime import datetime, timezone
+import asyncio
+import time
 
-from backend.database import get_db
-from backend.models.job import Job, JobStatus, JobResponse, JobListResponse
+from backend.config import get_settings
+from backend.api.queue import check_queue_capacity
+from backend.database import get_db, get_read_db
+from backend.api.ranges import make_etag, matches_if_none_match
+from backend.core.events import get_event_bus, format_sse, publish_bulk
+from backend.core.bulk import (
+    delete_jobs_by_id, reset_failed_jobs_by_id, cancel_jobs_by_id, promote_cache_followers, remove_deleted_files,
+)
+from backend.core.scheduler import get_scheduler
+from backend.core.pagination import CursorError, encode_cursor, decode_cursor, keyset_order, keyset_after
+from backend.models.job import (
+    Job,
+    JobStatus,
+    JobResponse,
+    JobListResponse,
+    ScriptUpdateRequest,
+    ScriptUpdateResponse,
+    JOB_SORT_COLUMNS,
+    DEFAULT_SORT,
+    ACTIVE_STATUSES,
+    job_filters,
+)
+from backend.models.stats import JobCounter, JobThroughput
+from backend.models.batch import Batch
+from backend.models.changes import JobSequence, JobTombstone, JobChangesResponse, SEQUENCE_JOBS, SEQUENCE_PRUNED
 
 router = APIRouter()
 
 
+# [advice from AI] 검색/날짜 필터 목록의 총 개수 캐시 (키: 필터, 값: (만료 시각, 개수))
+_count_cache: "OrderedDict[tuple, Tuple[float, int]]" = OrderedDict()
+COUNT_CACHE_MAX_ENTRIES = 256
+
+# 배치 필터만 있을 때 배치 행에서 바로 읽는 상태별 작업 수 (처리 중 세부 상태는 COUNT)
+_BATCH_COUNT_COLUMNS = {
+    None: Batch.total,
+    JobStatus.PENDING: Batch.pending,
+    JobStatus.COMPLETED: Batch.completed,
+    JobStatus.FAILED: Batch.failed,
+    JobStatus.CANCELLED: Batch.cancelled,
+}
+
+
+async def count_jobs(
+    db: AsyncSession,
+    status: Optional[JobStatus],
+    search: Optional[str],
+    date_from: Optional[str],
+    date_to: Optional[str],
+    batch_id: Optional[str] = None,
+) -> Tuple[int, bool]:
+    """
+    필터에 맞는 작업 수
+    
+    필터가 없거나 상태 필터만 있으면 트리거로 갱신되는 job_counters에서 바로 읽고,
+    배치 필터만 있으면 배치 행의 집계를 읽는다.
+    검색/날짜 필터가 있으면 COUNT 결과를 job_count_cache_seconds 동안 재사용한다.
+    
+    Returns:
+        (작업 수, 캐시 값 여부)
+    """
+    if batch_id and not search and not date_from and not date_to:
+        column = _BATCH_COUNT_COLUMNS.get(status)
+        if column is not None:
+            return (await db.execute(select(column).where(Batch.id == batch_id))).scalar() or 0, False
+    elif not search and not date_from and not date_to:
+        query = select(func.coalesce(func.sum(JobCounter.count), 0))
+        if status:
+            query = query.where(JobCounter.status == status.name)
+        return (await db.execute(query)).scalar() or 0, False
+    
+    ttl = get_settings().job_count_cache_seconds
+    key = (status, search, date_from, date_to, batch_id)
+    now = time.monotonic()
+    cached = _count_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1], True
+    
+    conditions = job_filters(status, search, date_from, date_to, batch_id)
+    total = (await db.execute(select(func.count()).select_from(Job).where(*conditions))).scalar() or 0
+    if ttl > 0:
+        _count_cache[key] = (now + ttl, total)
+        _count_cache.move_to_end(key)
+        while len(_count_cache) > COUNT_CACHE_MAX_ENTRIES:
+            _count_cache.popitem(last=False)
+    return total, False
+
+
 @router.get("/", response_model=JobListResponse)
 async def list_jobs(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     status: Optional[JobStatus] = None,
-    search: Optional[str] = Query(None, description="파일명 검색"),
+    search: Optional[str] = Query(None, description="파일명(부분 문자열, 2글자 이하는 접두어)/ID(접두어) 검색"),
     date_from: Optional[str] = Query(None, description="시작일 (YYYY-MM-DD)"),
     date_to: Optional[str] = Query(None, description="종료일 (YYYY-MM-DD)"),
     sort_by: str = Query("created_at", description="정렬 기준"),
     sort_order: str = Query("desc", description="정렬 순서 (asc/desc)"),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 대신 커서 다음부터 조회)"),
+    batch_id: Optional[str] = Query(None, description="배치 ID (해당 배치의 작업만)"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     작업 목록 조회 (검색, 필터, 정렬 지원)
-    """
-    # 기본 쿼리
-    query = select(Job)
-    count_query = select(func.count(Job.id))
-    
-    # 상태 필터
-    if status:
-        query = query.where(Job.status == status)
-        count_query = count_query.where(Job.status == status)
-    
-    # 파일명 검색
-    if search:
-        search_filter = or_(
-            Job.original_filename.ilike(f"%{search}%"),
-            Job.id.ilike(f"%{search}%")
-        )
-        query = query.where(search_filter)
-        count_query = count_query.where(search_filter)
     
-    # 날짜 필터
-    if date_from:
-        try:
-            from_date = datetime.strptime(date_from, "%Y-%m-%d")
-            query = query.where(Job.created_at >= from_date)
-            count_query = count_query.where(Job.created_at >= from_date)
-        except ValueError:
-            pass
+    [advice from AI] cursor를 주면 (정렬 값, id) 키셋으로 바로 다음 행부터 읽으므로
+    페이지가 깊어져도 비용이 같다. cursor가 없으면 기존처럼 page로 건너뛴다.
+    응답의 next_cursor로 다음 페이지를 요청할 수 있다.
+    
+    ETag는 작업 변경 순번과 요청 조건으로 만들므로, 그 뒤로 바뀐 작업이 없으면
+    목록을 조회하지 않고 304로 응답한다.
+    """
+    etag = make_etag("jobs", await current_change_seq(db), sorted(request.query_params.multi_items()))
+    if matches_if_none_match(request, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    
+    if sort_by not in JOB_SORT_COLUMNS:
+        sort_by = DEFAULT_SORT
+    order = "asc" if sort_order == "asc" else "desc"
+    descending = order == "desc"
+    sort_column, nullable = JOB_SORT_COLUMNS[sort_by]
+    
+    conditions = job_filters(status, search, date_from, date_to, batch_id)
+    query = (
+        select(Job, sort_column.label("sort_value"))
+        .where(*conditions)
+        .order_by(*keyset_order(sort_column, Job.id, descending))
+    )
     
-    if date_to:
+    if cursor:
         try:
-            to_date = datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1)
-            query = query.where(Job.created_at < to_date)
-            count_query = count_query.where(Job.created_at < to_date)
-        except ValueError:
-            pass
-    
-    # 총 개수
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-    
-    # 정렬
-    sort_column = getattr(Job, sort_by, Job.created_at)
-    if sort_order == "asc":
-        query = query.order_by(asc(sort_column))
+            value, row_id = decode_cursor(cursor, sort_by, order)
+        except CursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        query = query.where(keyset_after(sort_column, Job.id, value, row_id, descending, nullable))
     else:
-        query = query.order_by(desc(sort_column))
+        query = query.offset((page - 1) * page_size)
     
-    # 페이지네이션
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    # 한 행 더 읽어 다음 페이지가 있는지 확인
+    rows = (await db.execute(query.limit(page_size + 1))).all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
     
-    result = await db.execute(query)
-    jobs = result.scalars().all()
+    total, total_cached = await count_jobs(db, status, search, date_from, date_to, batch_id)
+    
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor(sort_by, order, last.sort_value, last.Job.id)
     
     return JobListResponse(
-        jobs=[JobResponse.model_validate(job) for job in jobs],
+        jobs=[JobResponse.model_validate(row.Job) for row in rows],
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
+        total_cached=total_cached,
     )
 
 
 @router.get("/stats/summary")
 async def get_stats(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
-    작업 통계 조회 (강화된 버전)
+    작업 통계 조회
+    
+    [advice from AI] 상태별 수/평균 길이는 트리거로 갱신되는 job_counters에서,
+    오늘 완료 수와 처리량(최근 1시간/24시간)은 분 단위 job_throughput에서 읽는다.
+    (작업 수와 무관하게 쿼리 2개)
     """
+    counters = {
+        row.status: row
+        for row in (await db.execute(select(JobCounter))).scalars()
+    }
+    
     # 상태별 카운트
     stats = {}
     for status in JobStatus:
-        result = await db.execute(
-            select(func.count(Job.id)).where(Job.status == status)
-        )
-        stats[status.value] = result.scalar() or 0
+        counter = counters.get(status.name)
+        stats[status.value] = counter.count if counter else 0
     
-    # 총 작업 수
-    total_result = await db.execute(select(func.count(Job.id)))
-    total = total_result.scalar() or 0
+    total = sum(stats.values())
     
-    # 완료된 작업의 평균 처리 시간 (초)
-    avg_duration_result = await db.execute(
-        select(func.avg(Job.duration_seconds)).where(Job.status == JobStatus.COMPLETED)
-    )
-    avg_duration = avg_duration_result.scalar() or 0
-    
-    # 오늘 처리된 작업 수
-    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-    today_result = await db.execute(
-        select(func.count(Job.id)).where(
-            Job.completed_at >= today,
-            Job.status == JobStatus.COMPLETED
-        )
+    # 완료된 작업의 평균 오디오 길이 (초)
+    completed = counters.get(JobStatus.COMPLETED.name)
+    avg_duration = (
+        completed.duration_total / completed.duration_count
+        if completed and completed.duration_count else 0
     )
-    today_completed = today_result.scalar() or 0
     
     # 처리 중인 작업 수
     processing_statuses = [JobStatus.PARSING, JobStatus.GENERATING_TTS, JobStatus.MIXING]
-    processing_result = await db.execute(
-        select(func.count(Job.id)).where(Job.status.in_(processing_statuses))
-    )
-    processing = processing_result.scalar() or 0
+    processing = sum(stats[status.value] for status in processing_statuses)
+    
+    # 오늘(UTC) / 최근 1시간 / 최근 24시간 처리량
+    now = int(time.time())
+    today = int(datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+                .replace(tzinfo=timezone.utc).timestamp())
+    hour_ago = now - 3600
+    day_ago = now - 86400
+    
+    def window(since: int):
+        return (
+            func.coalesce(func.sum(case((JobThroughput.bucket >= since, JobThroughput.completed), else_=0)), 0),
+            func.coalesce(func.sum(case((JobThroughput.bucket >= since, JobThroughput.failed), else_=0)), 0),
+            func.coalesce(func.sum(case((JobThroughput.bucket >= since, JobThroughput.audio_seconds), else_=0)), 0),
+        )
+    
+    row = (await db.execute(
+        select(*window(today), *window(hour_ago), *window(day_ago))
+        .where(JobThroughput.bucket >= min(today, day_ago))
+    )).one()
+    today_completed = row[0]
+    
+    def throughput(completed_count, failed_count, audio_seconds, hours: float) -> dict:
+        return {
+            "completed": completed_count,
+            "failed": failed_count,
+            "audio_hours": round(audio_seconds / 3600, 3),
+            "jobs_per_hour": round(completed_count / hours, 2),
+            "audio_hours_per_hour": round(audio_seconds / 3600 / hours, 3),
+        }
     
     return {
         "total": total,
@@ -135,23 +245,269 @@ async def get_stats(
         "avg_duration_seconds": round(avg_duration, 1) if avg_duration else 0,
         "today_completed": today_completed,
         "processing": processing,
+        "throughput": {
+            "last_hour": throughput(row[3], row[4], row[5], 1),
+            "last_24h": throughput(row[6], row[7], row[8], 24),
+        },
+    }
+
+
+# [advice from AI] 작업 변경 순번 (트리거가 INSERT/UPDATE/DELETE마다 증가)
+async def current_change_seq(db: AsyncSession) -> int:
+    """마지막 변경 순번 (목록 ETag, 변경분 조회 기준)"""
+    result = await db.execute(select(JobSequence.value).where(JobSequence.name == SEQUENCE_JOBS))
+    return result.scalar() or 0
+
+
+@router.get("/changes", response_model=JobChangesResponse)
+async def job_changes(
+    since: Optional[str] = Query(None, description="이전 응답의 token (없으면 현재 token만 반환)"),
+    limit: int = Query(500, ge=1, le=1000),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    since 이후 생성/변경/삭제된 작업 (변경 순번 인덱스로 조회)
+    
+    목록 전체를 다시 받지 않고 바뀐 행만 갱신할 때 사용한다. 응답의 token을 다음 요청의
+    since로 보낸다. reset이 true면 since가 삭제 기록 보관 기간보다 오래되었거나 잘못된
+    값이므로 목록을 다시 불러와야 한다.
+    """
+    sequences = dict((await db.execute(select(JobSequence.name, JobSequence.value))).all())
+    current = sequences.get(SEQUENCE_JOBS, 0)
+    pruned = sequences.get(SEQUENCE_PRUNED, 0)
+    
+    since_seq = int(since) if since and since.isdigit() else None
+    if since_seq is None or since_seq < pruned or since_seq > current:
+        return JobChangesResponse(token=str(current), jobs=[], deleted=[], has_more=False, reset=since is not None)
+    
+    # 위에서 읽은 순번까지만 (그 뒤 변경은 다음 요청에서 받음)
+    window = (since_seq, current)
+    jobs = (await db.execute(
+        select(Job)
+        .where(Job.change_seq > window[0], Job.change_seq <= window[1])
+        .order_by(Job.change_seq)
+        .limit(limit + 1)
+    )).scalars().all()
+    tombstones = (await db.execute(
+        select(JobTombstone)
+        .where(JobTombstone.change_seq > window[0], JobTombstone.change_seq <= window[1])
+        .order_by(JobTombstone.change_seq)
+        .limit(limit + 1)
+    )).scalars().all()
+    
+    changes = sorted(
+        [(job.change_seq, job) for job in jobs] + [(tombstone.change_seq, tombstone) for tombstone in tombstones],
+        key=lambda item: item[0],
+    )
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    
+    return JobChangesResponse(
+        token=str(changes[-1][0] if has_more else current),
+        jobs=[JobResponse.model_validate(item) for _, item in changes if isinstance(item, Job)],
+        deleted=[item.job_id for _, item in changes if isinstance(item, JobTombstone)],
+        has_more=has_more,
+    )
+
+
+# [advice from AI] 작업 이벤트 스트림 (SSE) - 목록/통계 폴링 대신 변경 사항만 받음
+@router.get("/events")
+async def job_events(
+    request: Request,
+    job_id: Optional[List[str]] = Query(None, description="받을 작업 ID (여러 개 가능, 없으면 전체)"),
+    batch_id: Optional[str] = Query(None, description="받을 배치 ID (해당 배치의 작업 이벤트만)"),
+    last_event_id: Optional[str] = Query(None, description="이어 받을 마지막 이벤트 ID (Last-Event-ID 헤더와 같음)"),
+):
+    """
+    작업 생성/상태·진행률 변경/삭제 이벤트 스트림 (text/event-stream)
+    
+    이벤트 종류:
+    - ready: 연결 직후 현재 이벤트 ID
+    - created / updated / deleted: 작업 변경 (data는 작업 필드 + status_changed)
+    - reset: 놓친 이벤트를 이어 줄 수 없음 (목록/통계를 다시 불러와야 함)
+    
+    재연결 시 브라우저가 보내는 Last-Event-ID 다음 이벤트부터 다시 보낸다.
+    DB를 조회하지 않고 커밋된 변경을 프로세스 내 버퍼에서 바로 보낸다.
+    """
+    settings = get_settings()
+    bus = get_event_bus()
+    wanted_ids = set(job_id) if job_id else None
+    resume_id = request.headers.get("last-event-id") or last_event_id
+    
+    def wanted(job_event) -> bool:
+        if batch_id and job_event.payload.get("batch_id") != batch_id:
+            return False
+        return wanted_ids is None or job_event.job_id in wanted_ids
+    
+    def message(job_event) -> str:
+        return format_sse(bus.event_id(job_event.seq), job_event.kind, job_event.payload)
+    
+    def reset() -> str:
+        return format_sse(bus.event_id(bus.last_seq), "reset", {})
+    
+    async def stream():
+        subscriber = bus.subscribe()
+        try:
+            yield f"retry: {settings.job_events_retry_ms}\n\n"
+            
+            after = bus.parse_event_id(resume_id)
+            replay = bus.replay(after) if after is not None else None
+            if replay is None:
+                # 처음 연결했거나 버퍼에서 밀려난 ID - 현재 위치부터
+                last_sent = bus.last_seq
+                yield reset() if resume_id else format_sse(bus.event_id(last_sent), "ready", {})
+            else:
+                last_sent = after
+                for job_event in replay:
+                    last_sent = job_event.seq
+                    if wanted(job_event):
+                        yield message(job_event)
+            
+            while True:
+                try:
+                    await asyncio.wait_for(subscriber.wakeup.wait(), timeout=settings.job_events_heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keepalive\n\n"
+                    continue
+                subscriber.wakeup.clear()
+                
+                if subscriber.overflowed:
+                    # 너무 느린 구독자 - 밀린 이벤트 대신 다시 불러오기 요청
+                    subscriber.overflowed = False
+                    subscriber.events.clear()
+                    last_sent = bus.last_seq
+                    yield reset()
+                    continue
+                
+                while subscriber.events:
+                    job_event = subscriber.events.popleft()
+                    if job_event.seq <= last_sent:
+                        continue
+                    last_sent = job_event.seq
+                    if wanted(job_event):
+                        yield message(job_event)
+        finally:
+            bus.unsubscribe(subscriber)
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# [advice from AI] 일괄 삭제 API (/{job_id} 경로보다 먼저 등록해야 "batch"가 작업 ID로 잡히지 않음)
+@router.post("/batch/delete")
+async def batch_delete(
+    job_ids: List[str],
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    여러 작업 일괄 삭제
+    
+    ID마다 조회하지 않고 IN 조건 DELETE ... RETURNING으로 지운 뒤,
+    커밋 후 파일을 파일 삭제 스레드 풀에서 병렬로 삭제한다.
+    """
+    rows = await delete_jobs_by_id(db, job_ids)
+    promoted = await promote_cache_followers(db, [row.id for row in rows])
+    await db.commit()
+    
+    # 처리 중이던 작업은 TTS를 더 쓰지 않도록 중단, 결과를 기다리던 작업은 새 원본으로 처리
+    get_scheduler().cancel_many([row.id for row in rows])
+    get_scheduler().submit_many(promoted)
+    publish_bulk(rows, "deleted")
+    await remove_deleted_files(rows)
+    
+    return {
+        "message": f"{len(rows)}개 작업이 삭제되었습니다.",
+        "deleted_count": len(rows),
+        "errors": None,
+    }
+
+
+# [advice from AI] 일괄 재시도 API
+@router.post("/batch/retry")
+async def batch_retry(
+    job_ids: List[str],
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    여러 실패한 작업 일괄 재시도
+    
+    IN 조건 UPDATE 한 번으로 실패 작업만 대기 상태로 되돌리고 스케줄러 대기열에 추가한다.
+    (실패 상태가 아니거나 없는 ID는 건너뜀, 되돌린 수만큼 대기열 한도를 넘으면 503 - UPDATE는 롤백)
+    """
+    rows = await reset_failed_jobs_by_id(db, job_ids)
+    check_queue_capacity(len(rows))
+    await db.commit()
+    
+    publish_bulk(rows, "updated", status=JobStatus.PENDING, progress=0, error_message=None)
+    get_scheduler().submit_many(rows)
+    
+    return {
+        "message": f"{len(rows)}개 작업을 재시도합니다.",
+        "retried_count": len(rows),
+        "errors": None,
+    }
+
+
+# [advice from AI] 일괄 취소 API
+@router.post("/batch/cancel")
+async def batch_cancel(
+    job_ids: List[str],
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    여러 작업 일괄 취소
+    
+    IN 조건 UPDATE 한 번으로 끝나지 않은 작업만 취소 상태로 바꾼 뒤,
+    대기 중인 작업은 대기열에서 빼고 실행 중인 작업에는 취소 신호를 보낸다.
+    (실행 중이던 작업은 멈춘 뒤 사용한 TTS 글자 수를 기록)
+    """
+    rows = await cancel_jobs_by_id(db, job_ids)
+    promoted = await promote_cache_followers(db, [row.id for row in rows])
+    await db.commit()
+    
+    get_scheduler().cancel_many([row.id for row in rows])
+    get_scheduler().submit_many(promoted)
+    publish_bulk(rows, "updated", status=JobStatus.CANCELLED)
+    
+    return {
+        "message": f"{len(rows)}개 작업을 취소했습니다.",
+        "cancelled_count": len(rows),
     }
 
 
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job(
     job_id: str,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     특정 작업 상세 조회
+    
+    [advice from AI] ETag는 작업의 변경 순번 - 바뀌지 않았으면 변경 순번만 읽고 304로 응답
     """
+    change_seq = (await db.execute(select(Job.change_seq).where(Job.id == job_id))).first()
+    if change_seq is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    
+    etag = make_etag("job", job_id, change_seq[0])
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if matches_if_none_match(request, etag):
+        return Response(status_code=304, headers=headers)
+    
     result = await db.execute(select(Job).where(Job.id == job_id))
     job = result.scalar_one_or_none()
     
     if not job:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
     
+    response.headers.update(headers)
     return JobResponse.model_validate(job)
 
 
@@ -163,38 +519,19 @@ async def delete_job(
     """
     작업 삭제 (파일 포함)
     """
-    from backend.config import get_settings
-    import os
-    
-    settings = get_settings()
-    
     result = await db.execute(select(Job).where(Job.id == job_id))
     job = result.scalar_one_or_none()
     
     if not job:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
     
-    # 업로드 파일 삭제
-    if job.filename:
-        upload_path = os.path.join(settings.upload_dir, job.filename)
-        if os.path.exists(upload_path):
-            os.remove(upload_path)
-    
-    # 출력 WAV 파일 삭제
-    if job.output_filename:
-        output_path = os.path.join(settings.output_dir, job.output_filename)
-        if os.path.exists(output_path):
-            os.remove(output_path)
-    
-    # JSON 파일 삭제
-    if job.json_filename:
-        json_path = os.path.join(settings.output_dir, job.json_filename)
-        if os.path.exists(json_path):
-            os.remove(json_path)
-    
-    # DB에서 삭제
+    # DB에서 삭제 후 업로드/출력/세그먼트 파일 삭제 (스레드 풀)
     await db.delete(job)
+    promoted = await promote_cache_followers(db, [job_id])
     await db.commit()
+    get_scheduler().cancel(job_id)
+    get_scheduler().submit_many(promoted)
+    await remove_deleted_files([job])
     
     return {"message": "작업이 삭제되었습니다.", "job_id": job_id}
 
@@ -205,10 +542,8 @@ async def retry_job(
     db: AsyncSession = Depends(get_db),
 ):
     """
-    실패한 작업 재시도
+    실패한 작업 재시도 (스케줄러 대기열에 추가)
     """
-    from backend.core.processor import process_script
-    
     result = await db.execute(select(Job).where(Job.id == job_id))
     job = result.scalar_one_or_none()
     
@@ -226,110 +561,158 @@ async def retry_job(
     job.status = JobStatus.PENDING
     job.progress = 0
     job.error_message = None
+    job.cache_source_id = None
     job.updated_at = datetime.utcnow()
     await db.commit()
     await db.refresh(job)
     
-    # 백그라운드에서 재처리
-    import asyncio
-    asyncio.create_task(process_script(job_id))
+    # 스케줄러 대기열에서 재처리 (동시 처리 수 제한 적용)
+    get_scheduler().submit(job.id, job.batch_id, job.priority, job.version)
     
     return JobResponse.model_validate(job)
 
 
-# [advice from AI] 일괄 삭제 API
-@router.post("/batch/delete")
-async def batch_delete(
-    job_ids: List[str],
+# [advice from AI] 작업 취소 API
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+async def cancel_job(
+    job_id: str,
     db: AsyncSession = Depends(get_db),
 ):
     """
-    여러 작업 일괄 삭제
+    대기 중이거나 처리 중인 작업 취소
+    
+    대기 중이면 대기열에서 빼고, 처리 중이면 진행 중인 TTS 요청을 끊고 남은 발화를 건너뛴다.
+    취소 전까지 TTS로 보낸 글자 수는 tts_characters에 남는다.
     """
-    from backend.config import get_settings
-    import os
+    result = await db.execute(select(Job).where(Job.id == job_id))
+    job = result.scalar_one_or_none()
     
-    settings = get_settings()
-    deleted_count = 0
-    errors = []
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
     
-    for job_id in job_ids:
-        try:
-            result = await db.execute(select(Job).where(Job.id == job_id))
-            job = result.scalar_one_or_none()
-            
-            if not job:
-                continue
-            
-            # 파일 삭제
-            if job.filename:
-                upload_path = os.path.join(settings.upload_dir, job.filename)
-                if os.path.exists(upload_path):
-                    os.remove(upload_path)
-            
-            if job.output_filename:
-                output_path = os.path.join(settings.output_dir, job.output_filename)
-                if os.path.exists(output_path):
-                    os.remove(output_path)
-            
-            if job.json_filename:
-                json_path = os.path.join(settings.output_dir, job.json_filename)
-                if os.path.exists(json_path):
-                    os.remove(json_path)
-            
-            await db.delete(job)
-            deleted_count += 1
-            
-        except Exception as e:
-            errors.append({"job_id": job_id, "error": str(e)})
+    if job.status not in ACTIVE_STATUSES:
+        raise HTTPException(
+            status_code=400,
+            detail="대기 중이거나 처리 중인 작업만 취소할 수 있습니다."
+        )
     
+    job.status = JobStatus.CANCELLED
+    job.updated_at = datetime.utcnow()
+    # 이 작업의 결과를 기다리던 작업은 새 원본으로 (대기 중 취소되면 process_script가 정리하지 않음)
+    promoted = await promote_cache_followers(db, [job_id])
     await db.commit()
     
-    return {
-        "message": f"{deleted_count}개 작업이 삭제되었습니다.",
-        "deleted_count": deleted_count,
-        "errors": errors if errors else None,
-    }
+    get_scheduler().cancel(job_id)
+    get_scheduler().submit_many(promoted)
+    
+    await db.refresh(job)
+    return JobResponse.model_validate(job)
 
 
-# [advice from AI] 일괄 재시도 API
-@router.post("/batch/retry")
-async def batch_retry(
-    job_ids: List[str],
+# [advice from AI] 대화록 수정 후 증분 재합성 API
+@router.put("/{job_id}/script", response_model=ScriptUpdateResponse)
+async def update_script(
+    job_id: str,
+    request: ScriptUpdateRequest,
     db: AsyncSession = Depends(get_db),
 ):
     """
-    여러 실패한 작업 일괄 재시도
+    대화록 수정 및 재합성
+    
+    이전 대화록과 비교하여 추가/변경된 발화만 TTS를 다시 생성하고,
+    나머지 발화는 기존 세그먼트를 재사용하여 새 버전으로 다시 합성한다.
+    (파일 읽기/쓰기와 세그먼트 복사는 스레드에서, 대기열 한도를 넘으면 503)
     """
-    from backend.core.processor import process_script
-    import asyncio
+    from backend.core.parser import ParsedScript, parse_script, parse_and_validate, diff_dialogues
+    from backend.core.cache import script_digest, default_seed, compute_cache_key, link_or_copy
+    from backend.core.storage import job_segment_dir
+    import os
+    import json
     
-    retried_count = 0
-    errors = []
+    settings = get_settings()
     
-    for job_id in job_ids:
-        try:
-            result = await db.execute(select(Job).where(Job.id == job_id))
-            job = result.scalar_one_or_none()
-            
-            if not job or job.status != JobStatus.FAILED:
-                continue
-            
-            job.status = JobStatus.PENDING
-            job.progress = 0
-            job.error_message = None
-            job.updated_at = datetime.utcnow()
+    result = await db.execute(select(Job).where(Job.id == job_id).options(undefer(Job.parsed_script)))
+    job = result.scalar_one_or_none()
+    
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    
+    if job.status not in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
+        raise HTTPException(status_code=409, detail="처리 중인 작업은 수정할 수 없습니다.")
+    
+    # 파일을 덮어쓰기 전에 대기열 한도 확인 (초과 시 503, 아무것도 바꾸지 않음)
+    check_queue_capacity()
+    
+    parsed, errors = parse_and_validate(request.content)
+    if errors:
+        raise HTTPException(status_code=400, detail=f"파싱 실패: {', '.join(errors)}")
+    
+    # 이전 대화록과 비교 (저장된 파싱 결과 우선)
+    upload_path = os.path.join(settings.upload_dir, job.filename)
+    if job.parsed_script:
+        old_parsed = ParsedScript.from_dict(json.loads(job.parsed_script))
+    else:
+        def read_old():
+            if not os.path.exists(upload_path):
+                return ""
+            with open(upload_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        
+        old_parsed = parse_script(await asyncio.to_thread(read_old))
+    
+    diff = diff_dialogues(old_parsed.dialogues, parsed.dialogues)
+    
+    # 캐시로 완료된 작업은 원본 작업의 세그먼트/음성 할당을 가져와 재사용
+    if job.cache_source_id:
+        source = await db.get(Job, job.cache_source_id)
+        if source:
+            source_dir = job_segment_dir(source.id)
+            target_dir = job_segment_dir(job.id)
             
-            asyncio.create_task(process_script(job_id))
-            retried_count += 1
+            def copy_segments():
+                if not os.path.isdir(source_dir):
+                    return
+                os.makedirs(target_dir, exist_ok=True)
+                for name in os.listdir(source_dir):
+                    link_or_copy(os.path.join(source_dir, name), os.path.join(target_dir, name))
             
-        except Exception as e:
-            errors.append({"job_id": job_id, "error": str(e)})
-    
+            await asyncio.to_thread(copy_segments)
+            voices = source.load_settings().get("voice_assignments")
+            if voices:
+                job.update_settings(voice_assignments=voices)
+    
+    # 수정된 대화록 저장 후 새 버전으로 재처리
+    content = request.content.encode('utf-8')
+    
+    def write_script():
+        with open(upload_path, 'wb') as f:
+            f.write(content)
+    
+    await asyncio.to_thread(write_script)
+    
+    digest = script_digest(content)
+    if job.seed is None:
+        job.update_settings(seed=default_seed(digest))
+    job.content_hash = compute_cache_key(digest, job.seed)
+    job.parsed_script = json.dumps(parsed.to_dict(), ensure_ascii=False)
+    job.version = (job.version or 1) + 1
+    job.status = JobStatus.PENDING
+    job.progress = 0
+    job.error_message = None
+    job.cache_hit = False
+    job.cache_source_id = None
+    job.completed_at = None
+    job.updated_at = datetime.utcnow()
     await db.commit()
+    await db.refresh(job)
     
-    return {
-        "message": f"{retried_count}개 작업을 재시도합니다.",
-        "retried_count": retried_count,
-        "errors": errors if errors else None,
-    }
+    # [advice from AI] 스케줄러 대기열에서 재처리 (동시 처리 수 제한, 취소 가능)
+    get_scheduler().submit(job.id, job.batch_id, job.priority, job.version)
+    
+    return ScriptUpdateResponse(
+        job=JobResponse.model_validate(job),
+        unchanged=len(diff.reused),
+        changed=len(diff.changed),
+        added=len(diff.added),
+        removed=len(diff.removed),
+    )
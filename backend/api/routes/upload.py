@@ -1,29 +1,218 @@
 # [advice from AI] 파일 업로드 API 라우터
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, BackgroundTasks
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import AsyncIterator, List, Dict, Optional, Tuple
+from datetime import datetime
 import uuid
 import os
+import hashlib
+import time
+import json
+from itertools import islice
+import tarfile
+import zipfile
+import asyncio
 import aiofiles
 
 from backend.config import get_settings
 from backend.database import get_db
-from backend.models.job import Job, JobStatus, JobResponse
-from backend.core.processor import process_script
+from backend.models.job import Job, JobStatus, JobPriority, JobResponse
+from backend.models.batch import Batch
+from backend.core.archive import is_archive, iter_archive_scripts, extract_scripts, ArchiveLimitError
+from backend.core.estimator import estimate_files, summarize_estimates
+from backend.core.validator import validate_files
+from backend.core.workers import iter_stream_in_processes
+from backend.core.scheduler import get_scheduler
+from backend.api.queue import check_queue_capacity
+from backend.core.events import publish_jobs
+from backend.core.storage import remove_files
+from backend.core.cache import (
+    default_seed,
+    compute_cache_key,
+    find_cached_job,
+    find_inflight_job,
+    find_cached_jobs,
+    find_inflight_jobs,
+    apply_cached_result,
+)
 
 router = APIRouter()
 
 
+# [advice from AI] 시드가 적용된 작업 생성 (같은 대화록 + 시드 -> 같은 결과)
+def _new_job(
+    job_id: str,
+    safe_filename: str,
+    original_filename: str,
+    digest: str,
+    seed: Optional[int] = None,
+    priority: JobPriority = JobPriority.NORMAL,
+) -> Job:
+    """업로드된 대화록으로 작업 객체 생성 (캐시 키/시드/우선순위 포함, digest는 원문 SHA-256)"""
+    if seed is None:
+        seed = default_seed(digest)
+    
+    job = Job(
+        id=job_id,
+        filename=safe_filename,
+        original_filename=original_filename,
+        status=JobStatus.PENDING,
+        progress=0,
+        content_hash=compute_cache_key(digest, seed),
+        priority=priority,
+    )
+    job.update_settings(seed=seed)
+    return job
+
+
+# [advice from AI] 업로드 파일을 고정 크기 청크로 디스크에 저장 (전체를 메모리에 올리지 않음)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+async def _save_upload(file: UploadFile, file_path: str) -> str:
+    """
+    업로드 파일을 청크 단위로 저장하면서 SHA-256 계산
+
+    최대 크기(max_upload_size_mb)를 넘으면 저장 중이던 파일을 지우고 413 에러.
+
+    Returns:
+        원문 SHA-256 (script_digest와 같은 값)
+    """
+    settings = get_settings()
+    max_bytes = settings.max_upload_size_mb * 1024 * 1024
+    digest = hashlib.sha256()
+    size = 0
+    
+    try:
+        async with aiofiles.open(file_path, 'wb') as f:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if max_bytes and size > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"파일이 너무 큽니다. (최대 {settings.max_upload_size_mb}MB)",
+                    )
+                digest.update(chunk)
+                await f.write(chunk)
+    except BaseException:
+        remove_files([file_path])
+        raise
+    
+    return digest.hexdigest()
+
+
+async def _schedule_jobs(jobs: List[Job]):
+    """작업들을 스케줄러 대기열에 추가 (이벤트 루프에서 실행되도록 async, 배치/우선순위별 공정 분배)"""
+    get_scheduler().submit_many(jobs)
+
+
+# [advice from AI] 여러 작업을 함께 등록할 때 배치 행을 먼저 저장 (작업 INSERT 트리거가 집계를 갱신)
+async def _create_batch(db: AsyncSession, name: Optional[str]) -> Batch:
+    """배치 생성 후 flush (같은 트랜잭션의 작업 INSERT보다 먼저 저장되어야 집계가 맞음)"""
+    batch = Batch(id=str(uuid.uuid4()), name=name[:255] if name else None)
+    db.add(batch)
+    await db.flush()
+    return batch
+
+
+# [advice from AI] 업로드 파일/ZIP을 대화록 청크로 펼치기 (견적/검증용)
+SOURCE_CHUNK_SIZE = 64
+
+
+async def _iter_script_chunks(
+    files: List[UploadFile],
+    chunk_size: int = SOURCE_CHUNK_SIZE,
+) -> AsyncIterator[List[Tuple[str, bytes]]]:
+    """
+    업로드된 파일들을 (파일명, 내용) 청크로 차례대로 반환 (ZIP/TAR는 내부 파일로 펼침)
+
+    압축은 청크 하나 분량씩 스레드에서 읽으므로 압축 안의 대화록을 한꺼번에 메모리에 올리지 않는다.
+    압축 해제 한도를 넘으면 ArchiveLimitError.
+    """
+    chunk: List[Tuple[str, bytes]] = []
+    for file in files:
+        name = file.filename or "script"
+        if not is_archive(name):
+            chunk.append((name, await file.read()))
+        else:
+            members = iter_archive_scripts(file.file, name)
+            while True:
+                entries = await asyncio.to_thread(lambda: list(islice(members, chunk_size - len(chunk))))
+                if not entries:
+                    break
+                chunk.extend(entries)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            continue
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# [advice from AI] 캐시 확인 후 작업 등록 (중복 업로드 재사용)
+async def _register_job(
+    db: AsyncSession,
+    job: Job,
+    leaders: Dict[str, Job],
+) -> bool:
+    """
+    작업을 세션에 추가하고 처리 필요 여부 반환
+
+    - 같은 캐시 키의 완료 작업이 있으면 결과를 즉시 재사용 (캐시 히트)
+    - 같은 키로 처리 중인 작업(같은 배치 포함)이 있으면 그 결과를 기다림
+    - 둘 다 없으면 직접 처리해야 하는 원본 작업
+
+    Args:
+        db: DB 세션
+        job: 새 작업 (content_hash 설정됨)
+        leaders: 이번 요청에서 먼저 등록된 원본 작업 (캐시 키 -> 작업)
+
+    Returns:
+        백그라운드 처리가 필요하면 True
+    """
+    source = await find_cached_job(db, job.content_hash)
+    leader = leaders.get(job.content_hash) or await find_inflight_job(db, job.content_hash)
+    db.add(job)
+    
+    if source:
+        try:
+            apply_cached_result(job, source)
+            return False
+        except Exception as e:
+            print(f"⚠️ 캐시 결과 연결 실패 ({job.id}): {e}")
+    
+    if leader:
+        job.cache_source_id = leader.id
+        return False
+    
+    leaders[job.content_hash] = job
+    return True
+
+
 @router.post("/", response_model=JobResponse)
 async def upload_file(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
+    seed: Optional[int] = Form(None, description="재현용 시드 (없으면 대화록 내용에서 유도)"),
+    priority: JobPriority = Form(JobPriority.NORMAL, description="처리 우선순위 (low/normal/high)"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     단일 대화록 파일 업로드 및 작업 생성
+    
+    기본 우선순위는 normal이다. 사용자가 결과를 기다리는 작업은 priority=high를 명시하면
+    먼저 등록된 대량 배치가 대기 중이어도 다음 빈 자리에서 시작된다.
     """
     settings = get_settings()
+    check_queue_capacity()
     
     # 파일 확장자 검증
     if file.filename and not file.filename.endswith(('.txt', '')):
@@ -35,28 +224,23 @@ async def upload_file(
     safe_filename = f"{job_id}_{file.filename or 'script'}"
     file_path = os.path.join(settings.upload_dir, safe_filename)
     
-    # 파일 저장
+    # 파일 저장 (청크 단위, 해시 동시 계산)
     try:
-        async with aiofiles.open(file_path, 'wb') as f:
-            content = await file.read()
-            await f.write(content)
+        digest = await _save_upload(file, file_path)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 저장 실패: {str(e)}")
     
     # 작업 생성
-    job = Job(
-        id=job_id,
-        filename=safe_filename,
-        original_filename=file.filename or "script",
-        status=JobStatus.PENDING,
-        progress=0,
-    )
-    db.add(job)
+    job = _new_job(job_id, safe_filename, file.filename or "script", digest, seed, priority)
+    needs_processing = await _register_job(db, job, {})
     await db.commit()
     await db.refresh(job)
     
-    # 백그라운드에서 처리 시작
-    background_tasks.add_task(process_script, job_id)
+    # 스케줄러 대기열에서 처리 시작
+    if needs_processing:
+        background_tasks.add_task(_schedule_jobs, [job])
     
     return JobResponse.model_validate(job)
 
@@ -65,37 +249,43 @@ async def upload_file(
 async def upload_files_batch(
     background_tasks: BackgroundTasks,
     files: List[UploadFile] = File(...),
+    seed: Optional[int] = Form(None, description="재현용 시드 (없으면 파일별로 대화록 내용에서 유도)"),
+    batch_name: Optional[str] = Form(None, description="배치 이름 (진행 상황 조회용)"),
+    priority: JobPriority = Form(JobPriority.NORMAL, description="처리 우선순위 (low/normal/high)"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     다중 대화록 파일 업로드 (배치)
+    
+    등록된 작업들은 같은 batch_id를 가지며 /api/batches/{batch_id}로 함께 조회/재시도/삭제할 수 있다.
+    저장에 실패한 파일(크기 초과 포함)은 건너뛰고 응답에서 빠진다.
     """
     settings = get_settings()
+    check_queue_capacity(len(files))
     jobs_created = []
+    jobs_to_process = []
+    leaders: Dict[str, Job] = {}
+    batch = await _create_batch(db, batch_name)
     
     for file in files:
         job_id = str(uuid.uuid4())
         safe_filename = f"{job_id}_{file.filename or 'script'}"
         file_path = os.path.join(settings.upload_dir, safe_filename)
         
-        # 파일 저장
+        # 파일 저장 (청크 단위, 해시 동시 계산)
         try:
-            async with aiofiles.open(file_path, 'wb') as f:
-                content = await file.read()
-                await f.write(content)
+            digest = await _save_upload(file, file_path)
         except Exception as e:
-            # 실패한 파일은 건너뛰고 계속 진행
+            # 실패한 파일(크기 초과 포함)은 건너뛰고 계속 진행
+            detail = e.detail if isinstance(e, HTTPException) else str(e)
+            print(f"⚠️ 배치 업로드 파일 건너뜀 ({file.filename}): {detail}")
             continue
         
-        # 작업 생성
-        job = Job(
-            id=job_id,
-            filename=safe_filename,
-            original_filename=file.filename or "script",
-            status=JobStatus.PENDING,
-            progress=0,
-        )
-        db.add(job)
+        # 작업 생성 (같은 배치 안의 중복 파일은 첫 작업 결과를 공유)
+        job = _new_job(job_id, safe_filename, file.filename or "script", digest, seed, priority)
+        job.batch_id = batch.id
+        if await _register_job(db, job, leaders):
+            jobs_to_process.append(job)
         jobs_created.append(job)
     
     await db.commit()
@@ -103,11 +293,248 @@ async def upload_files_batch(
     # 각 작업에 대해 백그라운드 처리 시작
     for job in jobs_created:
         await db.refresh(job)
-        background_tasks.add_task(process_script, job.id)
+    background_tasks.add_task(_schedule_jobs, jobs_to_process)
     
     return [JobResponse.model_validate(job) for job in jobs_created]
 
 
+# [advice from AI] 대량 등록용 INSERT 행 변환 (ORM 객체 단위 flush/refresh 없이 executemany)
+def _job_row(job: Job, now: datetime) -> Dict:
+    """세션에 추가하지 않은 Job 객체를 INSERT 파라미터(dict)로 변환 (컬럼 기본값 반영)"""
+    row = {}
+    for column in Job.__table__.columns:
+        value = getattr(job, column.key)
+        if value is None and column.default is not None and column.default.is_scalar:
+            value = column.default.arg
+        row[column.key] = value
+    row["created_at"] = row["created_at"] or now
+    row["updated_at"] = row["updated_at"] or now
+    return row
+
+
+def _resolve_archive_jobs(jobs: List[Job], cached: Dict[str, Job], inflight: Dict[str, Job]) -> List[Job]:
+    """
+    압축으로 등록할 작업들의 캐시 처리 (스레드에서 실행 - 캐시 결과 연결이 파일 I/O)
+
+    - 완료된 같은 캐시 키 작업이 있으면 결과를 연결 (캐시 히트)
+    - 처리 중인(같은 압축 안 포함) 같은 키 작업이 있으면 그 결과를 기다림
+
+    Returns:
+        직접 처리해야 하는 원본 작업 목록 (inflight에 추가됨)
+    """
+    leaders: List[Job] = []
+    for job in jobs:
+        source = cached.get(job.content_hash)
+        if source:
+            try:
+                apply_cached_result(job, source)
+                continue
+            except Exception as e:
+                print(f"⚠️ 캐시 결과 연결 실패 ({job.id}): {e}")
+        leader = inflight.get(job.content_hash)
+        if leader:
+            job.cache_source_id = leader.id
+            continue
+        inflight[job.content_hash] = job
+        leaders.append(job)
+    return leaders
+
+
+@router.post("/archive")
+async def upload_archive(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(..., description="대화록 압축 파일 (.zip, .tar, .tar.gz, .tgz)"),
+    seed: Optional[int] = Form(None, description="재현용 시드 (없으면 파일별로 대화록 내용에서 유도)"),
+    batch_name: Optional[str] = Form(None, description="배치 이름 (없으면 압축 파일명)"),
+    priority: JobPriority = Form(JobPriority.NORMAL, description="처리 우선순위 (low/normal/high)"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    압축 파일 하나로 대량 대화록 등록
+    
+    압축을 upload_dir에 바로 풀면서 해시를 계산하고, 모든 작업을 한 트랜잭션의
+    일괄 INSERT로 등록한다. 응답은 {"summary": {...}, "jobs": [...]} 이며
+    처리할 작업은 응답 후 스케줄러 대기열에 들어간다.
+    작업들은 한 배치로 묶이며 summary의 batch_id로 진행 상황을 조회한다.
+    
+    풀린 크기/파일 수가 한도(MAX_UPLOAD_SIZE_MB, MAX_ARCHIVE_EXTRACT_MB, MAX_ARCHIVE_MEMBERS)를
+    넘으면 413, 새로 대기할 작업까지 더해 대기열 한도를 넘으면 503이다.
+    """
+    settings = get_settings()
+    started = time.perf_counter()
+    archive_name = file.filename or ""
+    
+    if not is_archive(archive_name):
+        raise HTTPException(status_code=400, detail="압축 파일(.zip, .tar, .tar.gz, .tgz)만 업로드할 수 있습니다.")
+    check_queue_capacity()
+    
+    try:
+        extracted = await asyncio.to_thread(
+            extract_scripts, file.file, archive_name, settings.upload_dir
+        )
+    except ArchiveLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except (zipfile.BadZipFile, tarfile.TarError) as e:
+        raise HTTPException(status_code=400, detail=f"압축 파일을 읽을 수 없습니다: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"압축 해제 실패: {str(e)}")
+    stored_paths = [os.path.join(settings.upload_dir, item.stored_filename) for item in extracted]
+    
+    if not extracted:
+        raise HTTPException(status_code=400, detail="압축 파일 안에 대화록이 없습니다.")
+    
+    # 작업 객체 생성 (세션에는 추가하지 않음)
+    jobs = [
+        _new_job(item.job_id, item.stored_filename, item.original_filename, item.sha256, seed, priority)
+        for item in extracted
+    ]
+    
+    # 캐시 키 일괄 조회 (작업마다 조회하지 않음)
+    content_hashes = [job.content_hash for job in jobs]
+    cached = await find_cached_jobs(db, content_hashes)
+    inflight = await find_inflight_jobs(db, content_hashes)
+    
+    # 새로 대기열에 들어갈 작업 수(캐시/처리 중 작업이 없는 캐시 키 수)까지 더해 대기열 한도 확인
+    new_keys = {key for key in content_hashes if key not in cached and key not in inflight}
+    try:
+        check_queue_capacity(len(new_keys))
+    except HTTPException:
+        remove_files(stored_paths)
+        raise
+    
+    # 캐시 결과 연결은 파일 링크/복사라 스레드에서
+    leaders = await asyncio.to_thread(_resolve_archive_jobs, jobs, cached, inflight)
+    
+    now = datetime.utcnow()
+    try:
+        batch = await _create_batch(db, batch_name or archive_name)
+        for job in jobs:
+            job.batch_id = batch.id
+        await db.execute(insert(Job), [_job_row(job, now) for job in jobs])
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        remove_files(stored_paths)
+        raise HTTPException(status_code=500, detail=f"작업 등록 실패: {str(e)}")
+    
+    # [advice from AI] 일괄 INSERT는 ORM 세션 훅을 거치지 않으므로 이벤트를 직접 발행
+    publish_jobs(jobs)
+    
+    # 응답을 다 보낸 뒤 대기열에 추가 (처리 시작이 응답 전송을 늦추지 않도록)
+    background_tasks.add_task(_schedule_jobs, leaders)
+    
+    cache_hits = sum(1 for job in jobs if job.cache_hit)
+    summary = {
+        "batch_id": batch.id,
+        "files": len(jobs),
+        "queued": len(leaders),
+        "cache_hits": cache_hits,
+        "waiting_for_duplicate": len(jobs) - len(leaders) - cache_hits,
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+    }
+    
+    return {
+        "summary": summary,
+        "jobs": [
+            {
+                "id": job.id,
+                "original_filename": job.original_filename,
+                "status": job.status.value,
+                "cache_hit": bool(job.cache_hit),
+                "cache_source_id": job.cache_source_id,
+            }
+            for job in jobs
+        ],
+    }
+
+
+# [advice from AI] 배치 드라이런 견적 API (TTS 사용 없음)
+@router.post("/estimate")
+async def estimate_batch(
+    files: List[UploadFile] = File(...),
+):
+    """
+    다중 대화록(또는 ZIP) 견적 조회
+    
+    파일별/전체 예상 오디오 길이(초), TTS 글자 수, 요청 수, 예상 비용을 계산한다.
+    파싱은 프로세스 풀에서 병렬로 수행하며 TTS API는 호출하지 않는다.
+    """
+    started = time.perf_counter()
+    
+    results = []
+    try:
+        async for chunk_results in iter_stream_in_processes(estimate_files, _iter_script_chunks(files)):
+            results.extend(chunk_results)
+    except ArchiveLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"파일 읽기 실패: {str(e)}")
+    
+    return {
+        "files": results,
+        "total": summarize_estimates(results),
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+# [advice from AI] 대량 검증 API (파일별 결과를 NDJSON으로 스트리밍)
+@router.post("/validate")
+async def validate_batch(
+    files: List[UploadFile] = File(...),
+):
+    """
+    다중 대화록(또는 ZIP) 일괄 검증
+    
+    프로세스 풀에서 병렬로 검증하며, 압축은 읽는 대로 청크 단위로 검증해 한 줄씩 NDJSON으로 반환한다.
+    각 줄: index, filename, valid, dialogue_count, speakers, action_count,
+    delay_count, has_summary, duration_seconds, errors
+    마지막 줄: {"summary": {files, valid_files, invalid_files, elapsed_seconds}}
+    (응답 도중 압축 읽기가 실패하면 summary 앞에 {"error": ...} 줄)
+    """
+    started = time.perf_counter()
+    chunks = _iter_script_chunks(files)
+    
+    # 첫 청크는 응답 전에 읽어 잘못된 압축은 상태 코드로 알림
+    try:
+        first = await anext(chunks, None)
+    except ArchiveLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"파일 읽기 실패: {str(e)}")
+    
+    counts = {"files": 0}
+    
+    async def indexed_chunks():
+        chunk = first
+        while chunk:
+            index = counts["files"]
+            counts["files"] += len(chunk)
+            yield [(index + offset, name, data) for offset, (name, data) in enumerate(chunk)]
+            chunk = await anext(chunks, None)
+    
+    async def stream_results():
+        valid_files = 0
+        try:
+            async for chunk in iter_stream_in_processes(validate_files, indexed_chunks()):
+                lines = []
+                for result in chunk:
+                    valid_files += result["valid"]
+                    lines.append(json.dumps(result, ensure_ascii=False) + "\n")
+                yield "".join(lines)
+        except Exception as e:
+            yield json.dumps({"error": f"파일 읽기 실패: {str(e)}"}, ensure_ascii=False) + "\n"
+        
+        summary = {
+            "files": counts["files"],
+            "valid_files": valid_files,
+            "invalid_files": counts["files"] - valid_files,
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+        }
+        yield json.dumps({"summary": summary}, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
 @router.post("/preview")
 async def preview_script(
     file: UploadFile = File(...),
@@ -0,0 +1,42 @@
+# [advice from AI] 발화 검색 API 라우터 (전체 작업의 발화를 FTS5 색인으로 검색)
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+import time
+
+from backend.database import get_read_db
+from backend.models.utterance import UtteranceHit, UtteranceSearchResponse
+from backend.core.utterance_index import search_utterances
+
+router = APIRouter()
+
+
+@router.get("/search", response_model=UtteranceSearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (공백으로 나눈 단어를 모두 포함)"),
+    role: Optional[str] = Query(None, pattern="^(agent|customer)$", description="화자 (agent/customer)"),
+    job_id: Optional[str] = Query(None, description="특정 작업으로 제한"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    전체 발화 검색
+    
+    결과마다 작업/발화 번호, 시간 구간, 샘플 오프셋과 발화 클립 URL을 돌려준다.
+    snippet은 검색어를 <mark>로 감싼 원문 일부 (HTML 이스케이프하지 않음).
+    """
+    started = time.perf_counter()
+    rows, has_more = await search_utterances(db, q, role=role, job_id=job_id, limit=limit, offset=offset)
+    
+    return UtteranceSearchResponse(
+        query=q,
+        results=[
+            UtteranceHit(**row, clip_url=f"/api/files/{row['job_id']}/utterances/{row['turn_idx']}")
+            for row in rows
+        ],
+        limit=limit,
+        offset=offset,
+        has_more=has_more,
+        elapsed_ms=round((time.perf_counter() - started) * 1000, 2),
+    )
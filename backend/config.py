@@ -44,6 +44,9 @@ class Settings(BaseSettings):
     action_duration: float = Field(default=2.0, description="[ACTION] 기본 소요 시간 (초)")
     silence_padding: float = Field(default=0.3, description="문장 끝 여백 (초)")
     
+    # [advice from AI] TTS 비용 견적 설정
+    tts_cost_per_1k_chars: float = Field(default=0.30, description="TTS 비용 (1,000자당, USD)")
+    
     # TTS 음성 설정
     voice_agent: Optional[str] = Field(default=None, description="상담사 Voice ID")
     voice_customer: Optional[str] = Field(default=None, description="고객 Voice ID")
@@ -51,14 +54,51 @@ class Settings(BaseSettings):
     # 파일 관리 설정
     file_retention_days: int = Field(default=30, description="파일 보관 기간 (일)")
     max_concurrent_jobs: int = Field(default=3, description="동시 작업 수 제한")
+    parse_workers: int = Field(default=0, description="대화록 파싱/검증 프로세스 수 (0=CPU 수)")
+    file_delete_workers: int = Field(default=8, description="작업 파일 삭제 스레드 수 (일괄 삭제)")
+    result_cache_enabled: bool = Field(default=True, description="동일 대화록 결과 재사용 (캐시)")
+    
+    # [advice from AI] 업로드 제한 설정 (메모리 보호 및 과부하 시 재시도 안내)
+    max_upload_size_mb: int = Field(default=50, description="업로드 파일 최대 크기 (MB, 0=제한 없음)")
+    max_queue_depth: int = Field(default=1000, description="처리 대기열 최대 길이 (초과 시 503, 0=제한 없음)")
+    max_archive_members: int = Field(default=10000, description="압축 업로드 안의 최대 파일 수 (0=제한 없음)")
+    max_archive_extract_mb: int = Field(default=2048, description="압축 업로드를 푼 전체 최대 크기 (MB, 0=제한 없음)")
+    queue_retry_after: int = Field(default=30, description="대기열 초과 시 Retry-After (초)")
+    
+    # [advice from AI] 미리듣기용 저용량 오디오 설정 (원본 WAV는 그대로 두고 별도 캐시)
+    preview_format: str = Field(default="opus", description="미리듣기 기본 형식 (opus 또는 mp3)")
+    preview_opus_bitrate: str = Field(default="32k", description="미리듣기 Opus 비트레이트")
+    preview_mp3_bitrate: str = Field(default="64k", description="미리듣기 MP3 비트레이트")
+    preview_cache_max_mb: int = Field(default=2048, description="미리듣기 캐시 최대 크기 (MB, 초과 시 오래 안 쓴 것부터 삭제, 0=제한 없음)")
+    preview_eager: bool = Field(default=False, description="합성 단계에서 미리듣기 파일을 미리 생성")
+    
+    # [advice from AI] 데이터셋 내보내기 설정 (tar 샤드)
+    export_shard_size_mb: int = Field(default=1024, description="내보내기 샤드 최대 크기 (MB)")
+    export_workers: int = Field(default=4, description="동시에 작성하는 샤드 수")
     
     # 경로 설정
     base_dir: str = Field(default="/app", description="기본 경로")
     upload_dir: str = Field(default="/app/storage/uploads", description="업로드 경로")
     output_dir: str = Field(default="/app/storage/outputs", description="출력 경로")
     temp_dir: str = Field(default="/app/storage/temp", description="임시 경로")
+    segment_dir: str = Field(default="/app/storage/segments", description="발화별 TTS 세그먼트 경로 (재합성용)")
+    preview_dir: str = Field(default="/app/storage/previews", description="미리듣기 오디오 캐시 경로")
+    export_dir: str = Field(default="/app/storage/exports", description="데이터셋 내보내기 경로")
     db_path: str = Field(default="/app/storage/database.db", description="데이터베이스 경로")
     
+    # [advice from AI] SQLite 성능 설정
+    sqlite_busy_timeout_ms: int = Field(default=10000, description="DB 잠금 대기 시간 (밀리초)")
+    sqlite_mmap_size_mb: int = Field(default=256, description="SQLite 메모리 맵 크기 (MB)")
+    sqlite_cache_size_mb: int = Field(default=64, description="SQLite 페이지 캐시 크기 (MB, 연결당)")
+    
+    # [advice from AI] 작업 목록 설정
+    job_count_cache_seconds: int = Field(default=10, description="검색/날짜 필터 목록의 총 개수 캐시 시간 (초, 0이면 끔)")
+    
+    # [advice from AI] 작업 이벤트 스트림(SSE) 설정
+    job_events_buffer_size: int = Field(default=2000, description="재연결 시 이어 보낼 최근 이벤트 수")
+    job_events_heartbeat_seconds: int = Field(default=15, description="변경이 없을 때 연결 유지용 주석을 보내는 간격 (초)")
+    job_events_retry_ms: int = Field(default=3000, description="연결이 끊겼을 때 브라우저 재연결 대기 시간 (밀리초)")
+    
     # 오디오 설정
     audio_sample_rate: int = Field(default=44100, description="오디오 샘플레이트")
     audio_channels: int = Field(default=1, description="오디오 채널 수 (1=모노)")
@@ -85,6 +125,9 @@ def get_local_settings() -> Settings:
         upload_dir=os.path.join(base_dir, "storage", "uploads"),
         output_dir=os.path.join(base_dir, "storage", "outputs"),
         temp_dir=os.path.join(base_dir, "storage", "temp"),
+        segment_dir=os.path.join(base_dir, "storage", "segments"),
+        preview_dir=os.path.join(base_dir, "storage", "previews"),
+        export_dir=os.path.join(base_dir, "storage", "exports"),
         db_path=os.path.join(base_dir, "storage", "database.db"),
     )
 
@@ -1,11 +1,12 @@
 # [advice from AI] Core 패키지 초기화
-from backend.core.parser import parse_script, ParsedScript, Dialogue
+from backend.core.parser import parse_script, parse_and_validate, ParsedScript, Dialogue
 from backend.core.timestamp import generate_timestamps, TimestampedDialogue
 from backend.core.tts_client import TTSClient
 from backend.core.audio_mixer import AudioMixer
 
 __all__ = [
     "parse_script",
+    "parse_and_validate",
     "ParsedScript", 
     "Dialogue",
     "generate_timestamps",
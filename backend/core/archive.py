@@ -0,0 +1,231 @@
+# [advice from AI] 업로드 압축 파일(ZIP/TAR) 처리 모듈
+import os
+import uuid
+import hashlib
+import tarfile
+import zipfile
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from backend.config import get_settings
+
+
+TAR_EXTENSIONS = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+ARCHIVE_EXTENSIONS = ('.zip',) + TAR_EXTENSIONS
+
+# 압축 해제 시 한 번에 읽는 크기
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class ArchiveLimitError(ValueError):
+    """[advice from AI] 압축 해제 한도 초과 (압축 폭탄 방지)"""
+
+
+@dataclass
+class ArchiveLimits:
+    """
+    [advice from AI] 압축 해제 한도 (0=제한 없음)
+
+    업로드 크기 제한은 압축된 크기에만 적용되므로 풀린 크기/항목 수는 읽으면서 따로 센다.
+    (헤더에 적힌 크기는 믿지 않고 실제로 읽은 바이트 기준)
+    """
+    max_members: int = 0         # 항목 수 (디렉토리 제외)
+    max_member_bytes: int = 0    # 항목 하나의 풀린 크기
+    max_total_bytes: int = 0     # 전체 풀린 크기
+
+
+def archive_limits() -> ArchiveLimits:
+    """설정값으로 압축 해제 한도 생성 (항목 하나는 업로드 파일 최대 크기까지)"""
+    settings = get_settings()
+    mb = 1024 * 1024
+    return ArchiveLimits(
+        max_members=settings.max_archive_members,
+        max_member_bytes=settings.max_upload_size_mb * mb,
+        max_total_bytes=settings.max_archive_extract_mb * mb,
+    )
+
+
+class _LimitedReader:
+    """읽은 바이트를 세면서 항목/전체 한도를 넘으면 ArchiveLimitError"""
+
+    def __init__(self, member: BinaryIO, name: str, limits: ArchiveLimits, totals: List[int]):
+        self._member = member
+        self._name = name
+        self._limits = limits
+        self._totals = totals    # [전체 읽은 바이트] - 항목 사이에 공유
+        self._read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        limits = self._limits
+        if size is None or size < 0:
+            # 전체 읽기도 한도 + 1 바이트까지만 읽어 초과 여부 판단
+            bounds = [b - c for b, c in (
+                (limits.max_member_bytes, self._read), (limits.max_total_bytes, self._totals[0]),
+            ) if b]
+            size = max(0, min(bounds)) + 1 if bounds else -1
+        data = self._member.read(size)
+        self._read += len(data)
+        self._totals[0] += len(data)
+        if limits.max_member_bytes and self._read > limits.max_member_bytes:
+            raise ArchiveLimitError(
+                f"압축 안의 파일이 너무 큽니다: {self._name} (최대 {limits.max_member_bytes // (1024 * 1024)}MB)"
+            )
+        if limits.max_total_bytes and self._totals[0] > limits.max_total_bytes:
+            raise ArchiveLimitError(
+                f"압축을 푼 전체 크기가 너무 큽니다. (최대 {limits.max_total_bytes // (1024 * 1024)}MB)"
+            )
+        return data
+
+
+@dataclass
+class ExtractedScript:
+    """압축에서 풀어 저장한 대화록 한 개"""
+    job_id: str
+    original_filename: str   # 압축 내부 경로
+    stored_filename: str     # upload_dir 기준 저장 파일명
+    sha256: str
+    size: int
+
+
+def is_archive(filename: str) -> bool:
+    """압축 파일 여부 (확장자 기준)"""
+    return bool(filename) and filename.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+def _is_script_member(name: str) -> bool:
+    """압축 내부 항목 중 대화록으로 볼 파일인지 확인 (디렉토리/숨김/메타 파일 제외)"""
+    if name.endswith('/') or name.startswith('__MACOSX/'):
+        return False
+    basename = os.path.basename(name)
+    return bool(basename) and not basename.startswith('.')
+
+
+def _iter_raw_members(fileobj: BinaryIO, filename: str) -> Iterator[Tuple[str, Optional[BinaryIO]]]:
+    """압축 안의 모든 파일 항목 (대화록이 아닌 항목은 스트림 None)"""
+    if filename.lower().endswith('.zip'):
+        with zipfile.ZipFile(fileobj) as zf:
+            for info in zf.infolist():
+                if info.is_dir():
+                    continue
+                if not _is_script_member(info.filename):
+                    yield info.filename, None
+                    continue
+                with zf.open(info) as member:
+                    yield info.filename, member
+        return
+
+    with tarfile.open(fileobj=fileobj, mode='r|*') as tf:
+        for info in tf:
+            if info.isdir():
+                continue
+            member = tf.extractfile(info) if info.isfile() and _is_script_member(info.name) else None
+            yield info.name, member
+
+
+def iter_archive_members(
+    fileobj: BinaryIO,
+    filename: str,
+    limits: Optional[ArchiveLimits] = None,
+) -> Iterator[Tuple[str, BinaryIO]]:
+    """
+    압축 안의 대화록을 (파일명, 읽기 스트림) 순서대로 반환
+
+    TAR는 스트리밍 모드로 읽으므로 반환된 스트림은 다음 항목으로 넘어가기 전에
+    모두 읽어야 한다.
+
+    Args:
+        fileobj: 압축 파일 객체 (ZIP은 탐색 가능해야 함)
+        filename: 압축 파일명 (형식 판별용)
+        limits: 압축 해제 한도 (없으면 설정값, 넘으면 읽는 중에 ArchiveLimitError)
+
+    Yields:
+        (압축 내부 경로, 파일 스트림)
+    """
+    limits = limits or archive_limits()
+    totals = [0]
+    count = 0
+    for name, member in _iter_raw_members(fileobj, filename):
+        count += 1
+        if limits.max_members and count > limits.max_members:
+            raise ArchiveLimitError(f"압축 안의 파일이 너무 많습니다. (최대 {limits.max_members}개)")
+        if member is not None:
+            yield name, _LimitedReader(member, name, limits, totals)
+
+
+def iter_archive_scripts(
+    fileobj: BinaryIO,
+    filename: str,
+    limits: Optional[ArchiveLimits] = None,
+) -> Iterator[Tuple[str, bytes]]:
+    """압축 안의 대화록을 (파일명, 내용) 순서대로 반환 (한 항목씩 읽음)"""
+    for name, member in iter_archive_members(fileobj, filename, limits):
+        yield name, member.read()
+
+
+def iter_zip_scripts(fileobj: BinaryIO) -> Iterator[Tuple[str, bytes]]:
+    """
+    ZIP 파일 안의 대화록을 (파일명, 내용) 순서대로 반환
+
+    Args:
+        fileobj: 탐색 가능한 ZIP 파일 객체
+
+    Yields:
+        (압축 내부 경로, 파일 내용)
+    """
+    return iter_archive_scripts(fileobj, '.zip')
+
+
+def extract_scripts(
+    fileobj: BinaryIO,
+    filename: str,
+    dest_dir: str,
+    limits: Optional[ArchiveLimits] = None,
+) -> List[ExtractedScript]:
+    """
+    압축 안의 대화록을 dest_dir에 바로 풀어 저장 (파일 전체를 메모리에 올리지 않음)
+
+    항목마다 작업 ID를 새로 만들고 '{작업ID}_{파일명}'으로 저장하며,
+    저장하면서 SHA-256을 함께 계산한다. 중간에 실패하면(한도 초과 포함) 이미 저장한 파일은 삭제한다.
+
+    Args:
+        fileobj: 압축 파일 객체
+        filename: 압축 파일명 (형식 판별용)
+        dest_dir: 저장 경로 (upload_dir)
+        limits: 압축 해제 한도 (없으면 설정값)
+
+    Returns:
+        저장된 대화록 목록 (압축 내부 순서)
+    """
+    extracted: List[ExtractedScript] = []
+    written: List[str] = []
+    try:
+        for name, member in iter_archive_members(fileobj, filename, limits):
+            job_id = str(uuid.uuid4())
+            stored_filename = f"{job_id}_{os.path.basename(name)}"
+            path = os.path.join(dest_dir, stored_filename)
+            written.append(path)
+            digest = hashlib.sha256()
+            size = 0
+
+            with open(path, 'wb') as out:
+                for chunk in iter(lambda: member.read(COPY_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+
+            extracted.append(ExtractedScript(
+                job_id=job_id,
+                original_filename=name[:255],
+                stored_filename=stored_filename,
+                sha256=digest.hexdigest(),
+                size=size,
+            ))
+    except BaseException:
+        for path in written:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        raise
+
+    return extracted
@@ -1,10 +1,11 @@
 # [advice from AI] 오디오 합성 모듈
 import os
-from typing import List
+from typing import List, Optional, Tuple
 from pydub import AudioSegment
 
 from backend.config import get_settings
 from backend.core.timestamp import TimestampedDialogue
+from backend.core.peaks import write_peaks
 
 
 class AudioMixer:
@@ -14,6 +15,8 @@ class AudioMixer:
         self.settings = get_settings()
         self.sample_rate = self.settings.audio_sample_rate
         self.channels = self.settings.audio_channels
+        # [advice from AI] 마지막 합성에서 발화별 실제 위치 [(시작 프레임, 끝 프레임), ...]
+        self.placements: List[Tuple[int, int]] = []
     
     def create_silence(self, duration_ms: int) -> AudioSegment:
         """
@@ -66,6 +69,7 @@ class AudioMixer:
         timestamped_dialogues: List[TimestampedDialogue],
         audio_files: List[str],
         output_path: str,
+        peaks_path: Optional[str] = None,
     ) -> str:
         """
         타임스탬프에 따라 오디오 파일들을 합성
@@ -74,9 +78,10 @@ class AudioMixer:
             timestamped_dialogues: 타임스탬프가 적용된 대화 목록
             audio_files: 각 대화에 해당하는 오디오 파일 경로 목록
             output_path: 출력 파일 경로
+            peaks_path: 파형 피크 사이드카 경로 (있으면 같은 PCM으로 함께 저장)
             
         Returns:
-            저장된 파일 경로
+            저장된 파일 경로 (발화별 샘플 위치는 self.placements)
         """
         if len(timestamped_dialogues) != len(audio_files):
             raise ValueError("대화 수와 오디오 파일 수가 일치하지 않습니다.")
@@ -87,6 +92,7 @@ class AudioMixer:
         # 결과 오디오 초기화 (빈 오디오)
         result = AudioSegment.empty()
         current_position = 0  # 밀리초 단위
+        placements = []
         
         for ts_dialogue, audio_file in zip(timestamped_dialogues, audio_files):
             # 시작 시간까지 무음 추가
@@ -97,6 +103,8 @@ class AudioMixer:
                 result += self.create_silence(silence_duration)
                 current_position = target_start_ms
             
+            start_frame = int(result.frame_count())
+            
             # 오디오 로드 및 추가
             try:
                 audio = self.load_audio(audio_file)
@@ -118,10 +126,19 @@ class AudioMixer:
                 expected_duration = int(ts_dialogue.speech_duration * 1000)
                 result += self.create_silence(expected_duration)
                 current_position += expected_duration
+            
+            # [advice from AI] 발화가 실제로 놓인 샘플 구간 (발화 단위 클립 추출용)
+            placements.append((start_frame, int(result.frame_count())))
+        
+        self.placements = placements
         
         # 마지막에 짧은 무음 추가 (끝부분 정리)
         result += self.create_silence(500)
         
+        # [advice from AI] 저장할 PCM 그대로 파형 피크 계산 (미리보기 파형용)
+        if peaks_path:
+            self.write_peaks(result, peaks_path)
+        
         # WAV 파일로 저장
         result.export(
             output_path,
@@ -134,6 +151,23 @@ class AudioMixer:
         
         return output_path
     
+    def write_peaks(self, audio: AudioSegment, peaks_path: str):
+        """
+        오디오의 파형 피크 사이드카 저장
+        
+        Args:
+            audio: 합성된 오디오 (출력과 같은 샘플레이트/채널)
+            peaks_path: 저장 경로
+        """
+        if audio.sample_width != 2:
+            audio = audio.set_sample_width(2)
+        write_peaks(
+            peaks_path,
+            audio.raw_data,
+            sample_rate=audio.frame_rate,
+            channels=audio.channels,
+        )
+    
     def get_audio_duration(self, file_path: str) -> float:
         """
         오디오 파일 길이 조회 (초)
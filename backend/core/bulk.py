@@ -0,0 +1,155 @@
+# [advice from AI] 작업 일괄 처리 모듈 - 조건 하나로 여러 작업을 삭제/재시도/취소 (작업마다 조회하지 않음)
+from datetime import datetime
+from typing import Dict, Iterable, List, Sequence
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.job import Job, JobStatus, ACTIVE_STATUSES
+from backend.core.storage import remove_job_files
+from backend.core.workers import chunked, get_file_pool, map_chunks_in_threads
+
+
+# IN 목록 하나에 넣는 최대 ID 수 (SQLite 바인드 변수 제한보다 충분히 작게)
+IN_CHUNK_SIZE = 1000
+
+
+def _unique_ids(job_ids: Iterable[str]) -> List[str]:
+    """중복 제거 (순서 유지)"""
+    return list(dict.fromkeys(job_ids))
+
+
+async def delete_jobs(db: AsyncSession, *conditions) -> List[Row]:
+    """
+    조건에 맞는 작업을 DELETE 한 번으로 삭제 (커밋은 호출하는 쪽에서)
+
+    Returns:
+        삭제된 작업 행 (id, batch_id, 파일명들 - 커밋 후 remove_deleted_files로 파일 삭제)
+    """
+    result = await db.execute(
+        delete(Job)
+        .where(*conditions)
+        .returning(Job.id, Job.batch_id, Job.filename, Job.output_filename, Job.json_filename)
+        .execution_options(synchronize_session=False)
+    )
+    return result.all()
+
+
+async def delete_jobs_by_id(db: AsyncSession, job_ids: Iterable[str]) -> List[Row]:
+    """ID 목록의 작업 삭제 (IN_CHUNK_SIZE 개씩 IN 조건 DELETE, 없는 ID는 무시)"""
+    rows: List[Row] = []
+    for chunk in chunked(_unique_ids(job_ids), IN_CHUNK_SIZE):
+        rows.extend(await delete_jobs(db, Job.id.in_(chunk)))
+    return rows
+
+
+async def reset_failed_jobs(db: AsyncSession, *conditions) -> List[Row]:
+    """
+    조건에 맞는 실패 작업을 UPDATE 한 번으로 대기 상태로 되돌림 (커밋은 호출하는 쪽에서)
+
+    Returns:
+        되돌린 작업 행 (id, batch_id, priority, version - 커밋 후 스케줄러 대기열에 추가)
+    """
+    result = await db.execute(
+        update(Job)
+        .where(Job.status == JobStatus.FAILED, *conditions)
+        .values(
+            status=JobStatus.PENDING,
+            progress=0,
+            error_message=None,
+            cache_source_id=None,
+            updated_at=datetime.utcnow(),
+        )
+        .returning(Job.id, Job.batch_id, Job.priority, Job.version)
+        .execution_options(synchronize_session=False)
+    )
+    return result.all()
+
+
+async def reset_failed_jobs_by_id(db: AsyncSession, job_ids: Iterable[str]) -> List[Row]:
+    """ID 목록 중 실패한 작업만 대기 상태로 되돌림 (IN_CHUNK_SIZE 개씩 IN 조건 UPDATE)"""
+    rows: List[Row] = []
+    for chunk in chunked(_unique_ids(job_ids), IN_CHUNK_SIZE):
+        rows.extend(await reset_failed_jobs(db, Job.id.in_(chunk)))
+    return rows
+
+
+async def cancel_jobs(db: AsyncSession, *conditions) -> List[Row]:
+    """
+    조건에 맞는 끝나지 않은 작업을 UPDATE 한 번으로 취소 상태로 (커밋은 호출하는 쪽에서)
+
+    Returns:
+        취소된 작업 행 (id, batch_id - 커밋 후 스케줄러 cancel로 대기열 제거/실행 중단)
+    """
+    result = await db.execute(
+        update(Job)
+        .where(Job.status.in_(ACTIVE_STATUSES), *conditions)
+        .values(status=JobStatus.CANCELLED, updated_at=datetime.utcnow())
+        .returning(Job.id, Job.batch_id)
+        .execution_options(synchronize_session=False)
+    )
+    return result.all()
+
+
+async def cancel_jobs_by_id(db: AsyncSession, job_ids: Iterable[str]) -> List[Row]:
+    """ID 목록 중 끝나지 않은 작업만 취소 (IN_CHUNK_SIZE 개씩 IN 조건 UPDATE)"""
+    rows: List[Row] = []
+    for chunk in chunked(_unique_ids(job_ids), IN_CHUNK_SIZE):
+        rows.extend(await cancel_jobs(db, Job.id.in_(chunk)))
+    return rows
+
+
+async def promote_cache_followers(db: AsyncSession, job_ids: Iterable[str]) -> List[Row]:
+    """
+    취소/삭제된 원본 작업의 결과를 기다리던 작업을 다른 원본에 연결 (같은 트랜잭션에서, 커밋은 호출하는 쪽에서)
+
+    원본이 끝나지 않고 사라지면 대기 중인 작업을 완료/실패시킬 작업이 없으므로,
+    원본별로 가장 먼저 등록된 대기 작업을 새 원본으로 올리고 나머지는 그 작업을 기다리게 한다.
+    (함께 취소/삭제된 작업은 이미 대기 상태가 아니므로 제외됨)
+
+    Returns:
+        새 원본 작업 행 (id, batch_id, priority, version - 커밋 후 스케줄러 대기열에 추가)
+    """
+    groups: Dict[str, List[Row]] = {}
+    for chunk in chunked(_unique_ids(job_ids), IN_CHUNK_SIZE):
+        result = await db.execute(
+            select(Job.id, Job.batch_id, Job.priority, Job.version, Job.cache_source_id)
+            .where(Job.cache_source_id.in_(chunk), Job.status == JobStatus.PENDING)
+            .order_by(Job.created_at, Job.id)
+        )
+        for row in result:
+            groups.setdefault(row.cache_source_id, []).append(row)
+    if not groups:
+        return []
+
+    now = datetime.utcnow()
+    promoted = [followers[0] for followers in groups.values()]
+    for chunk in chunked([row.id for row in promoted], IN_CHUNK_SIZE):
+        await db.execute(
+            update(Job)
+            .where(Job.id.in_(chunk))
+            .values(cache_source_id=None, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+    for followers in groups.values():
+        waiting = [row.id for row in followers[1:]]
+        for chunk in chunked(waiting, IN_CHUNK_SIZE):
+            await db.execute(
+                update(Job)
+                .where(Job.id.in_(chunk))
+                .values(cache_source_id=followers[0].id, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+    return promoted
+
+
+def _remove_rows_files(rows: Sequence[Row]):
+    for row in rows:
+        remove_job_files(row)
+
+
+async def remove_deleted_files(rows: Sequence[Row]):
+    """삭제된 작업들의 파일을 파일 삭제 스레드 풀에서 병렬로 삭제 (이벤트 루프를 막지 않음)"""
+    if rows:
+        await map_chunks_in_threads(get_file_pool(), _remove_rows_files, rows, chunk_size=32)
@@ -0,0 +1,248 @@
+# [advice from AI] 작업 결과 캐시 모듈 - 동일 대화록/설정의 결과 재사용
+import os
+import json
+import shutil
+import hashlib
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.models.job import Job, JobStatus
+from backend.core.tts_client import get_effective_api_key
+from backend.core.storage import peaks_filename
+
+
+# 처리 중인 상태 (아직 결과가 없는 작업)
+IN_FLIGHT_STATUSES = [
+    JobStatus.PENDING,
+    JobStatus.PARSING,
+    JobStatus.GENERATING_TTS,
+    JobStatus.MIXING,
+]
+
+
+def script_digest(content: bytes) -> str:
+    """대화록 원문 바이트의 SHA-256 해시"""
+    return hashlib.sha256(content).hexdigest()
+
+
+def file_digest(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """파일을 나눠 읽으며 SHA-256 해시 계산 (script_digest와 같은 값)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# [advice from AI] 시드를 지정하지 않으면 대화록 내용에서 결정적으로 유도
+def default_seed(script_sha256: str) -> int:
+    """대화록 해시 기반 기본 시드 (같은 대화록 -> 같은 시드)"""
+    return int(script_sha256[:8], 16)
+
+
+def compute_cache_key(script_sha256: str, seed: Optional[int] = None) -> str:
+    """
+    결과 캐시 키 계산
+
+    대화록 내용 + 음성 할당 + 타이밍 설정 + 시드가 모두 같으면 같은 키가 나온다.
+
+    Args:
+        script_sha256: 대화록 원문 해시 (script_digest)
+        seed: 작업 시드 (없으면 None)
+
+    Returns:
+        SHA-256 hex 문자열
+    """
+    settings = get_settings()
+
+    payload = {
+        "script": script_sha256,
+        "voices": {
+            "agent": settings.voice_agent,
+            "customer": settings.voice_customer,
+        },
+        "timing": {
+            "speech_rate": settings.speech_rate,
+            "turn_gap_min": settings.turn_gap_min,
+            "turn_gap_max": settings.turn_gap_max,
+            "action_duration": settings.action_duration,
+            "silence_padding": settings.silence_padding,
+        },
+        "audio": {
+            "sample_rate": settings.audio_sample_rate,
+            "channels": settings.audio_channels,
+            "format": settings.audio_format,
+        },
+        # Mock 오디오와 실제 TTS 결과가 섞이지 않도록 구분
+        "mock": bool(settings.tts_mock_mode or not get_effective_api_key()),
+        "seed": seed,
+    }
+
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _outputs_exist(job: Job) -> bool:
+    """작업의 출력 파일이 실제로 남아 있는지 확인"""
+    settings = get_settings()
+
+    for filename in (job.output_filename, job.json_filename):
+        if not filename or not os.path.exists(os.path.join(settings.output_dir, filename)):
+            return False
+    return True
+
+
+async def find_cached_job(
+    session: AsyncSession,
+    content_hash: Optional[str],
+    exclude_id: Optional[str] = None,
+) -> Optional[Job]:
+    """같은 캐시 키를 가진 완료 작업 조회 (출력 파일이 남아 있는 것만)"""
+    settings = get_settings()
+    if not settings.result_cache_enabled or not content_hash:
+        return None
+
+    query = select(Job).where(
+        Job.content_hash == content_hash,
+        Job.status == JobStatus.COMPLETED,
+    ).order_by(Job.completed_at.desc())
+    if exclude_id:
+        query = query.where(Job.id != exclude_id)
+
+    result = await session.execute(query)
+    for job in result.scalars():
+        if _outputs_exist(job):
+            return job
+    return None
+
+
+async def find_inflight_job(
+    session: AsyncSession,
+    content_hash: Optional[str],
+) -> Optional[Job]:
+    """같은 캐시 키로 처리 중인 작업 조회 (직접 처리하는 원본 작업만)"""
+    settings = get_settings()
+    if not settings.result_cache_enabled or not content_hash:
+        return None
+
+    result = await session.execute(
+        select(Job).where(
+            Job.content_hash == content_hash,
+            Job.status.in_(IN_FLIGHT_STATUSES),
+            Job.cache_source_id.is_(None),
+        ).limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+# [advice from AI] 대량 등록용 일괄 조회 (SQLite 변수 개수 제한 고려)
+LOOKUP_CHUNK_SIZE = 500
+
+
+def _hash_chunks(content_hashes: Iterable[str]) -> Iterable[List[str]]:
+    """중복 제거한 캐시 키 목록을 조회 단위로 나누기"""
+    unique = sorted(set(h for h in content_hashes if h))
+    for start in range(0, len(unique), LOOKUP_CHUNK_SIZE):
+        yield unique[start:start + LOOKUP_CHUNK_SIZE]
+
+
+async def find_cached_jobs(
+    session: AsyncSession,
+    content_hashes: Iterable[str],
+) -> Dict[str, Job]:
+    """여러 캐시 키의 완료 작업을 한 번에 조회 (캐시 키 -> 최신 완료 작업)"""
+    settings = get_settings()
+    found: Dict[str, Job] = {}
+    if not settings.result_cache_enabled:
+        return found
+
+    for chunk in _hash_chunks(content_hashes):
+        result = await session.execute(
+            select(Job).where(
+                Job.content_hash.in_(chunk),
+                Job.status == JobStatus.COMPLETED,
+            ).order_by(Job.completed_at.desc())
+        )
+        for job in result.scalars():
+            if job.content_hash not in found and _outputs_exist(job):
+                found[job.content_hash] = job
+    return found
+
+
+async def find_inflight_jobs(
+    session: AsyncSession,
+    content_hashes: Iterable[str],
+) -> Dict[str, Job]:
+    """여러 캐시 키의 처리 중인 원본 작업을 한 번에 조회 (캐시 키 -> 작업)"""
+    settings = get_settings()
+    found: Dict[str, Job] = {}
+    if not settings.result_cache_enabled:
+        return found
+
+    for chunk in _hash_chunks(content_hashes):
+        result = await session.execute(
+            select(Job).where(
+                Job.content_hash.in_(chunk),
+                Job.status.in_(IN_FLIGHT_STATUSES),
+                Job.cache_source_id.is_(None),
+            )
+        )
+        for job in result.scalars():
+            found.setdefault(job.content_hash, job)
+    return found
+
+
+def link_or_copy(src: str, dst: str):
+    """하드링크로 파일 재사용 (불가능한 파일시스템이면 복사)"""
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def apply_cached_result(job: Job, source: Job):
+    """
+    원본 작업의 결과를 job에 연결하고 완료 처리
+
+    WAV는 하드링크로 공유하고, JSON은 call_id/audio_file만 바꿔서 새로 쓴다.
+    (세션 커밋은 호출 측에서 수행)
+    """
+    settings = get_settings()
+
+    output_filename = f"{job.id}.wav"
+    json_filename = f"{job.id}.json"
+
+    link_or_copy(
+        os.path.join(settings.output_dir, source.output_filename),
+        os.path.join(settings.output_dir, output_filename),
+    )
+
+    # 파형 피크도 공유 (없으면 미리보기 시 생성)
+    source_peaks = os.path.join(settings.output_dir, peaks_filename(source.output_filename))
+    if os.path.exists(source_peaks):
+        link_or_copy(source_peaks, os.path.join(settings.output_dir, peaks_filename(output_filename)))
+
+    with open(os.path.join(settings.output_dir, source.json_filename), 'r', encoding='utf-8') as f:
+        json_data = json.load(f)
+    json_data["call_id"] = job.id
+    json_data["audio_file"] = output_filename
+    with open(os.path.join(settings.output_dir, json_filename), 'w', encoding='utf-8') as f:
+        json.dump(json_data, f, ensure_ascii=False, indent=2)
+
+    now = datetime.utcnow()
+    job.status = JobStatus.COMPLETED
+    job.progress = 100
+    job.output_filename = output_filename
+    job.json_filename = json_filename
+    job.duration_seconds = source.duration_seconds
+    job.error_message = None
+    job.cache_hit = True
+    job.cache_source_id = source.id
+    job.updated_at = now
+    job.completed_at = now
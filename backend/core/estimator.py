@@ -0,0 +1,77 @@
+# [advice from AI] 배치 드라이런 견적 모듈 (TTS 호출 없이 길이/글자 수/비용 계산)
+from typing import Dict, List, Tuple
+
+from backend.config import get_settings
+from backend.core.parser import ScriptStream, iter_lines
+from backend.core.timestamp import estimate_timeline
+
+
+def estimate_content(content: str) -> Dict:
+    """
+    대화록 한 개의 견적 계산
+
+    Returns:
+        대화 수, 글자 수, 예상 길이(초), TTS 요청 수, 예상 비용
+    """
+    settings = get_settings()
+    estimate = estimate_timeline(ScriptStream(iter_lines(content)))
+
+    return {
+        "dialogue_count": estimate.dialogue_count,
+        "characters": estimate.characters,
+        "tts_requests": estimate.dialogue_count,
+        "duration_seconds": round(estimate.total_seconds, 3),
+        "min_seconds": round(estimate.min_seconds, 3),
+        "max_seconds": round(estimate.max_seconds, 3),
+        "speech_seconds": round(estimate.speech_seconds, 3),
+        "estimated_cost": round(estimate.characters / 1000 * settings.tts_cost_per_1k_chars, 4),
+    }
+
+
+def estimate_files(items: List[Tuple[str, bytes]]) -> List[Dict]:
+    """
+    여러 대화록 견적 계산 (프로세스 풀 작업 단위)
+
+    Args:
+        items: (파일명, 내용 바이트) 목록
+
+    Returns:
+        파일별 견적 목록 (실패 시 error 포함)
+    """
+    results = []
+    for filename, data in items:
+        try:
+            result = estimate_content(data.decode('utf-8'))
+            result["error"] = None
+            if not result["dialogue_count"]:
+                result["error"] = "파싱된 대화가 없습니다."
+        except UnicodeDecodeError:
+            result = {"error": "UTF-8 텍스트 파일이 아닙니다."}
+        except Exception as e:
+            result = {"error": str(e)}
+        result["filename"] = filename
+        results.append(result)
+    return results
+
+
+def summarize_estimates(results: List[Dict]) -> Dict:
+    """파일별 견적 합계"""
+    settings = get_settings()
+
+    valid = [r for r in results if not r.get("error")]
+    characters = sum(r["characters"] for r in valid)
+    duration = sum(r["duration_seconds"] for r in valid)
+
+    return {
+        "files": len(results),
+        "valid_files": len(valid),
+        "dialogue_count": sum(r["dialogue_count"] for r in valid),
+        "characters": characters,
+        "tts_requests": sum(r["tts_requests"] for r in valid),
+        "duration_seconds": round(duration, 3),
+        "min_seconds": round(sum(r["min_seconds"] for r in valid), 3),
+        "max_seconds": round(sum(r["max_seconds"] for r in valid), 3),
+        "audio_hours": round(duration / 3600, 3),
+        "estimated_cost": round(characters / 1000 * settings.tts_cost_per_1k_chars, 4),
+        "cost_per_1k_chars": settings.tts_cost_per_1k_chars,
+    }
@@ -0,0 +1,229 @@
+# [advice from AI] 작업 이벤트 모듈 - 작업 상태/진행률 변경을 프로세스 내 구독자에게 전달 (SSE용)
+import json
+import time
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from typing import Deque, Dict, Iterable, List, Optional, Set
+
+import asyncio
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from backend.config import get_settings
+from backend.models.job import Job
+
+
+# 이벤트에 담는 작업 필드 (목록 행을 그리는 데 필요한 값)
+EVENT_FIELDS = (
+    "id", "original_filename", "status", "progress", "error_message",
+    "duration_seconds", "cache_hit", "batch_id", "version", "updated_at", "completed_at",
+)
+
+
+class JobEvent:
+    """작업 이벤트 한 건 (created/updated/deleted)"""
+
+    __slots__ = ("seq", "kind", "job_id", "payload")
+
+    def __init__(self, seq: int, kind: str, job_id: str, payload: Dict):
+        self.seq = seq
+        self.kind = kind
+        self.job_id = job_id
+        self.payload = payload
+
+
+class _Subscriber:
+    """구독자별 대기열 (가득 차면 밀린 이벤트를 버리고 다시 불러오기 요청)"""
+
+    def __init__(self, max_events: int):
+        self.max_events = max_events
+        self.events: Deque[JobEvent] = deque()
+        self.wakeup = asyncio.Event()
+        self.overflowed = False
+
+    def push(self, job_event: JobEvent):
+        if len(self.events) >= self.max_events:
+            self.events.clear()
+            self.overflowed = True
+        else:
+            self.events.append(job_event)
+        self.wakeup.set()
+
+
+class JobEventBus:
+    """
+    작업 이벤트 발행/구독 (프로세스 내, 이벤트 루프 스레드에서만 사용)
+
+    최근 이벤트를 링 버퍼에 보관해 재연결한 구독자가 Last-Event-ID 다음부터 이어 받는다.
+    이벤트 ID는 "{서버 시작 시각}-{순번}"이라 서버가 재시작되면 이전 ID로는 이어 받을 수 없다.
+    """
+
+    def __init__(self, buffer_size: int):
+        self.boot = str(int(time.time()))
+        self._seq = 0
+        self._buffer: Deque[JobEvent] = deque(maxlen=max(1, buffer_size))
+        self._subscribers: Set[_Subscriber] = set()
+
+    @property
+    def last_seq(self) -> int:
+        """마지막 이벤트 순번"""
+        return self._seq
+
+    def event_id(self, seq: int) -> str:
+        """SSE 이벤트 ID"""
+        return f"{self.boot}-{seq}"
+
+    def parse_event_id(self, value: Optional[str]) -> Optional[int]:
+        """SSE 이벤트 ID를 순번으로 (다른 서버 실행의 ID거나 형식이 틀리면 None)"""
+        if not value:
+            return None
+        boot, _, seq = value.partition("-")
+        if boot != self.boot or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def publish(self, kind: str, job_id: str, payload: Dict):
+        """이벤트 발행 (구독자가 없으면 버퍼에만 기록)"""
+        self._seq += 1
+        job_event = JobEvent(self._seq, kind, job_id, payload)
+        self._buffer.append(job_event)
+        for subscriber in self._subscribers:
+            subscriber.push(job_event)
+
+    def replay(self, after_seq: int) -> Optional[List[JobEvent]]:
+        """
+        after_seq 다음 이벤트 목록
+
+        Returns:
+            이어 받을 이벤트 목록 (버퍼에서 이미 밀려났으면 None - 전체 다시 불러오기 필요)
+        """
+        if after_seq >= self._seq:
+            return []
+        if not self._buffer or self._buffer[0].seq > after_seq + 1:
+            return None
+        return [job_event for job_event in self._buffer if job_event.seq > after_seq]
+
+    def subscribe(self) -> _Subscriber:
+        subscriber = _Subscriber(self._buffer.maxlen)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: _Subscriber):
+        self._subscribers.discard(subscriber)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+
+_bus: Optional[JobEventBus] = None
+
+
+def get_event_bus() -> JobEventBus:
+    """이벤트 버스 싱글톤 반환"""
+    global _bus
+    if _bus is None:
+        _bus = JobEventBus(get_settings().job_events_buffer_size)
+    return _bus
+
+
+def _json_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def job_payload(job: Job) -> Dict:
+    """
+    이벤트에 담을 작업 값 (이미 읽혀 있는 속성만 - DB를 다시 조회하지 않음)
+
+    INSERT 직후라 서버 기본값(created_at 등)이 아직 없으면 그 필드는 빠진다.
+    """
+    loaded = inspect(job).dict
+    return {field: _json_value(loaded[field]) for field in EVENT_FIELDS if field in loaded}
+
+
+def publish_jobs(jobs: Iterable[Job], kind: str = "created"):
+    """ORM 세션을 거치지 않고 저장한 작업(일괄 INSERT 등)의 이벤트 발행 (커밋 후 호출)"""
+    bus = get_event_bus()
+    for job in jobs:
+        bus.publish(kind, job.id, {**job_payload(job), "status_changed": True})
+
+
+def publish_bulk(rows: Iterable, kind: str, **values):
+    """
+    일괄 UPDATE/DELETE ... RETURNING 결과 행의 이벤트 발행 (커밋 후 호출)
+
+    Args:
+        rows: id, batch_id 속성이 있는 행
+        kind: updated / deleted
+        values: 모든 행에 공통으로 바뀐 필드 (status 등)
+    """
+    bus = get_event_bus()
+    payload = {key: _json_value(value) for key, value in values.items()}
+    for row in rows:
+        bus.publish(kind, row.id, {"id": row.id, "batch_id": row.batch_id, **payload, "status_changed": True})
+
+
+# === ORM 세션 훅: 커밋된 작업 변경만 발행 ===
+
+_PENDING_KEY = "job_events"
+
+
+def _record_flush(session: Session, flush_context):
+    """flush된 작업 변경을 세션에 모아 둠 (커밋되면 발행, 롤백되면 버림)"""
+    pending: Dict[str, Dict] = session.info.setdefault(_PENDING_KEY, {})
+    for obj in session.new:
+        if isinstance(obj, Job):
+            pending[obj.id] = {"kind": "created", "payload": job_payload(obj), "status_changed": True}
+    for obj in session.dirty:
+        if isinstance(obj, Job) and session.is_modified(obj):
+            status_changed = inspect(obj).attrs.status.history.has_changes()
+            previous = pending.get(obj.id)
+            pending[obj.id] = {
+                "kind": previous["kind"] if previous else "updated",
+                "payload": job_payload(obj),
+                "status_changed": status_changed or bool(previous and previous["status_changed"]),
+            }
+    for obj in session.deleted:
+        if isinstance(obj, Job):
+            pending[obj.id] = {
+                "kind": "deleted",
+                "payload": {"id": obj.id, "batch_id": obj.batch_id},
+                "status_changed": True,
+            }
+
+
+def _publish_commit(session: Session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    bus = get_event_bus()
+    for job_id, change in pending.items():
+        bus.publish(change["kind"], job_id, {**change["payload"], "status_changed": change["status_changed"]})
+
+
+def _discard_rollback(session: Session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+def install_session_hooks():
+    """모든 세션의 작업 변경을 이벤트로 발행하도록 훅 등록 (여러 번 호출해도 한 번만 등록)"""
+    if event.contains(Session, "after_flush", _record_flush):
+        return
+    event.listen(Session, "after_flush", _record_flush)
+    event.listen(Session, "after_commit", _publish_commit)
+    event.listen(Session, "after_rollback", _discard_rollback)
+
+
+def format_sse(event_id: Optional[str], kind: str, data: Dict) -> str:
+    """SSE 메시지 한 건"""
+    lines = []
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {kind}")
+    lines.append("data: " + json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+    return "\n".join(lines) + "\n\n"
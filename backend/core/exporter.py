@@ -0,0 +1,303 @@
+# [advice from AI] 데이터셋 내보내기 모듈 - 작업 결과를 크기 제한 tar 샤드 + 발화 매니페스트로 저장
+import os
+import json
+import shutil
+import asyncio
+import hashlib
+import tarfile
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List
+
+from sqlalchemy import select, update
+
+from backend.config import get_settings
+from backend.database import get_session_maker
+from backend.models.job import Job, JobStatus, job_filters
+from backend.models.export import Export, ExportStatus
+
+
+MANIFEST_FILENAME = "manifest.jsonl"
+
+# tar 항목당 헤더(PAX 확장 포함)와 512바이트 정렬 여유
+TAR_MEMBER_OVERHEAD = 2048
+
+
+@dataclass
+class ExportItem:
+    """샤드에 넣을 작업 한 개 ({id}.wav + {id}.json)"""
+    job_id: str
+    original_filename: str
+    wav_path: str
+    json_path: str
+    size: int = 0
+
+
+def shard_filename(index: int) -> str:
+    """샤드 파일명"""
+    return f"shard-{index:05d}.tar"
+
+
+def export_path(export_id: str, filename: str = "") -> str:
+    """내보내기 디렉토리(또는 그 안의 파일) 경로"""
+    settings = get_settings()
+    return os.path.join(settings.export_dir, export_id, filename)
+
+
+def measure_items(items: List[ExportItem]) -> List[ExportItem]:
+    """파일 크기 확인 (파일이 없는 작업은 제외)"""
+    measured = []
+    for item in items:
+        try:
+            item.size = os.path.getsize(item.wav_path) + os.path.getsize(item.json_path)
+        except OSError:
+            continue
+        measured.append(item)
+    return measured
+
+
+def plan_shards(items: List[ExportItem], max_bytes: int) -> List[List[ExportItem]]:
+    """
+    작업을 순서대로 샤드에 배정 (샤드 크기가 max_bytes를 넘지 않도록)
+
+    작업 하나가 max_bytes보다 크면 그 작업만 담은 샤드를 만든다.
+    """
+    shards: List[List[ExportItem]] = []
+    current: List[ExportItem] = []
+    current_size = 0
+    for item in items:
+        item_size = item.size + 2 * TAR_MEMBER_OVERHEAD
+        if current and current_size + item_size > max_bytes:
+            shards.append(current)
+            current, current_size = [], 0
+        current.append(item)
+        current_size += item_size
+    if current:
+        shards.append(current)
+    return shards
+
+
+class _HashingWriter:
+    """쓰는 대로 SHA-256과 크기를 계산하는 파일 래퍼 (tar 스트림 출력용)"""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data) -> int:
+        self._raw.write(data)
+        self.sha256.update(data)
+        self.size += len(data)
+        return len(data)
+
+
+def write_shard(path: str, items: List[ExportItem]) -> Dict:
+    """
+    tar 샤드 작성 (동기 함수 - 스레드에서 호출)
+
+    tar 스트림 모드로 파일을 읽는 대로 쓰므로 메모리 사용량은 샤드 크기와 무관하다.
+    작성 중에는 .tmp 이름을 쓰고 끝나면 바꾼다. (그 사이 삭제된 작업은 건너뜀)
+
+    Returns:
+        {"size", "sha256", "job_count"}
+    """
+    temp_path = f"{path}.tmp"
+    job_count = 0
+    with open(temp_path, "wb") as raw:
+        writer = _HashingWriter(raw)
+        with tarfile.open(fileobj=writer, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+            for item in items:
+                try:
+                    wav = open(item.wav_path, "rb")
+                    meta = open(item.json_path, "rb")
+                except OSError:
+                    continue
+                with wav, meta:
+                    for src, arcname in ((wav, f"{item.job_id}.wav"), (meta, f"{item.job_id}.json")):
+                        info = tar.gettarinfo(fileobj=src, arcname=arcname)
+                        info.uid = info.gid = 0
+                        info.uname = info.gname = ""
+                        tar.addfile(info, src)
+                job_count += 1
+    os.replace(temp_path, path)
+    return {"size": writer.size, "sha256": writer.sha256.hexdigest(), "job_count": job_count}
+
+
+def write_manifest(path: str, shards: List[List[ExportItem]]) -> int:
+    """
+    전체 발화 매니페스트(JSONL) 작성 (동기 함수 - 스레드에서 호출)
+
+    발화 JSON을 작업 하나씩 읽어 바로 한 줄씩 쓴다.
+
+    Returns:
+        발화 수
+    """
+    count = 0
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as out:
+        for index, items in enumerate(shards):
+            shard = shard_filename(index)
+            for item in items:
+                try:
+                    with open(item.json_path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                sample_rate = data.get("sample_rate")
+                for utterance in data.get("utterances", []):
+                    record = {
+                        "shard": shard,
+                        "audio": f"{item.job_id}.wav",
+                        "call_id": item.job_id,
+                        "source": item.original_filename,
+                        "turn_idx": utterance.get("turn_idx"),
+                        "role": utterance.get("role"),
+                        "text": utterance.get("utterance"),
+                        "started_at": utterance.get("started_at"),
+                        "ended_at": utterance.get("ended_at"),
+                    }
+                    if "start_sample" in utterance:
+                        record["start_sample"] = utterance["start_sample"]
+                        record["end_sample"] = utterance["end_sample"]
+                        record["sample_rate"] = sample_rate
+                    out.write(json.dumps(record, ensure_ascii=False))
+                    out.write("\n")
+                    count += 1
+    os.replace(temp_path, path)
+    return count
+
+
+async def _update_export(export_id: str, **values):
+    """내보내기 상태 갱신"""
+    async_session = get_session_maker()
+    async with async_session() as session:
+        export = await session.get(Export, export_id)
+        if not export:
+            return
+        for key, value in values.items():
+            setattr(export, key, value)
+        export.updated_at = datetime.utcnow()
+        await session.commit()
+
+
+async def run_export(export_id: str):
+    """
+    내보내기 실행 (백그라운드)
+
+    1. 필터에 맞는 작업 중 결과 파일이 있는 작업을 생성 순으로 조회
+    2. 크기 제한에 맞춰 샤드 배정
+    3. 샤드는 export_workers개씩 스레드에서 동시에 작성, 매니페스트도 함께 작성
+    """
+    settings = get_settings()
+    async_session = get_session_maker()
+
+    async with async_session() as session:
+        export = await session.get(Export, export_id)
+        if not export:
+            return
+        filters = export.load_filters()
+        if filters.get("status"):
+            filters["status"] = JobStatus(filters["status"])
+        max_bytes = export.shard_size_mb * 1024 * 1024
+        export.status = ExportStatus.RUNNING
+        export.updated_at = datetime.utcnow()
+        await session.commit()
+
+        result = await session.execute(
+            select(Job.id, Job.original_filename, Job.output_filename, Job.json_filename)
+            .where(
+                *job_filters(**filters),
+                Job.output_filename.isnot(None),
+                Job.json_filename.isnot(None),
+            )
+            .order_by(Job.created_at, Job.id)
+        )
+        items = [
+            ExportItem(
+                job_id=row.id,
+                original_filename=row.original_filename,
+                wav_path=os.path.join(settings.output_dir, row.output_filename),
+                json_path=os.path.join(settings.output_dir, row.json_filename),
+            )
+            for row in result
+        ]
+
+    directory = export_path(export_id)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        items = await asyncio.to_thread(measure_items, items)
+        plan = plan_shards(items, max_bytes)
+
+        semaphore = asyncio.Semaphore(max(1, settings.export_workers))
+        shards: List[Dict] = [None] * len(plan)
+        done = 0
+
+        async def build(index: int, shard_items: List[ExportItem]):
+            nonlocal done
+            async with semaphore:
+                filename = shard_filename(index)
+                info = await asyncio.to_thread(write_shard, os.path.join(directory, filename), shard_items)
+            shards[index] = {"index": index, "filename": filename, **info}
+            done += 1
+            await _update_export(export_id, progress=int(done / len(plan) * 99))
+
+        # 실패한 샤드가 있어도 다른 스레드가 끝난 뒤에 정리하도록 모두 기다림
+        results = await asyncio.gather(
+            asyncio.to_thread(write_manifest, os.path.join(directory, MANIFEST_FILENAME), plan),
+            *(build(index, shard_items) for index, shard_items in enumerate(plan)),
+            return_exceptions=True,
+        )
+        for outcome in results:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+        await _update_export(
+            export_id,
+            status=ExportStatus.COMPLETED,
+            progress=100,
+            job_count=sum(shard["job_count"] for shard in shards),
+            utterance_count=results[0],
+            total_bytes=sum(shard["size"] for shard in shards),
+            shards=json.dumps(shards),
+            completed_at=datetime.utcnow(),
+        )
+        print(f"📦 내보내기 완료: {export_id} (샤드 {len(shards)}개, 작업 {len(items)}개)")
+
+    except Exception as e:
+        print(f"❌ 내보내기 실패: {export_id} - {e}")
+        shutil.rmtree(directory, ignore_errors=True)
+        await _update_export(export_id, status=ExportStatus.FAILED, error_message=str(e))
+
+
+# [advice from AI] 서버가 중단되면 진행 중이던 내보내기를 이어 갈 태스크가 없으므로 시작 시 실패 처리
+async def fail_interrupted_exports() -> int:
+    """
+    대기/작성 중 상태로 남은 내보내기를 실패로 바꾸고 작성 중이던 파일 삭제 (서버 시작 시)
+
+    Returns:
+        실패 처리한 내보내기 수
+    """
+    async_session = get_session_maker()
+    async with async_session() as session:
+        result = await session.execute(
+            update(Export)
+            .where(Export.status.in_((ExportStatus.PENDING, ExportStatus.RUNNING)))
+            .values(
+                status=ExportStatus.FAILED,
+                error_message="서버 재시작으로 중단되었습니다.",
+                updated_at=datetime.utcnow(),
+            )
+            .returning(Export.id)
+        )
+        export_ids = result.scalars().all()
+        await session.commit()
+
+    def remove_directories():
+        for export_id in export_ids:
+            shutil.rmtree(export_path(export_id), ignore_errors=True)
+
+    if export_ids:
+        await asyncio.to_thread(remove_directories)
+        print(f"⚠️ 중단된 내보내기 {len(export_ids)}개를 실패 처리했습니다.")
+    return len(export_ids)
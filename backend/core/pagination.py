@@ -0,0 +1,59 @@
+# [advice from AI] 키셋(커서) 페이지네이션 - OFFSET 없이 (정렬 값, id) 다음부터 조회
+import json
+import base64
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import and_, or_, asc, desc, tuple_
+
+
+class CursorError(ValueError):
+    """형식이 잘못되었거나 정렬 조건이 다른 커서"""
+    pass
+
+
+def encode_cursor(sort_key: str, order: str, value: Any, row_id: str) -> str:
+    """마지막 행의 (정렬 기준, 순서, 정렬 값, id)를 URL-safe 문자열로"""
+    raw = json.dumps([sort_key, order, value, row_id], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str, order: str) -> Tuple[Any, str]:
+    """
+    커서를 (정렬 값, id)로 복원
+
+    Raises:
+        CursorError: 형식이 잘못되었거나 요청의 정렬 기준/순서와 다른 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_key, cursor_order, value, row_id = json.loads(raw.decode("utf-8"))
+    except (ValueError, TypeError):
+        raise CursorError("잘못된 커서입니다")
+    if cursor_key != sort_key or cursor_order != order or not isinstance(row_id, str):
+        raise CursorError("커서의 정렬 조건이 요청과 다릅니다")
+    return value, row_id
+
+
+def keyset_order(column, id_column, descending: bool) -> List:
+    """(정렬 값, id) 정렬 - id로 동점을 끊어야 다음 페이지 경계가 하나로 정해진다"""
+    direction = desc if descending else asc
+    return [direction(column), direction(id_column)]
+
+
+def keyset_after(column, id_column, value: Optional[Any], row_id: str, descending: bool, nullable: bool = False):
+    """
+    keyset_order 순서에서 (value, row_id) 다음 행들의 조건
+
+    SQLite는 NULL을 가장 작은 값으로 정렬하므로 (오름차순에서 맨 앞, 내림차순에서 맨 뒤)
+    NULL이 있을 수 있는 컬럼은 그 위치에 맞춰 조건을 더한다.
+    NULL이 없는 컬럼은 행 값 비교 하나라 (정렬 값, id) 인덱스로 바로 범위를 찾는다.
+    """
+    if value is None:
+        if descending:
+            return and_(column.is_(None), id_column < row_id)
+        return or_(and_(column.is_(None), id_column > row_id), column.isnot(None))
+
+    if descending:
+        condition = tuple_(column, id_column) < tuple_(value, row_id)
+        return or_(condition, column.is_(None)) if nullable else condition
+    return tuple_(column, id_column) > tuple_(value, row_id)
@@ -1,7 +1,8 @@
 # [advice from AI] 대화록 파싱 모듈
 import re
-from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+import difflib
+from dataclasses import dataclass, field, asdict
+from typing import List, Optional, Tuple, Dict, Iterable, Iterator
 
 
 @dataclass
@@ -21,6 +22,31 @@ class ParsedScript:
     dialogues: List[Dialogue]
     summary: Optional[str] = None
     raw_content: str = ""
+    
+    # [advice from AI] 작업에 저장하기 위한 직렬화 (재시도/재합성 시 재파싱 방지)
+    def to_dict(self) -> dict:
+        """dict로 변환 (raw_content 제외)"""
+        return {
+            "dialogues": [asdict(d) for d in self.dialogues],
+            "summary": self.summary,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "ParsedScript":
+        """to_dict 결과에서 복원"""
+        return cls(
+            dialogues=[Dialogue(**d) for d in data.get("dialogues", [])],
+            summary=data.get("summary"),
+        )
+
+
+@dataclass
+class DialogueDiff:
+    """대화록 수정 전후 비교 결과"""
+    reused: Dict[int, int] = field(default_factory=dict)  # 새 인덱스 -> 이전 인덱스 (변경 없음)
+    changed: List[int] = field(default_factory=list)      # 내용이 바뀐 새 인덱스
+    added: List[int] = field(default_factory=list)        # 추가된 새 인덱스
+    removed: List[int] = field(default_factory=list)      # 삭제된 이전 인덱스
 
 
 # 정규식 패턴
@@ -30,6 +56,9 @@ DELAY_PATTERN = re.compile(r'\[DELAY:\s*([\d.]+)s?\]')
 SUMMARY_START = re.compile(r'^---\s*$', re.MULTILINE)
 SUMMARY_TAG = re.compile(r'<SCENARIO_SUMMARY>(.*?)</SCENARIO_SUMMARY>', re.DOTALL)
 
+# [advice from AI] ACTION/DELAY 태그를 한 번의 스캔으로 찾는 통합 패턴
+TAG_PATTERN = re.compile(r'\[(?:ACTION:\s*(?P<action>[^\]]+)|DELAY:\s*(?P<delay>[\d.]+)s?)\]')
+
 
 def extract_actions(text: str) -> List[str]:
     """[ACTION: ...] 태그 추출"""
@@ -58,90 +87,244 @@ def clean_text(text: str) -> str:
     return text.strip()
 
 
-def parse_script(content: str) -> ParsedScript:
+def tokenize_line(line: str, line_number: int) -> Optional[Dialogue]:
     """
-    대화록 텍스트를 파싱하여 구조화된 데이터로 변환
+    대화 한 줄을 한 번의 스캔으로 분해 (화자, 태그, 순수 대사)
     
     Args:
-        content: 대화록 텍스트 전체
+        line: 앞뒤 공백이 제거된 한 줄
+        line_number: 줄 번호 (1부터)
         
     Returns:
-        ParsedScript: 파싱된 대화록 객체
+        Dialogue (화자 패턴이 아니면 None)
     """
-    dialogues: List[Dialogue] = []
-    summary: Optional[str] = None
+    match = SPEAKER_PATTERN.match(line)
+    if not match:
+        return None
     
-    # --- 구분자로 본문과 요약 분리
-    parts = SUMMARY_START.split(content, maxsplit=1)
-    main_content = parts[0]
-    
-    if len(parts) > 1:
-        summary_section = parts[1]
-        # <SCENARIO_SUMMARY> 태그 내용 추출
-        summary_match = SUMMARY_TAG.search(summary_section)
-        if summary_match:
-            summary = summary_match.group(1).strip()
-    
-    # 줄별로 파싱
-    lines = main_content.split('\n')
-    for line_num, line in enumerate(lines, start=1):
-        line = line.strip()
-        if not line:
-            continue
-            
-        # 화자:대사 패턴 매칭
-        match = SPEAKER_PATTERN.match(line)
-        if match:
-            speaker = match.group(1)
-            raw_text = match.group(2)
+    speaker = match.group(1)
+    raw_text = match.group(2)
+    
+    actions: List[str] = []
+    delays: List[float] = []
+    
+    if '[' not in raw_text:
+        # 태그가 없는 줄 (대부분): 공백 정리만 수행
+        text = ' '.join(raw_text.split())
+    else:
+        pieces = []
+        position = 0
+        for tag in TAG_PATTERN.finditer(raw_text):
+            pieces.append(raw_text[position:tag.start()])
+            position = tag.end()
+            if tag.group('action') is not None:
+                actions.append(tag.group('action'))
+            else:
+                try:
+                    delays.append(float(tag.group('delay')))
+                except ValueError:
+                    pass
+        pieces.append(raw_text[position:])
+        text = ' '.join(''.join(pieces).split())
+    
+    return Dialogue(
+        line_number=line_number,
+        speaker=speaker,
+        text=text,
+        raw_text=raw_text,
+        actions=actions,
+        delays=delays,
+    )
+
+
+# [advice from AI] 줄 단위 스트리밍 파서 (대용량 대화록을 일정한 메모리로 처리)
+class ScriptStream:
+    """
+    줄 반복자에서 대화를 하나씩 생성하는 파서
+    
+    '---' 줄 이후는 요약 영역으로 모아 두었다가 반복이 끝나면
+    <SCENARIO_SUMMARY> 내용을 summary에 채운다.
+    
+    사용법:
+        stream = ScriptStream(lines)
+        for dialogue in stream:
+            ...
+        stream.summary
+    """
+    
+    def __init__(self, lines: Iterable[str]):
+        self._lines = lines
+        self.summary: Optional[str] = None
+    
+    def __iter__(self) -> Iterator[Dialogue]:
+        trailer: Optional[List[str]] = None
+        
+        for line_num, line in enumerate(self._lines, start=1):
+            line = line.rstrip('\n')
+            if trailer is not None:
+                trailer.append(line)
+                continue
             
-            # 태그 추출
-            actions = extract_actions(raw_text)
-            delays = extract_delays(raw_text)
+            # --- 구분자 이후는 요약 영역
+            if line.startswith('---') and not line[3:].strip():
+                trailer = []
+                continue
             
-            # 순수 대사 추출
-            text = clean_text(raw_text)
+            line = line.strip()
+            if not line:
+                continue
             
-            dialogue = Dialogue(
-                line_number=line_num,
-                speaker=speaker,
-                text=text,
-                raw_text=raw_text,
-                actions=actions,
-                delays=delays,
-            )
-            dialogues.append(dialogue)
+            dialogue = tokenize_line(line, line_num)
+            if dialogue:
+                yield dialogue
+        
+        if trailer:
+            # <SCENARIO_SUMMARY> 태그 내용 추출
+            summary_match = SUMMARY_TAG.search('\n'.join(trailer))
+            if summary_match:
+                self.summary = summary_match.group(1).strip()
+
+
+def iter_lines(content: str) -> Iterator[str]:
+    """문자열을 복사하지 않고 줄 단위로 나누기 ('\n' 기준)"""
+    start = 0
+    while True:
+        end = content.find('\n', start)
+        if end < 0:
+            yield content[start:]
+            return
+        yield content[start:end]
+        start = end + 1
+
+
+def parse_script(content: str, keep_raw: bool = False) -> ParsedScript:
+    """
+    대화록 텍스트를 파싱하여 구조화된 데이터로 변환
+    
+    Args:
+        content: 대화록 텍스트 전체
+        keep_raw: 원문을 raw_content에 보관할지 여부
+        
+    Returns:
+        ParsedScript: 파싱된 대화록 객체
+    """
+    stream = ScriptStream(iter_lines(content))
+    dialogues = list(stream)
     
     return ParsedScript(
         dialogues=dialogues,
-        summary=summary,
-        raw_content=content,
+        summary=stream.summary,
+        raw_content=content if keep_raw else "",
     )
 
 
-def validate_script(content: str) -> Tuple[bool, List[str]]:
+def parse_script_file(file_path: str, keep_raw: bool = False) -> ParsedScript:
     """
-    대화록 유효성 검증
+    대화록 파일을 줄 단위로 읽으며 파싱 (전체 내용을 메모리에 올리지 않음)
     
+    Args:
+        file_path: 대화록 파일 경로 (UTF-8)
+        keep_raw: 원문을 raw_content에 보관할지 여부
+        
     Returns:
-        (is_valid, errors): 유효 여부와 에러 메시지 목록
+        ParsedScript: 파싱된 대화록 객체
     """
-    errors = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        stream = ScriptStream(f)
+        dialogues = list(stream)
     
-    if not content or not content.strip():
-        errors.append("대화록 내용이 비어있습니다.")
-        return False, errors
+    raw_content = ""
+    if keep_raw:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            raw_content = f.read()
     
-    parsed = parse_script(content)
+    return ParsedScript(
+        dialogues=dialogues,
+        summary=stream.summary,
+        raw_content=raw_content,
+    )
+
+
+# [advice from AI] 파싱 결과 기반 검증 (같은 내용을 두 번 파싱하지 않도록 분리)
+def validate_parsed(parsed: ParsedScript) -> List[str]:
+    """
+    파싱된 대화록 검증
+    
+    Returns:
+        에러 메시지 목록 (비어 있으면 유효)
+    """
+    errors = []
     
     if not parsed.dialogues:
         errors.append("파싱된 대화가 없습니다. '상담사:' 또는 '고객:'으로 시작하는 줄이 필요합니다.")
-        return False, errors
+        return errors
     
     # 화자 확인
     speakers = set(d.speaker for d in parsed.dialogues)
     if len(speakers) < 2:
         errors.append(f"대화에 한 명의 화자({list(speakers)[0]})만 있습니다. 두 명의 화자가 필요합니다.")
     
+    return errors
+
+
+def parse_and_validate(content: str) -> Tuple[ParsedScript, List[str]]:
+    """
+    대화록 파싱 + 검증을 한 번에 수행
+    
+    Returns:
+        (parsed, errors): 파싱 결과와 에러 메시지 목록
+    """
+    if not content or not content.strip():
+        return ParsedScript(dialogues=[]), ["대화록 내용이 비어있습니다."]
+    
+    parsed = parse_script(content)
+    return parsed, validate_parsed(parsed)
+
+
+def validate_script(content: str) -> Tuple[bool, List[str]]:
+    """
+    대화록 유효성 검증
+    
+    Returns:
+        (is_valid, errors): 유효 여부와 에러 메시지 목록
+    """
+    _, errors = parse_and_validate(content)
     return len(errors) == 0, errors
 
+
+# [advice from AI] 대화록 수정 전후 대화 비교 (증분 재합성용)
+def diff_dialogues(old: List[Dialogue], new: List[Dialogue]) -> DialogueDiff:
+    """
+    수정 전후 대화 목록 비교
+
+    화자 + 대사 텍스트 기준으로 정렬(difflib)하여 줄 이동/삽입/삭제를 구분한다.
+    같은 구간 안에서 1:1로 대응되는 줄은 '변경', 남는 줄은 '추가'/'삭제'로 본다.
+
+    Args:
+        old: 이전 대화 목록
+        new: 수정된 대화 목록
+
+    Returns:
+        DialogueDiff: 비교 결과
+    """
+    old_keys = [(d.speaker, d.text) for d in old]
+    new_keys = [(d.speaker, d.text) for d in new]
+
+    diff = DialogueDiff()
+    matcher = difflib.SequenceMatcher(a=old_keys, b=new_keys, autojunk=False)
+
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            for offset in range(i2 - i1):
+                diff.reused[j1 + offset] = i1 + offset
+        elif tag == 'replace':
+            paired = min(i2 - i1, j2 - j1)
+            diff.changed.extend(range(j1, j1 + paired))
+            diff.added.extend(range(j1 + paired, j2))
+            diff.removed.extend(range(i1 + paired, i2))
+        elif tag == 'insert':
+            diff.added.extend(range(j1, j2))
+        elif tag == 'delete':
+            diff.removed.extend(range(i1, i2))
+
+    return diff
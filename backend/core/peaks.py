@@ -0,0 +1,204 @@
+# [advice from AI] 파형 피크(min/max) 사이드카 모듈 - 미리보기 파형을 PCM 없이 그리기 위함
+import sys
+import struct
+import warnings
+from array import array
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+# audioop은 Python 3.13에서 제거됨 - 없으면 순수 Python으로 계산 (느림)
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    try:
+        import audioop
+    except ImportError:
+        audioop = None
+
+
+# 파일 형식: 헤더 + 레벨 표 + 레벨별 int16 (min, max) 쌍 (리틀 엔디언)
+PEAKS_MAGIC = b"S2WP"
+PEAKS_VERSION = 1
+HEADER_FORMAT = "<4sBBHIQ"   # magic, version, channels, level 수, 샘플레이트, 프레임 수
+LEVEL_FORMAT = "<II"         # 피크당 프레임 수, 피크 수
+
+# 가장 촘촘한 레벨의 피크당 프레임 수 (레벨마다 2배)
+BASE_FRAMES_PER_PEAK = 256
+MAX_FRAMES_PER_PEAK = 65536
+
+# resolution 미지정 시 기본 피크 수 (화면 폭 정도)
+DEFAULT_POINTS = 2000
+
+
+@dataclass
+class PeakLevel:
+    """한 해상도의 피크 데이터"""
+    sample_rate: int
+    frame_count: int
+    frames_per_peak: int
+    data: array            # int16, [min0, max0, min1, max1, ...]
+    available: List[int]   # 파일에 있는 모든 레벨의 피크당 프레임 수
+
+    @property
+    def peak_count(self) -> int:
+        return len(self.data) // 2
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.frame_count / self.sample_rate if self.sample_rate else 0.0
+
+
+def int16_le_bytes(data: array) -> bytes:
+    """int16 배열을 리틀 엔디언 바이트로"""
+    if sys.byteorder == "big":
+        data = array("h", data)
+        data.byteswap()
+    return data.tobytes()
+
+
+def _frame_minmax(pcm: bytes, step: int) -> array:
+    """16비트 PCM을 step 바이트씩 나눠 (min, max) 배열 생성"""
+    base = array("h")
+    view = memoryview(pcm)
+    if audioop is not None:
+        for start in range(0, len(pcm), step):
+            base.extend(audioop.minmax(view[start:start + step], 2))
+        return base
+
+    samples = array("h")
+    samples.frombytes(pcm[:len(pcm) - len(pcm) % 2])
+    if sys.byteorder == "big":
+        samples.byteswap()
+    count = step // 2
+    for start in range(0, len(samples), count):
+        chunk = samples[start:start + count]
+        base.append(min(chunk))
+        base.append(max(chunk))
+    return base
+
+
+def compute_peak_levels(pcm: bytes, channels: int = 1) -> List[Tuple[int, array]]:
+    """
+    16비트 PCM으로 다중 해상도 min/max 피크 계산
+
+    가장 촘촘한 레벨만 PCM에서 직접 구하고, 그보다 거친 레벨은
+    바로 아래 레벨의 인접한 두 피크를 합쳐서 만든다.
+
+    Args:
+        pcm: 16비트 리틀 엔디언 PCM (여러 채널이면 인터리브, 채널 구분 없이 합쳐서 계산)
+        channels: 채널 수
+
+    Returns:
+        [(피크당 프레임 수, int16 min/max 배열), ...] (촘촘한 순)
+    """
+    base = _frame_minmax(pcm, BASE_FRAMES_PER_PEAK * max(1, channels) * 2)
+
+    levels = [(BASE_FRAMES_PER_PEAK, base)]
+    frames_per_peak = BASE_FRAMES_PER_PEAK
+    current = base
+    while frames_per_peak < MAX_FRAMES_PER_PEAK and len(current) > 2:
+        merged = array("h")
+        for i in range(0, len(current), 4):
+            if i + 2 < len(current):
+                merged.append(min(current[i], current[i + 2]))
+                merged.append(max(current[i + 1], current[i + 3]))
+            else:
+                merged.append(current[i])
+                merged.append(current[i + 1])
+        frames_per_peak *= 2
+        levels.append((frames_per_peak, merged))
+        current = merged
+
+    return levels
+
+
+def write_peaks(
+    path: str,
+    pcm: bytes,
+    sample_rate: int,
+    channels: int = 1,
+):
+    """
+    피크 사이드카 파일 저장
+
+    Args:
+        path: 저장 경로 (.peaks)
+        pcm: 16비트 PCM (인터리브)
+        sample_rate: 샘플레이트
+        channels: 채널 수
+    """
+    levels = compute_peak_levels(pcm, channels)
+    frame_count = len(pcm) // (2 * max(1, channels))
+
+    with open(path, "wb") as f:
+        f.write(struct.pack(
+            HEADER_FORMAT, PEAKS_MAGIC, PEAKS_VERSION, channels, len(levels), sample_rate, frame_count,
+        ))
+        for frames_per_peak, data in levels:
+            f.write(struct.pack(LEVEL_FORMAT, frames_per_peak, len(data) // 2))
+        for _, data in levels:
+            f.write(int16_le_bytes(data))
+
+
+def choose_level(available: List[Tuple[int, int]], resolution: Optional[int], points: int) -> int:
+    """
+    요청에 맞는 레벨 인덱스 선택
+
+    Args:
+        available: [(피크당 프레임 수, 피크 수), ...] (촘촘한 순)
+        resolution: 원하는 피크당 프레임 수 (이보다 촘촘하지 않은 가장 가까운 레벨)
+        points: resolution이 없을 때 최대 피크 수 (이 수를 넘지 않는 가장 촘촘한 레벨)
+    """
+    if resolution:
+        for index, (frames_per_peak, _) in enumerate(available):
+            if frames_per_peak >= resolution:
+                return index
+        return len(available) - 1
+
+    for index, (_, count) in enumerate(available):
+        if count <= points:
+            return index
+    return len(available) - 1
+
+
+def read_peaks(path: str, resolution: Optional[int] = None, points: int = DEFAULT_POINTS) -> PeakLevel:
+    """
+    피크 사이드카에서 한 레벨만 읽기
+
+    Args:
+        path: .peaks 파일 경로
+        resolution: 피크당 프레임 수 (없으면 points 기준)
+        points: 최대 피크 수
+
+    Raises:
+        ValueError: 형식이 맞지 않는 파일
+    """
+    header_size = struct.calcsize(HEADER_FORMAT)
+    level_size = struct.calcsize(LEVEL_FORMAT)
+
+    with open(path, "rb") as f:
+        magic, version, _, level_count, sample_rate, frame_count = struct.unpack(
+            HEADER_FORMAT, f.read(header_size)
+        )
+        if magic != PEAKS_MAGIC or version != PEAKS_VERSION:
+            raise ValueError("지원하지 않는 피크 파일 형식입니다.")
+
+        table = [struct.unpack(LEVEL_FORMAT, f.read(level_size)) for _ in range(level_count)]
+        index = choose_level(table, resolution, points)
+
+        offset = header_size + level_size * level_count
+        offset += sum(count * 4 for _, count in table[:index])
+        f.seek(offset)
+
+        frames_per_peak, count = table[index]
+        data = array("h")
+        data.frombytes(f.read(count * 4))
+        if sys.byteorder == "big":
+            data.byteswap()
+
+    return PeakLevel(
+        sample_rate=sample_rate,
+        frame_count=frame_count,
+        frames_per_peak=frames_per_peak,
+        data=data,
+        available=[frames for frames, _ in table],
+    )
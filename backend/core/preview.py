@@ -0,0 +1,182 @@
+# [advice from AI] 미리듣기용 저용량 오디오(Opus/MP3) 생성 및 캐시 관리 모듈
+import os
+import hashlib
+import subprocess
+import threading
+import time
+from typing import Dict, Optional
+
+from backend.config import get_settings
+
+
+# 형식별 (확장자, ffmpeg 인코더, ffmpeg 출력 포맷, Content-Type)
+PREVIEW_FORMATS = {
+    "opus": ("opus", "libopus", "ogg", "audio/ogg"),
+    "mp3": ("mp3", "libmp3lame", "mp3", "audio/mpeg"),
+}
+
+# 재생할 때마다 수정 시각을 갱신하지 않도록 하는 최소 간격 (초)
+TOUCH_INTERVAL = 60
+
+# 같은 미리듣기 파일을 동시에 두 번 인코딩하지 않도록 경로별 잠금
+_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+class PreviewError(Exception):
+    """미리듣기 파일 생성 실패 (ffmpeg 없음, 인코딩 오류 등)"""
+
+
+def preview_bitrate(fmt: str) -> str:
+    """형식별 설정 비트레이트"""
+    settings = get_settings()
+    return settings.preview_opus_bitrate if fmt == "opus" else settings.preview_mp3_bitrate
+
+
+def preview_key(wav_path: str, fmt: str) -> str:
+    """
+    미리듣기 캐시 키
+
+    WAV의 inode/크기/수정 시각으로 만들므로 결과 캐시로 하드링크된 작업끼리는
+    같은 미리듣기를 공유하고, 재합성으로 WAV가 바뀌면 키도 바뀐다.
+    """
+    stat = os.stat(wav_path)
+    raw = f"{stat.st_dev}|{stat.st_ino}|{stat.st_size}|{stat.st_mtime_ns}|{fmt}|{preview_bitrate(fmt)}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:24]
+
+
+def preview_path(wav_path: str, fmt: str) -> str:
+    """WAV에 대응하는 미리듣기 파일 경로"""
+    settings = get_settings()
+    ext = PREVIEW_FORMATS[fmt][0]
+    return os.path.join(settings.preview_dir, f"{preview_key(wav_path, fmt)}.{ext}")
+
+
+def _path_lock(path: str) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(path, threading.Lock())
+
+
+def _encode(wav_path: str, output_path: str, fmt: str):
+    """ffmpeg로 WAV를 읽는 대로 인코딩 (PCM 전체를 메모리에 올리지 않음)"""
+    _, codec, container, _ = PREVIEW_FORMATS[fmt]
+    temp_path = f"{output_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    command = [
+        "ffmpeg", "-nostdin", "-v", "error", "-y",
+        "-i", wav_path,
+        "-vn", "-ac", "1",
+        "-c:a", codec, "-b:a", preview_bitrate(fmt),
+        "-f", container, temp_path,
+    ]
+    try:
+        completed = subprocess.run(command, capture_output=True)
+    except OSError as e:
+        raise PreviewError(f"ffmpeg를 실행할 수 없습니다: {e}")
+
+    if completed.returncode != 0:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        message = completed.stderr.decode("utf-8", "replace").strip().splitlines()
+        raise PreviewError(message[-1] if message else "미리듣기 인코딩 실패")
+
+    os.replace(temp_path, output_path)
+
+
+def ensure_preview(wav_path: str, fmt: Optional[str] = None) -> str:
+    """
+    미리듣기 파일이 없으면 생성하고 경로 반환 (동기 함수 - 스레드에서 호출)
+
+    새로 만든 경우 캐시 크기 제한에 맞춰 오래 쓰지 않은 파일을 정리하고,
+    이미 있으면 사용 시각(수정 시각)만 갱신한다.
+
+    Args:
+        wav_path: 원본 WAV 경로
+        fmt: opus 또는 mp3 (없으면 설정값)
+
+    Raises:
+        PreviewError: 인코딩 실패
+    """
+    settings = get_settings()
+    fmt = fmt or settings.preview_format
+    if fmt not in PREVIEW_FORMATS:
+        raise PreviewError(f"지원하지 않는 미리듣기 형식입니다: {fmt}")
+
+    path = preview_path(wav_path, fmt)
+    if os.path.exists(path):
+        touch_preview(path)
+        return path
+
+    with _path_lock(path):
+        if not os.path.exists(path):
+            os.makedirs(settings.preview_dir, exist_ok=True)
+            _encode(wav_path, path, fmt)
+            evict_previews(keep=path)
+
+    with _locks_guard:
+        _locks.pop(path, None)
+    return path
+
+
+def touch_preview(path: str):
+    """사용 시각 갱신 (LRU 정리 기준, TOUCH_INTERVAL마다 한 번)"""
+    try:
+        if time.time() - os.stat(path).st_mtime > TOUCH_INTERVAL:
+            os.utime(path)
+    except OSError:
+        pass
+
+
+def evict_previews(keep: Optional[str] = None) -> int:
+    """
+    캐시 크기 제한을 넘으면 오래 쓰지 않은 미리듣기부터 삭제
+
+    Args:
+        keep: 지우지 않을 파일 (방금 만든 파일)
+
+    Returns:
+        삭제한 파일 수
+    """
+    settings = get_settings()
+    limit = settings.preview_cache_max_mb * 1024 * 1024
+    if limit <= 0:
+        return 0
+
+    entries = []
+    total = 0
+    with os.scandir(settings.preview_dir) as it:
+        for entry in it:
+            if not entry.is_file() or entry.name.endswith(".tmp"):
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def remove_previews(wav_path: str):
+    """WAV의 미리듣기 파일 삭제 (하드링크로 공유 중인 다른 작업이 없을 때만)"""
+    try:
+        if os.stat(wav_path).st_nlink > 1:
+            return
+    except OSError:
+        return
+    for fmt in PREVIEW_FORMATS:
+        try:
+            os.remove(preview_path(wav_path, fmt))
+        except OSError:
+            pass
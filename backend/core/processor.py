@@ -1,20 +1,32 @@
 # [advice from AI] 전체 처리 프로세스 관리 모듈
 import os
 import json
+import hashlib
 import asyncio
+import threading
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from backend.config import get_settings
 from backend.database import get_session_maker
 from backend.models.job import Job, JobStatus
-from backend.core.parser import parse_script, validate_script
+from backend.core.parser import ParsedScript, parse_script_file, validate_parsed
 from backend.core.timestamp import generate_timestamps, get_total_duration, TimestampedDialogue
-from backend.core.tts_client import TTSClient
+from backend.core.tts_client import TTSClient, TTSCancelled
 from backend.core.audio_mixer import AudioMixer
+from backend.core.cache import (
+    find_cached_job,
+    apply_cached_result,
+    file_digest,
+    default_seed,
+)
+from backend.core.storage import job_segment_dir, job_output_paths, remove_files, peaks_filename
+from backend.core.preview import ensure_preview, PreviewError
+from backend.core.utterance_index import store_utterances, store_utterances_from_json, copy_utterances
 
 
 async def update_job_status(
@@ -25,14 +37,15 @@ async def update_job_status(
     output_filename: Optional[str] = None,
     duration_seconds: Optional[float] = None,
     json_filename: Optional[str] = None,
+    tts_characters: Optional[int] = None,
 ):
-    """작업 상태 업데이트"""
+    """작업 상태 업데이트 (취소된 작업은 그대로 둠)"""
     async_session = get_session_maker()
     async with async_session() as session:
         result = await session.execute(select(Job).where(Job.id == job_id))
         job = result.scalar_one_or_none()
         
-        if job:
+        if job and job.status != JobStatus.CANCELLED:
             job.status = status
             job.progress = progress
             job.updated_at = datetime.utcnow()
@@ -45,19 +58,154 @@ async def update_job_status(
                 job.duration_seconds = duration_seconds
             if json_filename:
                 job.json_filename = json_filename
+            if tts_characters is not None:
+                job.tts_characters = tts_characters
             if status == JobStatus.COMPLETED:
                 job.completed_at = datetime.utcnow()
             
             await session.commit()
 
 
+# [advice from AI] 취소된 작업 마무리 (진행률은 취소 시점 값 유지)
+async def finish_cancelled(job_id: str, version: int, tts_characters: int) -> bool:
+    """
+    취소 상태와 취소 전까지 TTS로 보낸 글자 수 기록
+
+    취소 정리 중에 대화록이 수정되어 새 버전이 등록됐으면 그 버전의 상태를 덮어쓰지 않도록
+    실행한 버전일 때만 갱신한다.
+
+    Returns:
+        갱신했으면 True (새 버전으로 바뀌었거나 삭제됐으면 False)
+    """
+    async_session = get_session_maker()
+    async with async_session() as session:
+        result = await session.execute(
+            update(Job)
+            .where(Job.id == job_id, func.coalesce(Job.version, 1) == version)
+            .values(
+                status=JobStatus.CANCELLED,
+                tts_characters=tts_characters,
+                updated_at=datetime.utcnow(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        return result.rowcount > 0
+
+
+def raise_if_cancelled(cancel_event: Optional[threading.Event]):
+    """취소 신호가 있으면 TTSCancelled (단계 사이 확인용)"""
+    if cancel_event is not None and cancel_event.is_set():
+        raise TTSCancelled("작업이 취소되었습니다.")
+
+
+# [advice from AI] 작업 설정값(JSON) 일부 저장
+async def save_job_settings(job_id: str, **values):
+    """작업 설정값 갱신 (음성 할당 등)"""
+    async_session = get_session_maker()
+    async with async_session() as session:
+        job = await session.get(Job, job_id)
+        if job:
+            job.update_settings(**values)
+            await session.commit()
+
+
+# [advice from AI] 파싱 결과를 작업에 저장
+async def save_parsed_script(job_id: str, parsed: ParsedScript):
+    """파싱 결과(JSON) 저장"""
+    async_session = get_session_maker()
+    async with async_session() as session:
+        job = await session.get(Job, job_id)
+        if job:
+            job.parsed_script = json.dumps(parsed.to_dict(), ensure_ascii=False)
+            await session.commit()
+
+
+# [advice from AI] 발화별 TTS 세그먼트 키 (화자 + 음성 + 대사가 같으면 재사용)
+def segment_key(speaker: str, voice_id: Optional[str], text: str) -> str:
+    """세그먼트 파일 식별 키"""
+    raw = f"{speaker}\0{voice_id or ''}\0{text}".encode('utf-8')
+    return hashlib.sha1(raw).hexdigest()[:20]
+
+
+def versioned_name(job_id: str, version: int, ext: str) -> str:
+    """버전별 출력 파일명 (1버전은 기존 형식 유지)"""
+    if not version or version <= 1:
+        return f"{job_id}.{ext}"
+    return f"{job_id}_v{version}.{ext}"
+
+
+def prune_segments(segment_dir: str, keep: List[str]):
+    """현재 대화록에서 쓰이지 않는 세그먼트 삭제"""
+    if not os.path.isdir(segment_dir):
+        return
+    keep_names = set(os.path.basename(path) for path in keep)
+    stale = [
+        os.path.join(segment_dir, name)
+        for name in os.listdir(segment_dir)
+        if name not in keep_names
+    ]
+    remove_files(stale)
+
+
+# [advice from AI] 결과를 재사용한 작업의 발화 색인 (원본 발화 복사, 없으면 JSON에서)
+async def index_cached_utterances(session, job: Job, source: Job):
+    """캐시로 완료 처리한 작업의 발화를 utterances 테이블에 저장 (커밋은 호출 측)"""
+    if await copy_utterances(session, source.id, job.id):
+        return
+    settings = get_settings()
+    await store_utterances_from_json(session, job.id, os.path.join(settings.output_dir, job.json_filename))
+
+
+# [advice from AI] 같은 캐시 키로 대기 중인 작업(후속 작업) 처리
+async def resolve_cache_followers(job_id: str, error_message: Optional[str] = None):
+    """
+    원본 작업이 끝난 뒤 결과를 기다리던 작업들을 완료(또는 실패) 처리
+
+    Args:
+        job_id: 원본 작업 ID
+        error_message: 원본 작업이 실패한 경우 에러 메시지
+    """
+    async_session = get_session_maker()
+    async with async_session() as session:
+        result = await session.execute(
+            select(Job).where(
+                Job.cache_source_id == job_id,
+                Job.status == JobStatus.PENDING,
+            )
+        )
+        followers = result.scalars().all()
+        if not followers:
+            return
+        
+        source = await session.get(Job, job_id)
+        
+        for follower in followers:
+            if error_message or not source or source.status != JobStatus.COMPLETED:
+                follower.status = JobStatus.FAILED
+                follower.error_message = f"원본 작업 실패: {error_message or '결과 없음'}"
+                follower.updated_at = datetime.utcnow()
+                continue
+            try:
+                apply_cached_result(follower, source)
+                await index_cached_utterances(session, follower, source)
+            except Exception as e:
+                follower.status = JobStatus.FAILED
+                follower.error_message = f"캐시 결과 연결 실패: {str(e)}"
+                follower.updated_at = datetime.utcnow()
+        
+        await session.commit()
+
+
 # [advice from AI] 발화 정보 JSON 파일 생성 함수 추가
 def generate_utterances_json(
     call_id: str,
     audio_filename: str,
     timestamped_dialogues: List[TimestampedDialogue],
     output_path: str,
-) -> str:
+    sample_rate: Optional[int] = None,
+    placements: Optional[List[Tuple[int, int]]] = None,
+) -> List[Dict]:
     """
     발화 정보가 담긴 JSON 파일 생성
     
@@ -66,9 +214,11 @@ def generate_utterances_json(
         audio_filename: WAV 파일명
         timestamped_dialogues: 타임스탬프가 적용된 대화 목록
         output_path: JSON 출력 경로
+        sample_rate: WAV 샘플레이트 (placements와 함께 기록)
+        placements: 발화별 WAV 내 실제 (시작, 끝) 샘플 위치 (AudioMixer.placements)
         
     Returns:
-        저장된 JSON 파일 경로
+        발화 목록 (JSON의 utterances와 같은 값)
     """
     utterances = []
     
@@ -83,6 +233,9 @@ def generate_utterances_json(
             "started_at": round(ts_dialogue.start_time, 3),
             "ended_at": round(ts_dialogue.end_time, 3),
         }
+        # [advice from AI] 샘플 오프셋 기록 (발화 단위 WAV 클립을 디코딩 없이 잘라내기 위함)
+        if placements:
+            utterance["start_sample"], utterance["end_sample"] = placements[idx - 1]
         utterances.append(utterance)
     
     json_data = {
@@ -90,14 +243,20 @@ def generate_utterances_json(
         "audio_file": audio_filename,
         "utterances": utterances,
     }
+    if placements and sample_rate:
+        json_data["sample_rate"] = sample_rate
     
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(json_data, f, ensure_ascii=False, indent=2)
     
-    return output_path
+    return utterances
 
 
-async def process_script(job_id: str):
+async def process_script(
+    job_id: str,
+    version: Optional[int] = None,
+    cancel_event: Optional[threading.Event] = None,
+):
     """
     대화록 처리 메인 프로세스
     
@@ -106,100 +265,167 @@ async def process_script(job_id: str):
     3. TTS 음성 생성
     4. 오디오 합성
     5. 결과 저장
+    
+    [advice from AI] cancel_event가 설정되면(스케줄러 cancel) 단계 사이와 TTS 응답 청크 사이에서 멈추고,
+    남은 발화는 합성하지 않고 임시 파일을 지운 뒤 취소 상태와 사용한 글자 수를 기록한다.
+    version은 스케줄러에 등록할 때의 작업 버전이며, 그 사이 대화록이 수정되어 버전이 바뀌었으면
+    새 버전의 등록이 처리하므로 건너뛴다. (없으면 조회한 버전으로 처리)
     """
     settings = get_settings()
+    tts_characters = 0
+    temp_audio_path: Optional[str] = None
     
     try:
         # 작업 정보 조회
         async_session = get_session_maker()
         async with async_session() as session:
-            result = await session.execute(select(Job).where(Job.id == job_id))
+            result = await session.execute(
+                select(Job).where(Job.id == job_id).options(undefer(Job.parsed_script))
+            )
             job = result.scalar_one_or_none()
             
-            if not job:
+            if not job or job.status == JobStatus.CANCELLED:
+                return
+            if version is not None and (job.version or 1) != version:
+                return
+            version = job.version or 1
+            tts_characters = job.tts_characters or 0
+            
+            # [advice from AI] 같은 대화록/설정으로 완료된 작업이 있으면 결과 재사용
+            source = await find_cached_job(session, job.content_hash, exclude_id=job_id)
+            if source:
+                previous_outputs = job_output_paths(job)
+                apply_cached_result(job, source)
+                await index_cached_utterances(session, job, source)
+                await session.commit()
+                current_outputs = set(job_output_paths(job))
+                remove_files([path for path in previous_outputs if path not in current_outputs])
+                await resolve_cache_followers(job_id)
+                print(f"♻️ 캐시 재사용: {job_id} ← {source.id}")
                 return
             
             filename = job.filename
+            previous_outputs = job_output_paths(job)
+            saved_voices: Dict[str, str] = job.load_settings().get("voice_assignments", {})
+            seed = job.seed
+            parsed_json = job.parsed_script
         
         # === 1단계: 파싱 ===
         await update_job_status(job_id, JobStatus.PARSING, progress=10)
         
-        file_path = os.path.join(settings.upload_dir, filename)
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # 유효성 검증
-        is_valid, errors = validate_script(content)
-        if not is_valid:
-            await update_job_status(
-                job_id,
-                JobStatus.FAILED,
-                error_message=f"파싱 실패: {', '.join(errors)}"
-            )
-            return
-        
-        # 파싱
-        parsed = parse_script(content)
+        if parsed_json:
+            # [advice from AI] 저장된 파싱 결과 재사용 (재시도/재합성 시 재파싱 없음)
+            parsed = ParsedScript.from_dict(json.loads(parsed_json))
+        else:
+            file_path = os.path.join(settings.upload_dir, filename)
+            
+            # 파일을 줄 단위로 읽으며 파싱 + 유효성 검증 (한 번만 파싱)
+            parsed = parse_script_file(file_path)
+            errors = validate_parsed(parsed)
+            if errors:
+                await update_job_status(
+                    job_id,
+                    JobStatus.FAILED,
+                    error_message=f"파싱 실패: {', '.join(errors)}"
+                )
+                await resolve_cache_followers(job_id, error_message="파싱 실패")
+                return
+            
+            # [advice from AI] 시드가 없는 기존 작업은 대화록 내용에서 유도하여 저장
+            if seed is None:
+                seed = default_seed(file_digest(file_path))
+                await save_job_settings(job_id, seed=seed)
+            
+            await save_parsed_script(job_id, parsed)
         
         await update_job_status(job_id, JobStatus.PARSING, progress=20)
+        raise_if_cancelled(cancel_event)
         
         # === 2단계: 타임스탬프 생성 ===
-        timestamped = generate_timestamps(parsed)
+        timestamped = generate_timestamps(parsed, seed=seed)
         total_duration = get_total_duration(timestamped)
         
         await update_job_status(job_id, JobStatus.GENERATING_TTS, progress=30)
         
         # === 3단계: TTS 생성 ===
-        tts_client = TTSClient()
+        tts_client = TTSClient(cancel_event=cancel_event)
         
-        # 화자 목록 추출 및 음성 할당
-        speakers = list(set(d.speaker for d in parsed.dialogues))
-        await tts_client.assign_voices(
+        # 화자 목록 추출 (등장 순서 유지) 및 음성 할당 (재합성 시 이전 할당 유지)
+        speakers = list(dict.fromkeys(d.speaker for d in parsed.dialogues))
+        tts_client.set_voice_assignments(saved_voices)
+        voice_assignments = await tts_client.assign_voices(
             speakers,
             voice_agent=settings.voice_agent,
             voice_customer=settings.voice_customer,
+            seed=seed,
         )
+        if voice_assignments != saved_voices:
+            await save_job_settings(job_id, voice_assignments=dict(voice_assignments))
+        
+        # [advice from AI] 발화별 세그먼트는 작업 디렉토리에 보관하여
+        # 대화록 수정 시 바뀐 발화만 다시 합성한다.
+        segment_dir = job_segment_dir(job_id)
+        os.makedirs(segment_dir, exist_ok=True)
         
-        # 각 대화에 대해 TTS 생성
         audio_files = []
-        total_dialogues = len(timestamped)
+        pending: Dict[str, TimestampedDialogue] = {}  # 새로 합성할 세그먼트 경로 -> 대화
+        for ts_dialogue in timestamped:
+            key = segment_key(
+                ts_dialogue.dialogue.speaker,
+                tts_client.get_voice_assignment(ts_dialogue.dialogue.speaker),
+                ts_dialogue.dialogue.text,
+            )
+            segment_path = os.path.join(segment_dir, f"{key}.mp3")
+            audio_files.append(segment_path)
+            if not os.path.exists(segment_path):
+                pending.setdefault(segment_path, ts_dialogue)
+        
+        total_pending = len(pending)
         
-        for idx, ts_dialogue in enumerate(timestamped):
+        for idx, (segment_path, ts_dialogue) in enumerate(pending.items()):
             # 진행률 계산 (30% ~ 80%)
-            progress = 30 + int((idx / total_dialogues) * 50)
-            await update_job_status(job_id, JobStatus.GENERATING_TTS, progress=progress)
+            progress = 30 + int((idx / total_pending) * 50)
+            await update_job_status(
+                job_id, JobStatus.GENERATING_TTS, progress=progress, tts_characters=tts_characters
+            )
+            raise_if_cancelled(cancel_event)
             
-            # 임시 오디오 파일 경로
+            # TTS 생성 (임시 파일에 쓴 뒤 세그먼트로 이동 - 중단 시 깨진 세그먼트 방지)
             temp_audio_path = os.path.join(
                 settings.temp_dir,
                 f"{job_id}_{idx}.mp3"
             )
-            
-            # TTS 생성
+            # 요청을 보낸 글자는 중간에 끊어도 사용량으로 본다
+            tts_characters += len(ts_dialogue.dialogue.text)
             await tts_client.generate_speech_mp3(
                 text=ts_dialogue.dialogue.text,
                 speaker=ts_dialogue.dialogue.speaker,
                 output_path=temp_audio_path,
             )
-            
-            audio_files.append(temp_audio_path)
+            os.replace(temp_audio_path, segment_path)
+            temp_audio_path = None
             
             # API 레이트 리밋 방지를 위한 짧은 대기
             await asyncio.sleep(0.1)
         
+        if total_pending < len(timestamped):
+            print(f"♻️ 세그먼트 재사용: {job_id} ({len(timestamped) - total_pending}/{len(timestamped)})")
+        
         # === 4단계: 오디오 합성 ===
-        await update_job_status(job_id, JobStatus.MIXING, progress=85)
+        await update_job_status(job_id, JobStatus.MIXING, progress=85, tts_characters=tts_characters)
+        raise_if_cancelled(cancel_event)
         
         mixer = AudioMixer()
         
-        output_filename = f"{job_id}.wav"
+        output_filename = versioned_name(job_id, version, "wav")
         output_path = os.path.join(settings.output_dir, output_filename)
+        peaks_path = os.path.join(settings.output_dir, peaks_filename(output_filename))
         
         mixer.mix_dialogues(
             timestamped_dialogues=timestamped,
             audio_files=audio_files,
             output_path=output_path,
+            peaks_path=peaks_path,
         )
         
         # 실제 생성된 오디오 길이 확인
@@ -209,26 +435,37 @@ async def process_script(job_id: str):
         await update_job_status(job_id, JobStatus.MIXING, progress=90)
         
         # [advice from AI] 발화 정보 JSON 파일 생성
-        json_filename = f"{job_id}.json"
+        json_filename = versioned_name(job_id, version, "json")
         json_path = os.path.join(settings.output_dir, json_filename)
         
-        generate_utterances_json(
+        utterances = generate_utterances_json(
             call_id=job_id,
             audio_filename=output_filename,
             timestamped_dialogues=timestamped,
             output_path=json_path,
+            sample_rate=mixer.sample_rate,
+            placements=mixer.placements,
         )
         
         # === 6단계: 정리 및 완료 ===
         await update_job_status(job_id, JobStatus.MIXING, progress=95)
         
-        # 임시 파일 삭제
-        for temp_file in audio_files:
+        # 현재 대화록에서 쓰이지 않는 세그먼트 정리
+        prune_segments(segment_dir, keep=audio_files)
+        
+        # [advice from AI] 미리듣기 파일 미리 생성 (실패해도 첫 재생 때 다시 시도)
+        if settings.preview_eager:
             try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-            except Exception:
-                pass
+                await asyncio.to_thread(ensure_preview, output_path)
+            except PreviewError as e:
+                print(f"⚠️ 미리듣기 생성 실패 ({job_id}): {e}")
+        
+        raise_if_cancelled(cancel_event)
+        
+        # [advice from AI] 발화 색인 (미리보기/전체 검색용, 재합성 시 교체)
+        async with get_session_maker()() as session:
+            await store_utterances(session, job_id, utterances)
+            await session.commit()
         
         # 완료
         await update_job_status(
@@ -238,10 +475,32 @@ async def process_script(job_id: str):
             output_filename=output_filename,
             duration_seconds=actual_duration,
             json_filename=json_filename,
+            tts_characters=tts_characters,
         )
+        await resolve_cache_followers(job_id)
+        
+        # 이전 버전 출력 파일 정리
+        current_outputs = {output_path, json_path, peaks_path}
+        remove_files([path for path in previous_outputs if path not in current_outputs])
         
         print(f"✅ 작업 완료: {job_id} ({actual_duration:.1f}초, JSON 포함)")
         
+    except (TTSCancelled, asyncio.CancelledError):
+        # 취소 신호 없이 태스크만 취소된 경우(서버 종료)는 상태를 바꾸지 않음
+        if cancel_event is None or not cancel_event.is_set():
+            raise
+        
+        # [advice from AI] 받다 만 임시 파일 정리 후 취소 기록
+        # (완성된 세그먼트는 이미 사용한 분량이라 남겨 두어 대화록 수정 후 재합성 때 재사용)
+        if temp_audio_path:
+            remove_files([temp_audio_path])
+        if version is None:
+            # 작업을 조회하기 전에 취소됨 - 사용한 글자 수가 없고 상태는 취소 API가 기록
+            return
+        if await finish_cancelled(job_id, version, tts_characters):
+            await resolve_cache_followers(job_id, error_message="원본 작업 취소")
+        print(f"🛑 작업 취소: {job_id} (TTS {tts_characters}자 사용)")
+        
     except Exception as e:
         error_msg = str(e)
         print(f"❌ 작업 실패: {job_id} - {error_msg}")
@@ -250,5 +509,7 @@ async def process_script(job_id: str):
             job_id,
             JobStatus.FAILED,
             error_message=error_msg,
+            tts_characters=tts_characters,
         )
+        await resolve_cache_followers(job_id, error_message=error_msg)
 
@@ -0,0 +1,238 @@
+# [advice from AI] 작업 스케줄러 모듈 (동시 처리 수 제한 + 우선순위/배치별 공정 대기열)
+import heapq
+import asyncio
+import threading
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.config import get_settings
+from backend.models.job import JobPriority
+
+
+# 우선순위별 가중치 (가중치가 클수록 같은 시간에 더 많은 작업을 시작)
+PRIORITY_WEIGHTS: Dict[JobPriority, int] = {
+    JobPriority.LOW: 1,
+    JobPriority.NORMAL: 4,
+    JobPriority.HIGH: 16,
+}
+
+
+class JobScheduler:
+    """
+    process_script 실행을 max_concurrent_jobs 개로 제한하는 대기열
+
+    대량 업로드 시 작업마다 코루틴을 바로 띄우지 않고 대기열에 넣었다가
+    실행 중인 작업이 끝날 때마다 다음 작업을 시작한다.
+
+    [advice from AI] 대기열은 흐름(배치, 배치가 없으면 작업 하나)별 가중 공정 대기열
+    (start-time fair queuing)이다. 작업마다 가상 시작 시각 max(현재 가상 시각, 흐름의 마지막 종료 시각)과
+    종료 시각(시작 + 1/가중치)을 매기고 종료 시각이 가장 이른 작업부터 시작한다.
+    3,000개짜리 배치가 먼저 들어와 있어도 나중에 온 단일 작업은 현재 가상 시각 근처의
+    태그를 받아 바로 다음 자리를 차지한다. (이미 실행 중인 작업은 중단하지 않음)
+
+    실행 중인 작업마다 취소 신호(threading.Event)를 두어
+    cancel()하면 TTS 실행기 스레드도 다음 응답 청크에서 멈춘다.
+    취소된 태스크는 정리(임시 파일 삭제, 취소 기록)가 끝날 때까지 따로 두고,
+    그동안 같은 작업이 다시 등록되면 정리가 끝난 뒤에 대기열에 넣는다.
+    """
+
+    def __init__(self, max_concurrent: int):
+        self.max_concurrent = max(1, max_concurrent)
+        # (종료 태그, 순번, 시작 태그, 흐름, 작업 ID, 작업 버전) - 취소/재등록된 항목은 꺼낼 때 건너뜀
+        self._heap: List[Tuple[float, int, float, str, str, Optional[int]]] = []
+        self._seq = count()
+        self._queued: Dict[str, int] = {}           # 대기 중인 작업 -> 유효한 힙 항목 순번
+        self._virtual_time = 0.0
+        self._flow_finish: Dict[str, float] = {}    # 흐름별 마지막 종료 태그
+        self._flow_queued: Dict[str, int] = {}      # 흐름별 대기 작업 수 (0이 되면 흐름 정리)
+        self._running: Dict[str, asyncio.Task] = {}
+        self._cancel_events: Dict[str, threading.Event] = {}
+        self._cleaning: Dict[str, asyncio.Task] = {}    # 취소 후 정리 중인 태스크
+        # 정리 중에 다시 등록된 작업 -> (흐름, 우선순위, 버전)
+        self._deferred: Dict[str, Tuple[Optional[str], JobPriority, Optional[int]]] = {}
+
+    @property
+    def queue_depth(self) -> int:
+        """대기 중인 작업 수 (대기 중 취소된 항목은 힙에 남아 있다가 꺼낼 때 건너뜀, 정리 대기 포함)"""
+        return len(self._queued) + len(self._deferred)
+
+    @property
+    def running_count(self) -> int:
+        """실행 중인 작업 수"""
+        return len(self._running)
+
+    @property
+    def flow_count(self) -> int:
+        """대기 작업이 있는 흐름 수"""
+        return len(self._flow_queued)
+
+    def is_scheduled(self, job_id: str) -> bool:
+        """대기 중이거나 실행 중인 작업인지 확인"""
+        return job_id in self._queued or job_id in self._running or job_id in self._deferred
+
+    def submit(
+        self,
+        job_id: str,
+        flow: Optional[str] = None,
+        priority: JobPriority = JobPriority.NORMAL,
+        version: Optional[int] = None,
+    ) -> bool:
+        """
+        작업을 대기열에 추가
+
+        Args:
+            job_id: 작업 ID
+            flow: 공정 분배 단위 (배치 ID, 없으면 작업 하나가 한 흐름)
+            priority: 우선순위 (PRIORITY_WEIGHTS의 가중치로 흐름의 몫을 정함)
+            version: 등록 시점의 작업 버전 (process_script가 더 새 버전이면 건너뛰고,
+                취소 기록도 이 버전일 때만 남김)
+
+        Returns:
+            새로 추가되면 True (이미 대기/실행 중이면 False)
+        """
+        if self.is_scheduled(job_id):
+            return False
+        if job_id in self._cleaning:
+            # 이전 실행이 아직 정리 중 - 같은 임시 파일/상태를 건드리지 않도록 끝난 뒤 등록
+            self._deferred[job_id] = (flow, priority, version)
+            return True
+        flow = flow or job_id
+        weight = PRIORITY_WEIGHTS.get(JobPriority(priority or JobPriority.NORMAL), 1)
+
+        start = max(self._virtual_time, self._flow_finish.get(flow, 0.0))
+        finish = start + 1.0 / weight
+        self._flow_finish[flow] = finish
+        self._flow_queued[flow] = self._flow_queued.get(flow, 0) + 1
+
+        seq = next(self._seq)
+        self._queued[job_id] = seq
+        heapq.heappush(self._heap, (finish, seq, start, flow, job_id, version))
+        self._pump()
+        return True
+
+    def submit_many(self, jobs: Iterable) -> int:
+        """
+        여러 작업을 대기열에 추가하고 추가된 수 반환
+
+        Args:
+            jobs: id, batch_id, priority, version 속성이 있는 작업 (Job 객체 또는 RETURNING 행)
+        """
+        return sum(
+            1 for job in jobs
+            if self.submit(job.id, job.batch_id, job.priority, getattr(job, "version", None))
+        )
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        작업 취소
+
+        대기 중이면 대기열에서 빼고, 실행 중이면 취소 신호를 보내고 태스크를 취소한 뒤
+        정리(process_script의 취소 처리)를 기다리지 않고 바로 다음 대기 작업을 시작한다.
+        (정리 중인 태스크는 _cleaning에 남아 같은 작업의 재등록을 미룸)
+
+        Returns:
+            대기/실행 중이던 작업이면 True
+        """
+        if job_id in self._queued:
+            del self._queued[job_id]
+            return True
+        if job_id in self._deferred:
+            del self._deferred[job_id]
+            return True
+        task = self._running.pop(job_id, None)
+        if task is None:
+            return False
+        self._cleaning[job_id] = task
+        self._cancel_events.pop(job_id).set()
+        task.cancel()
+        self._pump()
+        return True
+
+    def cancel_many(self, job_ids: Iterable[str]) -> int:
+        """여러 작업 취소 후 취소된(대기/실행 중이던) 수 반환"""
+        return sum(1 for job_id in job_ids if self.cancel(job_id))
+
+    def _release_flow(self, flow: str):
+        """흐름의 대기 작업 수 감소 (비면 흐름 상태 삭제 - 다시 오면 현재 가상 시각부터)"""
+        remaining = self._flow_queued.get(flow, 0) - 1
+        if remaining > 0:
+            self._flow_queued[flow] = remaining
+        else:
+            self._flow_queued.pop(flow, None)
+            self._flow_finish.pop(flow, None)
+
+    def _pop_next(self) -> Optional[Tuple[str, Optional[int]]]:
+        """종료 태그가 가장 이른 유효한 작업(ID, 버전) 꺼내기 (가상 시각을 그 작업의 시작 태그로)"""
+        while self._heap:
+            finish, seq, start, flow, job_id, version = heapq.heappop(self._heap)
+            self._release_flow(flow)
+            if self._queued.get(job_id) != seq:
+                continue
+            del self._queued[job_id]
+            self._virtual_time = max(self._virtual_time, start)
+            return job_id, version
+        return None
+
+    def _pump(self):
+        """빈 자리만큼 대기 작업 시작"""
+        while len(self._running) < self.max_concurrent:
+            entry = self._pop_next()
+            if entry is None:
+                break
+            job_id, version = entry
+            cancel_event = threading.Event()
+            self._cancel_events[job_id] = cancel_event
+            self._running[job_id] = asyncio.create_task(self._run(job_id, version, cancel_event))
+
+    async def _run(self, job_id: str, version: Optional[int], cancel_event: threading.Event):
+        """작업 실행 후 다음 대기 작업 시작"""
+        from backend.core.processor import process_script
+
+        try:
+            await process_script(job_id, version=version, cancel_event=cancel_event)
+        except Exception as e:
+            print(f"❌ 스케줄러 작업 실패 ({job_id}): {e}")
+        finally:
+            task = asyncio.current_task()
+            if self._running.get(job_id) is task:
+                self._running.pop(job_id, None)
+                self._cancel_events.pop(job_id, None)
+            elif self._cleaning.get(job_id) is task:
+                # 취소 정리가 끝났으므로 그동안 다시 등록된 작업을 대기열에 넣음
+                self._cleaning.pop(job_id, None)
+                deferred = self._deferred.pop(job_id, None)
+                if deferred is not None:
+                    self.submit(job_id, *deferred)
+            self._pump()
+
+    def shutdown(self):
+        """대기열 비우고 실행 중인 작업 취소 (서버 종료 시)"""
+        self._heap.clear()
+        self._queued.clear()
+        self._flow_finish.clear()
+        self._flow_queued.clear()
+        for task in self._running.values():
+            task.cancel()
+        self._running.clear()
+        self._cancel_events.clear()
+        self._cleaning.clear()
+        self._deferred.clear()
+
+
+_scheduler: Optional[JobScheduler] = None
+
+
+def get_scheduler() -> JobScheduler:
+    """스케줄러 싱글톤 반환"""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = JobScheduler(get_settings().max_concurrent_jobs)
+    return _scheduler
+
+
+def shutdown_scheduler():
+    """스케줄러 종료"""
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.shutdown()
+        _scheduler = None
@@ -0,0 +1,77 @@
+# [advice from AI] 작업 파일 저장소 관리 모듈 (경로 계산 및 삭제)
+import os
+import shutil
+from typing import List, Set
+
+from backend.config import get_settings
+from backend.models.job import Job
+from backend.core.preview import remove_previews
+from backend.core.zipstream import ZipEntry, unique_arcname
+
+
+def job_segment_dir(job_id: str) -> str:
+    """작업별 TTS 세그먼트 디렉토리 경로"""
+    settings = get_settings()
+    return os.path.join(settings.segment_dir, job_id)
+
+
+# [advice from AI] WAV 옆에 저장하는 파형 피크 사이드카
+def peaks_filename(output_filename: str) -> str:
+    """출력 WAV 파일명에 대응하는 피크 파일명"""
+    return f"{os.path.splitext(output_filename)[0]}.peaks"
+
+
+def job_output_paths(job: Job) -> List[str]:
+    """작업의 출력 파일 경로 목록 (WAV, JSON, 피크)"""
+    settings = get_settings()
+    paths = []
+    for filename in (job.output_filename, job.json_filename):
+        if filename:
+            paths.append(os.path.join(settings.output_dir, filename))
+    if job.output_filename:
+        paths.append(os.path.join(settings.output_dir, peaks_filename(job.output_filename)))
+    return paths
+
+
+def remove_files(paths: List[str]):
+    """파일 목록 삭제 (없는 파일은 무시, WAV는 미리듣기 캐시도 함께 삭제)"""
+    for path in paths:
+        if path.endswith(".wav"):
+            remove_previews(path)
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def remove_job_files(job: Job):
+    """
+    작업과 관련된 모든 파일 삭제
+
+    업로드 원본, 출력 WAV/JSON, 발화별 세그먼트 디렉토리
+    """
+    settings = get_settings()
+
+    paths = job_output_paths(job)
+    if job.filename:
+        paths.append(os.path.join(settings.upload_dir, job.filename))
+    remove_files(paths)
+
+    shutil.rmtree(job_segment_dir(job.id), ignore_errors=True)
+
+
+# [advice from AI] 작업 결과(WAV + JSON)를 ZIP 항목으로 변환 (개별/선택/배치 다운로드 공용)
+def job_zip_entries(job: Job, used_names: Set[str]) -> List[ZipEntry]:
+    """작업의 출력 파일을 원본 이름 기반 ZIP 항목으로 (이름 중복 시 번호 추가)"""
+    settings = get_settings()
+    base_name = os.path.splitext(job.original_filename)[0]
+
+    entries = []
+    for filename, ext in ((job.output_filename, "wav"), (job.json_filename, "json")):
+        if not filename:
+            continue
+        path = os.path.join(settings.output_dir, filename)
+        if os.path.exists(path):
+            entries.append(ZipEntry(path=path, arcname=unique_arcname(f"{base_name}.{ext}", used_names)))
+    return entries
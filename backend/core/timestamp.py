@@ -1,12 +1,16 @@
 # [advice from AI] 타임스탬프 생성 모듈
 import random
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional, Iterable, Iterator
 
 from backend.config import get_settings
 from backend.core.parser import Dialogue, ParsedScript
 
 
+# 같은 화자 연속 발화 시 간격 범위 (초)
+SAME_SPEAKER_GAP = (0.2, 0.5)
+
+
 @dataclass
 class TimestampedDialogue:
     """타임스탬프가 적용된 대화"""
@@ -46,6 +50,7 @@ def calculate_pause_duration(
     delays: List[float],
     turn_gap_min: float = 0.5,
     turn_gap_max: float = 1.5,
+    rng: Optional[random.Random] = None,
 ) -> float:
     """
     대화 간 무음(pause) 시간 계산
@@ -56,10 +61,12 @@ def calculate_pause_duration(
         delays: [DELAY: Xs] 태그에서 추출된 지연 시간 목록
         turn_gap_min: 화자 교체 시 최소 간격
         turn_gap_max: 화자 교체 시 최대 간격
+        rng: 난수 생성기 (없으면 전역 random 사용)
         
     Returns:
         무음 시간 (초)
     """
+    rng = rng or random
     pause = 0.0
     
     # 명시된 DELAY가 있으면 합산
@@ -68,10 +75,10 @@ def calculate_pause_duration(
     
     # 화자 교체 시 턴테이킹 간격 추가
     if prev_speaker and prev_speaker != curr_speaker:
-        pause += random.uniform(turn_gap_min, turn_gap_max)
+        pause += rng.uniform(turn_gap_min, turn_gap_max)
     elif prev_speaker == curr_speaker:
         # 같은 화자 연속 발화 시 짧은 간격
-        pause += random.uniform(0.2, 0.5)
+        pause += rng.uniform(*SAME_SPEAKER_GAP)
     
     return pause
 
@@ -107,23 +114,27 @@ def calculate_action_duration(actions: List[str], base_duration: float = 2.0) ->
     return total
 
 
-def generate_timestamps(parsed: ParsedScript) -> List[TimestampedDialogue]:
+def iter_timestamps(
+    dialogues: Iterable[Dialogue],
+    seed: Optional[int] = None,
+) -> Iterator[TimestampedDialogue]:
     """
-    파싱된 대화록에 타임스탬프 생성
+    대화에 타임스탬프를 적용하며 하나씩 생성 (스트리밍 파서와 연결 가능)
     
     Args:
-        parsed: 파싱된 대화록
+        dialogues: 대화 목록 (제너레이터 가능)
+        seed: 무음 간격 난수 시드 (같은 시드 -> 같은 타임라인)
         
-    Returns:
-        타임스탬프가 적용된 대화 목록
+    Yields:
+        타임스탬프가 적용된 대화
     """
     settings = get_settings()
+    rng = random.Random(seed)
     
-    timestamped: List[TimestampedDialogue] = []
     current_time = 0.0
     prev_speaker = ""
     
-    for dialogue in parsed.dialogues:
+    for dialogue in dialogues:
         # 1. 이전 대화 후 무음 시간 계산
         pause_before = calculate_pause_duration(
             prev_speaker=prev_speaker,
@@ -131,6 +142,7 @@ def generate_timestamps(parsed: ParsedScript) -> List[TimestampedDialogue]:
             delays=dialogue.delays,
             turn_gap_min=settings.turn_gap_min,
             turn_gap_max=settings.turn_gap_max,
+            rng=rng,
         )
         
         # 2. ACTION 태그에 따른 추가 시간 (발화 전에 발생)
@@ -149,20 +161,102 @@ def generate_timestamps(parsed: ParsedScript) -> List[TimestampedDialogue]:
         start_time = current_time + pause_before + action_duration
         end_time = start_time + speech_duration + settings.silence_padding
         
-        timestamped_dialogue = TimestampedDialogue(
+        yield TimestampedDialogue(
             dialogue=dialogue,
             start_time=start_time,
             end_time=end_time,
             speech_duration=speech_duration,
             pause_before=pause_before + action_duration,
         )
-        timestamped.append(timestamped_dialogue)
         
         # 5. 현재 시간 업데이트
         current_time = end_time
         prev_speaker = dialogue.speaker
+
+
+def generate_timestamps(
+    parsed: ParsedScript,
+    seed: Optional[int] = None,
+) -> List[TimestampedDialogue]:
+    """
+    파싱된 대화록에 타임스탬프 생성
+    
+    Args:
+        parsed: 파싱된 대화록
+        seed: 무음 간격 난수 시드 (같은 시드 -> 같은 타임라인)
+        
+    Returns:
+        타임스탬프가 적용된 대화 목록
+    """
+    return list(iter_timestamps(parsed.dialogues, seed=seed))
+
+
+# [advice from AI] TTS 호출 없이 타임라인 길이 예측 (드라이런 견적용)
+@dataclass
+class TimelineEstimate:
+    """타임라인 예측값 (난수 간격은 기대값, 최소/최대 범위 포함)"""
+    dialogue_count: int = 0
+    characters: int = 0          # TTS 과금 기준 글자 수 (공백 포함)
+    speech_seconds: float = 0.0
+    pause_seconds: float = 0.0   # DELAY + 턴 간격 기대값
+    action_seconds: float = 0.0
+    padding_seconds: float = 0.0
+    min_seconds: float = 0.0
+    max_seconds: float = 0.0
+    
+    @property
+    def total_seconds(self) -> float:
+        """예상 전체 길이 (초)"""
+        return self.speech_seconds + self.pause_seconds + self.action_seconds + self.padding_seconds
+
+
+def estimate_timeline(dialogues: Iterable[Dialogue]) -> TimelineEstimate:
+    """
+    generate_timestamps와 같은 모델로 전체 길이를 한 번에 예측
+    
+    난수로 정해지는 턴 간격은 균등분포의 평균으로 계산하고,
+    최소/최대 간격으로 범위(min/max)를 함께 구한다.
+    
+    Args:
+        dialogues: 대화 목록 (제너레이터 가능)
+        
+    Returns:
+        TimelineEstimate
+    """
+    settings = get_settings()
+    
+    turn_gap = (settings.turn_gap_min, settings.turn_gap_max)
+    estimate = TimelineEstimate()
+    gap_min = gap_max = gap_mean = 0.0
+    prev_speaker = ""
+    
+    for dialogue in dialogues:
+        estimate.dialogue_count += 1
+        estimate.characters += len(dialogue.text)
+        estimate.speech_seconds += calculate_speech_duration(dialogue.text, settings.speech_rate)
+        estimate.action_seconds += calculate_action_duration(dialogue.actions, settings.action_duration)
+        estimate.pause_seconds += sum(dialogue.delays)
+        
+        # calculate_pause_duration과 같은 조건으로 간격 범위 누적
+        if prev_speaker and prev_speaker != dialogue.speaker:
+            low, high = turn_gap
+        elif prev_speaker == dialogue.speaker:
+            low, high = SAME_SPEAKER_GAP
+        else:
+            low = high = 0.0
+        gap_min += low
+        gap_max += high
+        gap_mean += (low + high) / 2
+        
+        prev_speaker = dialogue.speaker
+    
+    estimate.padding_seconds = settings.silence_padding * estimate.dialogue_count
+    fixed = estimate.total_seconds
+    estimate.pause_seconds += gap_mean
+    estimate.min_seconds = fixed + gap_min
+    estimate.max_seconds = fixed + gap_max
     
-    return timestamped
+    return estimate
 
 
 def get_total_duration(timestamped: List[TimestampedDialogue]) -> float:
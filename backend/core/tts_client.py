@@ -2,7 +2,8 @@
 import os
 import random
 import asyncio
-from typing import Optional, List, Dict
+import threading
+from typing import Callable, Optional, List, Dict
 from dataclasses import dataclass
 from pydub import AudioSegment
 from pydub.generators import Sine
@@ -18,6 +19,11 @@ class VoiceInfo:
     labels: Dict[str, str]
 
 
+class TTSCancelled(Exception):
+    """작업 취소로 TTS 요청을 중단함"""
+    pass
+
+
 def get_effective_api_key() -> Optional[str]:
     """유효한 API 키 반환 (런타임 키 우선)"""
     runtime_key = get_runtime_api_key()
@@ -38,8 +44,10 @@ class TTSClient:
         VoiceInfo(voice_id="mock_customer_2", name="Mock Customer 2", labels={"gender": "female"}),
     ]
     
-    def __init__(self):
+    def __init__(self, cancel_event: Optional[threading.Event] = None):
         self.settings = get_settings()
+        # [advice from AI] 작업 취소 신호 (설정되면 진행 중인 응답 수신을 멈추고 TTSCancelled)
+        self.cancel_event = cancel_event
         self._voices_cache: Optional[List[VoiceInfo]] = None
         self._voice_assignments: Dict[str, str] = {}  # speaker -> voice_id
         self._init_client()
@@ -58,6 +66,45 @@ class TTSClient:
             if self.mock_mode:
                 print("⚠️ TTS Mock 모드로 실행됩니다 (테스트용 더미 오디오 생성)")
     
+    def raise_if_cancelled(self):
+        """취소 신호가 있으면 TTSCancelled"""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise TTSCancelled("작업이 취소되었습니다.")
+    
+    def _collect_audio(self, chunks) -> bytes:
+        """
+        스트리밍 응답 청크 수집 (실행기 스레드에서 호출)
+        
+        청크 사이마다 취소 신호를 확인하고, 취소되면 남은 응답을 받지 않고 연결을 닫는다.
+        """
+        parts = []
+        try:
+            for chunk in chunks:
+                self.raise_if_cancelled()
+                parts.append(chunk)
+        finally:
+            close = getattr(chunks, "close", None)
+            if close:
+                close()
+        return b''.join(parts)
+    
+    async def _run_generate(self, generate: Callable[[], str]) -> str:
+        """
+        TTS 요청/저장 함수를 실행기 스레드에서 실행
+
+        태스크가 취소돼도 스레드는 멈추지 않으므로(다음 청크에서 취소 신호 확인) 스레드가 끝날 때까지
+        기다린 뒤 CancelledError를 전달한다. 호출 측이 임시 파일을 정리한 뒤에 스레드가 파일을 쓰는 일이 없다.
+        """
+        future = asyncio.get_running_loop().run_in_executor(None, generate)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            try:
+                await future
+            except Exception:
+                pass
+            raise
+    
     def refresh_client(self):
         """API 키 변경 시 클라이언트 갱신"""
         self._init_client()
@@ -101,6 +148,7 @@ class TTSClient:
         speakers: List[str],
         voice_agent: Optional[str] = None,
         voice_customer: Optional[str] = None,
+        seed: Optional[int] = None,
     ) -> Dict[str, str]:
         """
         화자별 음성 할당
@@ -109,6 +157,7 @@ class TTSClient:
             speakers: 화자 목록
             voice_agent: 상담사 음성 ID (없으면 랜덤)
             voice_customer: 고객 음성 ID (없으면 랜덤)
+            seed: 랜덤 선택 시드 (같은 시드 -> 같은 음성 조합)
             
         Returns:
             화자 -> 음성 ID 매핑
@@ -118,17 +167,19 @@ class TTSClient:
         if not voices:
             raise Exception("사용 가능한 음성이 없습니다.")
         
-        available_ids = [v.voice_id for v in voices]
+        # [advice from AI] API 응답 순서와 무관하게 같은 시드면 같은 결과가 나오도록 정렬
+        available_ids = sorted(v.voice_id for v in voices)
+        rng = random.Random(seed)
         
         for speaker in speakers:
-            if speaker in self._voice_assignments:
+            if self._voice_assignments.get(speaker) in available_ids:
                 continue
             
             if speaker == "상담사":
                 if voice_agent and voice_agent in available_ids:
                     self._voice_assignments[speaker] = voice_agent
                 else:
-                    self._voice_assignments[speaker] = random.choice(available_ids)
+                    self._voice_assignments[speaker] = rng.choice(available_ids)
             elif speaker == "고객":
                 if voice_customer and voice_customer in available_ids:
                     self._voice_assignments[speaker] = voice_customer
@@ -137,11 +188,11 @@ class TTSClient:
                     agent_voice = self._voice_assignments.get("상담사")
                     other_voices = [v for v in available_ids if v != agent_voice]
                     if other_voices:
-                        self._voice_assignments[speaker] = random.choice(other_voices)
+                        self._voice_assignments[speaker] = rng.choice(other_voices)
                     else:
-                        self._voice_assignments[speaker] = random.choice(available_ids)
+                        self._voice_assignments[speaker] = rng.choice(available_ids)
             else:
-                self._voice_assignments[speaker] = random.choice(available_ids)
+                self._voice_assignments[speaker] = rng.choice(available_ids)
         
         return self._voice_assignments
     
@@ -195,6 +246,8 @@ class TTSClient:
         Returns:
             저장된 파일 경로
         """
+        self.raise_if_cancelled()
+        
         # [advice from AI] Mock 모드에서는 더미 오디오 생성
         if self.mock_mode:
             return self._generate_mock_audio(text, speaker, output_path)
@@ -206,8 +259,6 @@ class TTSClient:
         
         try:
             # 동기 API를 비동기로 실행
-            loop = asyncio.get_event_loop()
-            
             def _generate():
                 audio = self.client.text_to_speech.convert(
                     voice_id=voice_id,
@@ -216,8 +267,8 @@ class TTSClient:
                     output_format="pcm_44100",  # PCM 형식으로 받아서 직접 처리
                 )
                 
-                # 오디오 데이터 수집
-                audio_data = b''.join(chunk for chunk in audio)
+                # 오디오 데이터 수집 (청크 사이마다 취소 확인)
+                audio_data = self._collect_audio(audio)
                 
                 # 파일로 저장 (PCM 데이터)
                 with open(output_path, 'wb') as f:
@@ -225,9 +276,10 @@ class TTSClient:
                 
                 return output_path
             
-            result = await loop.run_in_executor(None, _generate)
-            return result
+            return await self._run_generate(_generate)
             
+        except TTSCancelled:
+            raise
         except Exception as e:
             raise Exception(f"TTS 생성 실패 ({speaker}): {str(e)}")
     
@@ -249,6 +301,8 @@ class TTSClient:
         Returns:
             저장된 파일 경로
         """
+        self.raise_if_cancelled()
+        
         # [advice from AI] Mock 모드에서는 더미 오디오 생성
         if self.mock_mode:
             return self._generate_mock_audio(text, speaker, output_path)
@@ -259,8 +313,6 @@ class TTSClient:
             raise Exception(f"화자 '{speaker}'에 대한 음성이 할당되지 않았습니다.")
         
         try:
-            loop = asyncio.get_event_loop()
-            
             def _generate():
                 audio = self.client.text_to_speech.convert(
                     voice_id=voice_id,
@@ -269,8 +321,8 @@ class TTSClient:
                     output_format="mp3_44100_128",  # MP3 형식
                 )
                 
-                # 오디오 데이터 수집
-                audio_data = b''.join(chunk for chunk in audio)
+                # 오디오 데이터 수집 (청크 사이마다 취소 확인)
+                audio_data = self._collect_audio(audio)
                 
                 # 파일로 저장
                 with open(output_path, 'wb') as f:
@@ -278,12 +330,18 @@ class TTSClient:
                 
                 return output_path
             
-            result = await loop.run_in_executor(None, _generate)
-            return result
+            return await self._run_generate(_generate)
             
+        except TTSCancelled:
+            raise
         except Exception as e:
             raise Exception(f"TTS 생성 실패 ({speaker}): {str(e)}")
     
+    # [advice from AI] 재합성 시 이전 음성 할당 복원 (같은 목소리 유지)
+    def set_voice_assignments(self, assignments: Dict[str, str]):
+        """이전 음성 할당 복원 (사용 불가한 음성은 assign_voices에서 다시 할당)"""
+        self._voice_assignments.update(assignments)
+    
     def get_voice_assignment(self, speaker: str) -> Optional[str]:
         """특정 화자의 음성 ID 조회"""
         return self._voice_assignments.get(speaker)
@@ -0,0 +1,188 @@
+# [advice from AI] 발화 색인 모듈 - 발화 JSON을 utterances 테이블에 저장하고 전체 발화 검색
+import json
+import re
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.utterance import Utterance
+
+
+# 사용 중인 FTS5 토크나이저 (init_db에서 설정)
+_tokenizer = "trigram"
+
+# trigram 토크나이저가 색인으로 찾을 수 있는 최소 검색어 길이
+TRIGRAM_MIN_LENGTH = 3
+
+# 결과 문장에서 검색어 앞뒤로 보여줄 토큰 수
+SNIPPET_TOKENS = 24
+
+
+def set_search_tokenizer(tokenizer: str):
+    """FTS5 토크나이저 설정 (init_db에서 호출)"""
+    global _tokenizer
+    _tokenizer = tokenizer
+
+
+def utterance_rows(job_id: str, utterances: List[Dict]) -> List[Dict]:
+    """발화 JSON 목록을 utterances INSERT 값으로 변환"""
+    return [
+        {
+            "job_id": job_id,
+            "turn_idx": item["turn_idx"],
+            "role": item.get("role", ""),
+            "text": item.get("utterance", ""),
+            "started_at": item.get("started_at", 0.0),
+            "ended_at": item.get("ended_at", 0.0),
+            "start_sample": item.get("start_sample"),
+            "end_sample": item.get("end_sample"),
+        }
+        for item in utterances
+    ]
+
+
+async def store_utterances(session: AsyncSession, job_id: str, utterances: List[Dict]) -> int:
+    """
+    작업의 발화를 한 번에 교체 저장 (재합성 시 이전 발화 삭제, 커밋은 호출 측)
+
+    Returns:
+        저장한 발화 수
+    """
+    await session.execute(delete(Utterance).where(Utterance.job_id == job_id))
+    rows = utterance_rows(job_id, utterances)
+    if rows:
+        await session.execute(insert(Utterance), rows)
+    return len(rows)
+
+
+async def store_utterances_from_json(session: AsyncSession, job_id: str, json_path: str) -> int:
+    """발화 JSON 파일을 읽어 저장 (파일이 없거나 깨졌으면 0)"""
+    try:
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return 0
+    return await store_utterances(session, job_id, data.get("utterances", []))
+
+
+async def copy_utterances(session: AsyncSession, source_id: str, job_id: str) -> int:
+    """
+    결과 캐시로 재사용한 작업에 원본 작업의 발화 복사 (INSERT ... SELECT)
+
+    Returns:
+        복사한 발화 수 (원본에 색인된 발화가 없으면 0)
+    """
+    await session.execute(delete(Utterance).where(Utterance.job_id == job_id))
+    result = await session.execute(
+        text(
+            "INSERT INTO utterances "
+            "(job_id, turn_idx, role, text, started_at, ended_at, start_sample, end_sample) "
+            "SELECT :job_id, turn_idx, role, text, started_at, ended_at, start_sample, end_sample "
+            "FROM utterances WHERE job_id = :source_id"
+        ),
+        {"job_id": job_id, "source_id": source_id},
+    )
+    return result.rowcount or 0
+
+
+async def load_utterances(session: AsyncSession, job_id: str) -> List[Dict]:
+    """작업의 발화 목록 (발화 JSON과 같은 형식, turn_idx 순)"""
+    result = await session.execute(
+        select(Utterance).where(Utterance.job_id == job_id).order_by(Utterance.turn_idx)
+    )
+    utterances = []
+    for row in result.scalars():
+        item = {
+            "turn_idx": row.turn_idx,
+            "role": row.role,
+            "utterance": row.text,
+            "started_at": row.started_at,
+            "ended_at": row.ended_at,
+        }
+        if row.start_sample is not None:
+            item["start_sample"] = row.start_sample
+            item["end_sample"] = row.end_sample
+        utterances.append(item)
+    return utterances
+
+
+def _match_expression(terms: List[str]) -> str:
+    """검색어를 FTS5 구문 검색식으로 (각 단어를 따옴표로 감싸 AND)"""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def _like_pattern(term: str) -> str:
+    """LIKE 패턴 (%, _ 이스케이프)"""
+    return "%" + re.sub(r"([\\%_])", r"\\\1", term) + "%"
+
+
+async def search_utterances(
+    session: AsyncSession,
+    query: str,
+    role: Optional[str] = None,
+    job_id: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> Tuple[List[Dict], bool]:
+    """
+    전체 발화 전문 검색
+
+    FTS5 색인으로 찾고 관련도(bm25) 순으로 정렬한다. trigram 토크나이저에서
+    3글자 미만 단어가 있으면 색인을 쓸 수 없으므로 LIKE로 찾는다 (발화 순).
+
+    Args:
+        query: 검색어 (공백으로 나눈 단어를 모두 포함)
+        role: agent 또는 customer
+        job_id: 특정 작업으로 제한
+        limit: 최대 결과 수
+        offset: 건너뛸 결과 수
+
+    Returns:
+        (결과 목록, 다음 결과 존재 여부)
+    """
+    terms = query.split()
+    if not terms:
+        return [], False
+
+    params: Dict = {"limit": limit + 1, "offset": offset}
+    filters = []
+    if role:
+        filters.append("u.role = :role")
+        params["role"] = role
+    if job_id:
+        filters.append("u.job_id = :job_id")
+        params["job_id"] = job_id
+
+    use_index = _tokenizer != "trigram" or all(len(term) >= TRIGRAM_MIN_LENGTH for term in terms)
+    if use_index:
+        params["match"] = _match_expression(terms)
+        where = " AND ".join(["utterances_fts MATCH :match"] + filters)
+        sql = (
+            "SELECT u.job_id, j.original_filename, u.turn_idx, u.role, u.text, "
+            "u.started_at, u.ended_at, u.start_sample, u.end_sample, "
+            f"snippet(utterances_fts, 0, '<mark>', '</mark>', '…', {SNIPPET_TOKENS}) AS snippet "
+            "FROM utterances_fts "
+            "JOIN utterances u ON u.id = utterances_fts.rowid "
+            "JOIN jobs j ON j.id = u.job_id "
+            f"WHERE {where} "
+            "ORDER BY utterances_fts.rank "
+            "LIMIT :limit OFFSET :offset"
+        )
+    else:
+        for index, term in enumerate(terms):
+            filters.append(f"u.text LIKE :term{index} ESCAPE '\\'")
+            params[f"term{index}"] = _like_pattern(term)
+        sql = (
+            "SELECT u.job_id, j.original_filename, u.turn_idx, u.role, u.text, "
+            "u.started_at, u.ended_at, u.start_sample, u.end_sample, NULL AS snippet "
+            "FROM utterances u "
+            "JOIN jobs j ON j.id = u.job_id "
+            f"WHERE {' AND '.join(filters)} "
+            "ORDER BY u.id "
+            "LIMIT :limit OFFSET :offset"
+        )
+
+    result = await session.execute(text(sql), params)
+    rows = [dict(row._mapping) for row in result]
+    return rows[:limit], len(rows) > limit
@@ -0,0 +1,58 @@
+# [advice from AI] 대량 대화록 검증 모듈 (파일별 요약 + 오류, 프로세스 풀 작업 단위)
+from typing import Dict, List, Tuple
+
+from backend.core.parser import parse_and_validate
+from backend.core.timestamp import estimate_timeline
+
+
+def summarize_script(content: str) -> Dict:
+    """
+    대화록 한 개 검증 + 요약
+
+    Returns:
+        유효 여부, 대화 수, 화자별 대화 수, 태그 수, 요약 유무, 예상 길이(초), 에러 목록
+    """
+    parsed, errors = parse_and_validate(content)
+
+    speakers: Dict[str, int] = {}
+    action_count = 0
+    delay_count = 0
+    for dialogue in parsed.dialogues:
+        speakers[dialogue.speaker] = speakers.get(dialogue.speaker, 0) + 1
+        action_count += len(dialogue.actions)
+        delay_count += len(dialogue.delays)
+
+    estimate = estimate_timeline(parsed.dialogues)
+
+    return {
+        "valid": not errors,
+        "dialogue_count": len(parsed.dialogues),
+        "speakers": speakers,
+        "action_count": action_count,
+        "delay_count": delay_count,
+        "has_summary": parsed.summary is not None,
+        "duration_seconds": round(estimate.total_seconds, 3),
+        "errors": errors,
+    }
+
+
+def validate_files(items: List[Tuple[int, str, bytes]]) -> List[Dict]:
+    """
+    여러 대화록 검증 (프로세스 풀 작업 단위)
+
+    Args:
+        items: (입력 순번, 파일명, 내용 바이트) 목록
+
+    Returns:
+        파일별 요약 목록 (index, filename 포함)
+    """
+    results = []
+    for index, filename, data in items:
+        try:
+            result = summarize_script(data.decode('utf-8'))
+        except UnicodeDecodeError:
+            result = {"valid": False, "errors": ["UTF-8 텍스트 파일이 아닙니다."]}
+        except Exception as e:
+            result = {"valid": False, "errors": [str(e)]}
+        results.append({"index": index, "filename": filename, **result})
+    return results
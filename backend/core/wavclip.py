@@ -0,0 +1,113 @@
+# [advice from AI] WAV 구간 잘라내기 모듈 - 디코딩 없이 헤더 + data 청크 일부로 클립 생성
+import struct
+from dataclasses import dataclass
+from typing import Tuple
+
+
+# 합성하는 헤더: RIFF(12) + fmt(8 + 16) + data 헤더(8)
+CLIP_HEADER_SIZE = 44
+
+# data 청크를 찾을 때 읽는 최대 헤더 길이 (ffmpeg의 LIST 청크 등 포함)
+MAX_HEADER_SCAN = 64 * 1024
+
+WAVE_FORMAT_PCM = 1
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+@dataclass
+class WavLayout:
+    """WAV 파일의 형식 정보와 data 청크 위치"""
+    channels: int
+    sample_rate: int
+    bits_per_sample: int
+    block_align: int
+    data_offset: int   # 파일에서 PCM이 시작하는 바이트 위치
+    data_size: int     # PCM 바이트 수
+
+    @property
+    def frame_count(self) -> int:
+        return self.data_size // self.block_align if self.block_align else 0
+
+
+def read_wav_layout(path: str) -> WavLayout:
+    """
+    RIFF 청크를 훑어 fmt/data 청크 위치 확인 (PCM은 읽지 않음)
+
+    Args:
+        path: WAV 파일 경로
+
+    Raises:
+        ValueError: PCM WAV가 아니거나 청크를 찾을 수 없을 때
+    """
+    with open(path, "rb") as f:
+        file_size = f.seek(0, 2)
+        f.seek(0)
+        riff, _, wave = struct.unpack("<4sI4s", f.read(12))
+        if riff != b"RIFF" or wave != b"WAVE":
+            raise ValueError("WAV 파일이 아닙니다.")
+
+        fmt = None
+        position = 12
+        while position + 8 <= min(file_size, MAX_HEADER_SCAN):
+            f.seek(position)
+            chunk_id, chunk_size = struct.unpack("<4sI", f.read(8))
+            body = position + 8
+            if chunk_id == b"fmt ":
+                fmt = struct.unpack("<HHIIHH", f.read(16))
+            elif chunk_id == b"data":
+                if fmt is None:
+                    raise ValueError("fmt 청크가 data 청크보다 뒤에 있습니다.")
+                audio_format, channels, sample_rate, _, block_align, bits = fmt
+                if audio_format not in (WAVE_FORMAT_PCM, WAVE_FORMAT_EXTENSIBLE):
+                    raise ValueError("PCM WAV만 지원합니다.")
+                # 스트리밍으로 쓴 파일은 data 크기가 0 또는 0xFFFFFFFF일 수 있음
+                data_size = min(chunk_size, file_size - body) if chunk_size else file_size - body
+                return WavLayout(
+                    channels=channels,
+                    sample_rate=sample_rate,
+                    bits_per_sample=bits,
+                    block_align=block_align,
+                    data_offset=body,
+                    data_size=data_size,
+                )
+            # 청크는 2바이트 단위로 정렬
+            position = body + chunk_size + (chunk_size & 1)
+
+    raise ValueError("data 청크를 찾을 수 없습니다.")
+
+
+def wav_header(layout: WavLayout, data_size: int) -> bytes:
+    """
+    data_size 바이트짜리 PCM WAV의 44바이트 헤더 생성
+
+    Args:
+        layout: 원본 WAV 형식 (채널/샘플레이트/비트 수)
+        data_size: 뒤에 붙을 PCM 바이트 수
+    """
+    byte_rate = layout.sample_rate * layout.block_align
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", CLIP_HEADER_SIZE - 8 + data_size, b"WAVE",
+        b"fmt ", 16, WAVE_FORMAT_PCM, layout.channels, layout.sample_rate,
+        byte_rate, layout.block_align, layout.bits_per_sample,
+        b"data", data_size,
+    )
+
+
+def clip_range(layout: WavLayout, start_frame: int, end_frame: int) -> Tuple[int, int]:
+    """
+    프레임 구간을 파일 바이트 구간으로 변환 (data 청크 범위로 제한)
+
+    Args:
+        layout: WAV 형식 정보
+        start_frame: 시작 프레임 (포함)
+        end_frame: 끝 프레임 (제외)
+
+    Returns:
+        (파일 오프셋, 바이트 수)
+    """
+    total = layout.frame_count
+    start_frame = max(0, min(start_frame, total))
+    end_frame = max(start_frame, min(end_frame, total))
+    offset = layout.data_offset + start_frame * layout.block_align
+    return offset, (end_frame - start_frame) * layout.block_align
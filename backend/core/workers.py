@@ -0,0 +1,145 @@
+# [advice from AI] CPU 작업용 프로세스 풀 관리 모듈 (대량 파싱/검증)
+import os
+import asyncio
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterable, AsyncIterator, Callable, Deque, Iterator, List, Optional, Sequence, TypeVar
+
+from backend.config import get_settings
+
+T = TypeVar("T")
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_file_pool: Optional[ThreadPoolExecutor] = None
+
+
+def process_workers() -> int:
+    """프로세스 풀 크기 (parse_workers, 0이면 CPU 수)"""
+    return get_settings().parse_workers or os.cpu_count() or 1
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """프로세스 풀 싱글톤 반환 (최초 사용 시 생성)"""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=process_workers())
+    return _process_pool
+
+
+def shutdown_process_pool():
+    """프로세스 풀 종료 (서버 종료 시)"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+# [advice from AI] 파일 삭제용 스레드 풀 (디스크 I/O 대기 - 프로세스 대신 스레드, 수를 제한해 디스크 과부하 방지)
+def get_file_pool() -> ThreadPoolExecutor:
+    """파일 삭제 스레드 풀 싱글톤 반환 (최초 사용 시 생성)"""
+    global _file_pool
+    if _file_pool is None:
+        workers = max(1, get_settings().file_delete_workers)
+        _file_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="file-delete")
+    return _file_pool
+
+
+def shutdown_file_pool():
+    """파일 삭제 스레드 풀 종료 (서버 종료 시 진행 중인 삭제는 마침)"""
+    global _file_pool
+    if _file_pool is not None:
+        _file_pool.shutdown(wait=True)
+        _file_pool = None
+
+
+async def map_chunks_in_threads(pool: ThreadPoolExecutor, func: Callable, items: Sequence, chunk_size: int = 64):
+    """목록을 청크로 나눠 스레드 풀에서 병렬 처리 (결과 없음)"""
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(
+        loop.run_in_executor(pool, func, list(chunk)) for chunk in chunked(items, chunk_size)
+    ))
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """목록을 size 개씩 나누기"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+async def run_in_process(func: Callable, *args):
+    """함수를 프로세스 풀에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), func, *args)
+
+
+async def map_chunks_in_processes(func: Callable, items: Sequence, chunk_size: int = 64) -> List:
+    """
+    목록을 청크로 나눠 프로세스 풀에서 병렬 처리 (입력 순서 유지)
+
+    Args:
+        func: 청크(list)를 받아 결과 list를 반환하는 최상위 함수
+        items: 처리할 항목
+        chunk_size: 청크 크기 (프로세스 간 전달 오버헤드 감소)
+
+    Returns:
+        모든 청크 결과를 이어 붙인 목록
+    """
+    tasks = [run_in_process(func, list(chunk)) for chunk in chunked(items, chunk_size)]
+    results = []
+    for chunk_result in await asyncio.gather(*tasks):
+        results.extend(chunk_result)
+    return results
+
+
+async def iter_chunks_in_processes(
+    func: Callable,
+    items: Sequence,
+    chunk_size: int = 64,
+) -> AsyncIterator[List]:
+    """
+    map_chunks_in_processes와 같지만 끝난 청크부터 결과를 바로 반환 (스트리밍 응답용)
+
+    Yields:
+        청크별 결과 목록 (완료 순서, 입력 순서와 다를 수 있음)
+    """
+    tasks = [
+        asyncio.ensure_future(run_in_process(func, list(chunk)))
+        for chunk in chunked(items, chunk_size)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # 클라이언트 연결이 끊기면 남은 청크는 취소
+        for task in tasks:
+            task.cancel()
+
+
+# [advice from AI] 입력 청크를 만드는 대로 넘기는 버전 (압축 안 대화록을 전부 읽어 두지 않음)
+async def iter_stream_in_processes(
+    func: Callable,
+    chunks: AsyncIterable[List],
+    max_pending: int = 0,
+) -> AsyncIterator[List]:
+    """
+    비동기로 들어오는 청크를 프로세스 풀에서 처리하고 결과를 입력 순서대로 반환
+
+    동시에 넘겨 둔 청크가 max_pending개(기본: 프로세스 수 x 2)가 되면 가장 먼저 넘긴
+    청크의 결과를 기다린 뒤 다음 청크를 읽으므로, 메모리에는 그만큼의 입력만 남는다.
+
+    Yields:
+        청크별 결과 목록 (입력 순서)
+    """
+    limit = max_pending or process_workers() * 2
+    pending: Deque[asyncio.Future] = deque()
+    try:
+        async for chunk in chunks:
+            pending.append(asyncio.ensure_future(run_in_process(func, list(chunk))))
+            if len(pending) >= limit:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        # 클라이언트 연결이 끊기거나 입력 읽기가 실패하면 남은 청크는 취소
+        for task in pending:
+            task.cancel()
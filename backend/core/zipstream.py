@@ -0,0 +1,151 @@
+# [advice from AI] 스트리밍 ZIP 생성 모듈 (일정한 메모리로 다운로드 응답 생성)
+import io
+import os
+import time
+import zipfile
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Set
+
+
+# 압축해도 거의 줄지 않는 오디오는 STORED로 저장
+STORED_EXTENSIONS = ('.wav', '.mp3', '.opus', '.ogg', '.flac')
+
+# 파일을 읽어 ZIP에 쓰는 단위
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class ZipEntry:
+    """ZIP에 넣을 파일 한 개 (파일 일부나 메모리 데이터도 가능)"""
+    path: Optional[str]             # 디스크 경로 (data가 있으면 None)
+    arcname: str                    # ZIP 내부 이름
+    offset: int = 0                 # 파일에서 읽기 시작할 위치
+    length: Optional[int] = None    # 읽을 바이트 수 (None이면 파일 끝까지)
+    prefix: bytes = b''             # 파일 내용 앞에 붙일 바이트 (합성한 WAV 헤더 등)
+    data: Optional[bytes] = None    # 파일 대신 넣을 메모리 데이터 (매니페스트 등)
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    zipfile 출력을 모아 두는 쓰기 전용 버퍼 (탐색 불가)
+
+    seek를 지원하지 않으므로 zipfile은 항목마다 데이터 디스크립터를 붙여
+    로컬 헤더를 다시 고쳐 쓰지 않는다.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        """지금까지 쓰인 바이트를 꺼내고 버퍼 비우기"""
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def unique_arcname(name: str, used: Set[str]) -> str:
+    """ZIP 내부 이름 중복 방지 (같은 이름이면 _2, _3 ... 추가)"""
+    candidate = name
+    stem, ext = os.path.splitext(name)
+    counter = 2
+    while candidate in used:
+        candidate = f"{stem}_{counter}{ext}"
+        counter += 1
+    used.add(candidate)
+    return candidate
+
+
+def _zip_info(entry: ZipEntry) -> zipfile.ZipInfo:
+    """파일 크기/수정 시각/압축 방식이 설정된 ZipInfo 생성"""
+    if entry.data is not None:
+        mtime, size = time.time(), len(entry.data)
+    else:
+        stat = os.stat(entry.path)
+        mtime = stat.st_mtime
+        size = len(entry.prefix) + (
+            entry.length if entry.length is not None else max(0, stat.st_size - entry.offset)
+        )
+    date_time = time.localtime(mtime)[:6]
+    if date_time[0] < 1980:
+        date_time = (1980, 1, 1, 0, 0, 0)
+
+    info = zipfile.ZipInfo(entry.arcname, date_time=date_time)
+    info.external_attr = 0o644 << 16
+    # 크기를 미리 알려 두면 4GB 이상 항목은 zipfile이 ZIP64 헤더를 사용
+    info.file_size = size
+    if entry.arcname.lower().endswith(STORED_EXTENSIONS):
+        info.compress_type = zipfile.ZIP_STORED
+    else:
+        info.compress_type = zipfile.ZIP_DEFLATED
+    return info
+
+
+def iter_zip(entries: Iterable[ZipEntry], chunk_size: int = READ_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    파일 목록을 ZIP 바이트 조각으로 순서대로 생성
+
+    파일을 chunk_size 단위로 읽어 바로 내보내므로 메모리 사용량은 ZIP 크기와
+    무관하다. 오디오는 STORED, 그 외(JSON 등)는 DEFLATE로 저장하며 ZIP64를 지원한다.
+    동기 제너레이터이므로 StreamingResponse에 넘기면 스레드 풀에서 실행된다.
+    항목마다 파일의 일부 구간(offset/length)과 앞에 붙일 prefix를 지정할 수 있다.
+    (사라진 파일은 건너뜀)
+
+    Args:
+        entries: ZIP에 넣을 파일 목록
+        chunk_size: 파일 읽기 단위
+
+    Yields:
+        ZIP 바이트 조각
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, mode='w', allowZip64=True) as zf:
+        for entry in entries:
+            if entry.data is not None:
+                with zf.open(_zip_info(entry), mode='w') as dst:
+                    dst.write(entry.data)
+                data = sink.drain()
+                if data:
+                    yield data
+                continue
+
+            try:
+                info = _zip_info(entry)
+                src = open(entry.path, 'rb')
+            except OSError:
+                continue
+
+            with src, zf.open(info, mode='w') as dst:
+                if entry.prefix:
+                    dst.write(entry.prefix)
+                src.seek(entry.offset)
+                remaining = info.file_size - len(entry.prefix)
+                while remaining > 0:
+                    chunk = src.read(min(chunk_size, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    dst.write(chunk)
+                    data = sink.drain()
+                    if data:
+                        yield data
+
+            data = sink.drain()
+            if data:
+                yield data
+
+    # 중앙 디렉토리
+    data = sink.drain()
+    if data:
+        yield data
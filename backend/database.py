@@ -1,4 +1,5 @@
 # [advice from AI] 데이터베이스 설정 및 초기화
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from backend.config import get_settings
@@ -14,6 +15,39 @@ _engine = None
 _async_session = None
 
 
+# [advice from AI] 연결마다 적용하는 SQLite 성능 설정
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    WAL(읽기와 쓰기가 서로 막지 않음), synchronous=NORMAL(WAL에서 안전한 최소 fsync),
+    busy_timeout(잠금 시 즉시 실패하지 않고 대기), mmap/캐시 크기 설정
+    """
+    settings = get_settings()
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size_mb) * 1024 * 1024}")
+    cursor.execute(f"PRAGMA cache_size=-{int(settings.sqlite_cache_size_mb) * 1024}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+# [advice from AI] 풀에 반납할 때 읽기 전용 설정 해제 (get_read_db가 건 query_only)
+def _reset_query_only(dbapi_connection, connection_record, reset_state):
+    """
+    반납되는 연결의 PRAGMA query_only 해제
+
+    get_read_db 요청이 취소되거나 도중에 실패해도 읽기 전용 연결이 풀로 돌아가
+    이후 쓰기 세션이 "attempt to write a readonly database"로 실패하지 않도록 한다.
+    (실패하면 풀이 연결을 버림, 버려지는 연결은 건너뜀)
+    """
+    if reset_state.terminate_only:
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=OFF")
+    cursor.close()
+
+
 def get_engine():
     """비동기 엔진 반환"""
     global _engine
@@ -22,7 +56,10 @@ def get_engine():
         _engine = create_async_engine(
             f"sqlite+aiosqlite:///{settings.db_path}",
             echo=False,
+            connect_args={"timeout": settings.sqlite_busy_timeout_ms / 1000},
         )
+        event.listen(_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+        event.listen(_engine.sync_engine, "reset", _reset_query_only)
     return _engine
 
 
@@ -52,13 +89,41 @@ async def get_db():
             await session.close()
 
 
+# [advice from AI] GET 요청용 읽기 전용 세션 (커밋 없음, 쓰기 시도 시 오류)
+async def get_read_db():
+    """
+    읽기 전용 의존성 주입용 세션 생성기
+
+    요청 동안 연결에 PRAGMA query_only를 걸어 실수로 쓰기를 해도 반영되지 않게 하고,
+    끝나면 커밋 없이 연결을 반납한다. (query_only는 반납 시 풀의 reset 이벤트에서 해제)
+    """
+    async_session = get_session_maker()
+    async with async_session() as session:
+        connection = await session.connection()
+        await connection.exec_driver_sql("PRAGMA query_only=ON")
+        yield session
+
+
 async def init_db():
     """데이터베이스 테이블 초기화"""
-    from backend.models.job import Job  # 모델 import
+    from backend.models.job import Job, create_job_search  # 모델 import
+    from backend.models.export import Export
+    from backend.models.stats import JobCounter, JobThroughput
+    from backend.models.changes import JobSequence, JobTombstone
+    from backend.models.batch import Batch
+    from backend.models.utterance import create_utterance_search
+    from backend.core.utterance_index import set_search_tokenizer
+    from backend.migrations import run_migrations
     
     engine = get_engine()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # [advice from AI] 기존 DB에 추가된 컬럼/인덱스 반영 (PRAGMA user_version 기준)
+        version = await conn.run_sync(run_migrations)
+        # [advice from AI] 발화 전문 검색(FTS5) 테이블 및 동기화 트리거
+        set_search_tokenizer(await conn.run_sync(create_utterance_search))
+        # [advice from AI] 작업 파일명 검색(FTS5) 테이블 및 동기화 트리거
+        await conn.run_sync(create_job_search)
     
-    print("✅ 데이터베이스가 초기화되었습니다.")
+    print(f"✅ 데이터베이스가 초기화되었습니다. (스키마 버전 {version})")
 
@@ -8,7 +8,11 @@ import os
 
 from backend.config import get_settings, set_runtime_api_key, get_runtime_api_key, clear_runtime_api_key
 from backend.database import init_db
-from backend.api.routes import upload, jobs, files
+from backend.api.routes import upload, jobs, files, exports, utterances, batches
+from backend.core.workers import shutdown_process_pool, shutdown_file_pool
+from backend.core.scheduler import shutdown_scheduler
+from backend.core.events import install_session_hooks
+from backend.core.exporter import fail_interrupted_exports
 from pydantic import BaseModel
 
 
@@ -22,10 +26,19 @@ async def lifespan(app: FastAPI):
     os.makedirs(settings.upload_dir, exist_ok=True)
     os.makedirs(settings.output_dir, exist_ok=True)
     os.makedirs(settings.temp_dir, exist_ok=True)
+    os.makedirs(settings.segment_dir, exist_ok=True)
+    os.makedirs(settings.preview_dir, exist_ok=True)
+    os.makedirs(settings.export_dir, exist_ok=True)
     
     # 데이터베이스 초기화
     await init_db()
     
+    # [advice from AI] 커밋된 작업 변경을 이벤트 스트림(SSE)으로 발행
+    install_session_hooks()
+    
+    # [advice from AI] 이전 실행에서 중단된 내보내기 정리 (다시 실행/삭제할 수 있도록)
+    await fail_interrupted_exports()
+    
     print("🚀 Script2WAVE 서버가 시작되었습니다!")
     print(f"📁 업로드 경로: {settings.upload_dir}")
     print(f"📁 출력 경로: {settings.output_dir}")
@@ -33,6 +46,9 @@ async def lifespan(app: FastAPI):
     yield
     
     # 종료 시 정리
+    shutdown_scheduler()
+    shutdown_process_pool()
+    shutdown_file_pool()
     print("👋 Script2WAVE 서버가 종료됩니다.")
 
 
@@ -56,6 +72,9 @@ app.add_middleware(
 app.include_router(upload.router, prefix="/api/upload", tags=["Upload"])
 app.include_router(jobs.router, prefix="/api/jobs", tags=["Jobs"])
 app.include_router(files.router, prefix="/api/files", tags=["Files"])
+app.include_router(exports.router, prefix="/api/exports", tags=["Exports"])
+app.include_router(utterances.router, prefix="/api/utterances", tags=["Utterances"])
+app.include_router(batches.router, prefix="/api/batches", tags=["Batches"])
 
 # 정적 파일 서빙 (프론트엔드)
 app.mount("/static", StaticFiles(directory="frontend"), name="static")
@@ -98,6 +117,7 @@ async def get_config():
         "action_duration": settings.action_duration,
         "silence_padding": settings.silence_padding,
         "max_concurrent_jobs": settings.max_concurrent_jobs,
+        "max_upload_size_mb": settings.max_upload_size_mb,
         "has_api_key": has_key,
         "api_key_source": key_source,
         "tts_mock_mode": settings.tts_mock_mode,
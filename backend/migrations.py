@@ -0,0 +1,197 @@
+# [advice from AI] 스키마 마이그레이션 - PRAGMA user_version으로 적용 버전 관리
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+
+
+def table_columns(conn: Connection, table: str) -> List[str]:
+    """테이블의 컬럼 이름 목록 (테이블이 없으면 빈 목록)"""
+    return [row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")]
+
+
+def add_column_if_missing(
+    conn: Connection,
+    table: str,
+    column: str,
+    ddl_type: str,
+    default: Optional[str] = None,
+) -> bool:
+    """
+    컬럼이 없으면 추가 (ALTER TABLE ... ADD COLUMN)
+
+    Args:
+        table: 테이블 이름
+        column: 컬럼 이름
+        ddl_type: SQL 타입 (INTEGER, TEXT, VARCHAR(64) ...)
+        default: 기존 행에 채울 기본값 (SQL 리터럴)
+
+    Returns:
+        추가했으면 True
+    """
+    if column in table_columns(conn, table):
+        return False
+    ddl = f"ALTER TABLE {table} ADD COLUMN {column} {ddl_type}"
+    if default is not None:
+        ddl += f" DEFAULT {default}"
+    conn.exec_driver_sql(ddl)
+    return True
+
+
+def create_model_indexes(conn: Connection, model) -> None:
+    """
+    모델에 정의된 인덱스 중 없는 것 생성
+
+    아직 없는 컬럼(이후 마이그레이션에서 추가)을 쓰는 인덱스는 건너뛴다.
+    """
+    columns = set(table_columns(conn, model.__tablename__))
+    for index in model.__table__.indexes:
+        if any(column.name not in columns for column in index.columns):
+            continue
+        index.create(conn, checkfirst=True)
+
+
+def create_fts_table(conn: Connection, name: str, ddl_template: str) -> str:
+    """
+    FTS5 가상 테이블이 없으면 생성 (external content면 기존 행으로 다시 색인)
+
+    trigram 토크나이저를 지원하지 않는 SQLite면 unicode61로 만든다.
+
+    Args:
+        name: FTS 테이블 이름
+        ddl_template: {tokenizer} 자리가 있는 CREATE VIRTUAL TABLE 문
+
+    Returns:
+        사용 중인 토크나이저 이름
+    """
+    existing = conn.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE name = ?", (name,)
+    ).scalar()
+
+    if existing is None:
+        try:
+            conn.exec_driver_sql(ddl_template.format(tokenizer="trigram"))
+        except OperationalError:
+            conn.exec_driver_sql(ddl_template.format(tokenizer="unicode61"))
+        conn.exec_driver_sql(f"INSERT INTO {name}({name}) VALUES ('rebuild')")
+        existing = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE name = ?", (name,)
+        ).scalar()
+
+    return "trigram" if "trigram" in existing else "unicode61"
+
+
+# === 마이그레이션 목록 (순서대로, 각 단계는 여러 번 실행해도 안전해야 함) ===
+
+def _v1_job_cache_columns(conn: Connection):
+    """결과 캐시/재합성 컬럼 (초기 스키마 이후 추가된 Job 컬럼)"""
+    add_column_if_missing(conn, "jobs", "parsed_script", "TEXT")
+    add_column_if_missing(conn, "jobs", "version", "INTEGER", default="1")
+    add_column_if_missing(conn, "jobs", "content_hash", "VARCHAR(64)")
+    add_column_if_missing(conn, "jobs", "cache_hit", "BOOLEAN", default="0")
+    add_column_if_missing(conn, "jobs", "cache_source_id", "VARCHAR(36)")
+
+
+def _v2_job_indexes(conn: Connection):
+    """목록 필터/정렬, 통계, 캐시 조회 인덱스"""
+    from backend.models.job import Job
+    create_model_indexes(conn, Job)
+    conn.exec_driver_sql("ANALYZE jobs")
+
+
+def _v3_job_counters(conn: Connection):
+    """상태별 카운터/처리량 트리거 및 기존 작업 집계"""
+    from backend.models.stats import create_stats_triggers, rebuild_job_counters
+    create_stats_triggers(conn)
+    rebuild_job_counters(conn)
+
+
+def _v4_job_keyset_indexes(conn: Connection):
+    """목록 키셋 페이지네이션(정렬 값, id)/파일명 접두어 검색 인덱스"""
+    from backend.models.job import Job
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_jobs_status_created")
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_jobs_created")
+    create_model_indexes(conn, Job)
+    conn.exec_driver_sql("ANALYZE jobs")
+
+
+def _v5_job_change_tracking(conn: Connection):
+    """작업 변경 순번(change_seq)/삭제 기록 트리거 및 기존 작업 순번 부여"""
+    from backend.models.job import Job
+    from backend.models.changes import create_change_triggers, backfill_change_seq
+    add_column_if_missing(conn, "jobs", "change_seq", "INTEGER")
+    create_model_indexes(conn, Job)
+    create_change_triggers(conn)
+    backfill_change_seq(conn)
+
+
+def _v6_job_batches(conn: Connection):
+    """작업 배치(batch_id) 컬럼/인덱스 및 배치 집계 트리거"""
+    from backend.models.job import Job
+    from backend.models.batch import create_batch_triggers
+    add_column_if_missing(conn, "jobs", "batch_id", "VARCHAR(36)")
+    create_model_indexes(conn, Job)
+    create_batch_triggers(conn)
+
+
+def _v7_cheap_tombstone_prune(conn: Connection):
+    """삭제 기록 정리 조건이 deleted_at 인덱스를 쓰도록 삭제 트리거 재생성 (일괄 삭제가 O(n^2)이던 문제)"""
+    from backend.models.changes import recreate_change_delete_trigger
+    recreate_change_delete_trigger(conn)
+
+
+def _v8_job_tts_characters(conn: Connection):
+    """작업별 TTS 사용 글자 수 (취소 시 부분 사용량 기록)"""
+    add_column_if_missing(conn, "jobs", "tts_characters", "INTEGER", default="0")
+
+
+def _v9_job_priority(conn: Connection):
+    """작업 우선순위 (기존 작업은 NORMAL)"""
+    add_column_if_missing(conn, "jobs", "priority", "VARCHAR(6)", default="'NORMAL'")
+
+
+def _v10_job_search_rowid(conn: Connection):
+    """파일명 FTS를 내부 rowid 대신 고정 컬럼(search_rowid)으로 연결 (VACUUM 후 검색 결과가 어긋나던 문제)"""
+    from backend.models.job import Job, drop_job_search
+    add_column_if_missing(conn, "jobs", "search_rowid", "INTEGER")
+    conn.exec_driver_sql("UPDATE jobs SET search_rowid = rowid WHERE search_rowid IS NULL")
+    create_model_indexes(conn, Job)
+    # 테이블/트리거는 init_db의 create_job_search가 새 정의로 만들고 재색인
+    drop_job_search(conn)
+
+
+MIGRATIONS: List[Tuple[int, Callable[[Connection], None]]] = [
+    (1, _v1_job_cache_columns),
+    (2, _v2_job_indexes),
+    (3, _v3_job_counters),
+    (4, _v4_job_keyset_indexes),
+    (5, _v5_job_change_tracking),
+    (6, _v6_job_batches),
+    (7, _v7_cheap_tombstone_prune),
+    (8, _v8_job_tts_characters),
+    (9, _v9_job_priority),
+    (10, _v10_job_search_rowid),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def run_migrations(conn: Connection) -> int:
+    """
+    적용되지 않은 마이그레이션 실행 (init_db에서 create_all 다음에 호출)
+
+    create_all은 새 테이블만 만들고 기존 테이블에 컬럼/인덱스를 추가하지 않으므로
+    여기서 보충한다. 적용한 버전은 PRAGMA user_version에 기록한다.
+
+    Returns:
+        현재 스키마 버전
+    """
+    current = conn.exec_driver_sql("PRAGMA user_version").scalar() or 0
+    for version, migrate in MIGRATIONS:
+        if version <= current:
+            continue
+        migrate(conn)
+        conn.exec_driver_sql(f"PRAGMA user_version = {version}")
+        print(f"🔧 스키마 마이그레이션 적용: v{version} ({migrate.__doc__.strip()})")
+        current = version
+    return current
@@ -1,5 +1,8 @@
 # [advice from AI] Models 패키지 초기화
 from backend.models.job import Job, JobStatus
+from backend.models.export import Export, ExportStatus
+from backend.models.utterance import Utterance
+from backend.models.stats import JobCounter, JobThroughput
 
-__all__ = ["Job", "JobStatus"]
+__all__ = ["Job", "JobStatus", "Export", "ExportStatus", "Utterance", "JobCounter", "JobThroughput"]
 
@@ -0,0 +1,173 @@
+# [advice from AI] 배치(Batch) 모델 정의 - 여러 작업을 한 번에 등록한 단위, 집계는 jobs 트리거가 갱신
+from sqlalchemy import Column, String, Integer, Float, DateTime
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import func
+from typing import Optional
+from pydantic import BaseModel
+from datetime import datetime
+
+from backend.database import Base
+from backend.models.job import JobStatus
+
+
+class Batch(Base):
+    """배치 테이블 (상태별 작업 수/진행률 합계는 jobs 트리거가 같은 트랜잭션에서 갱신)"""
+    __tablename__ = "batches"
+
+    id = Column(String(36), primary_key=True)
+    name = Column(String(255), nullable=True)
+
+    # 상태별 작업 수
+    total = Column(Integer, nullable=False, default=0)
+    pending = Column(Integer, nullable=False, default=0)
+    processing = Column(Integer, nullable=False, default=0)
+    completed = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    cancelled = Column(Integer, nullable=False, default=0)
+
+    # 대기/처리 중인 작업의 진행률(0-100) 합계와 완료된 오디오 길이 합계 (초)
+    progress_sum = Column(Integer, nullable=False, default=0)
+    audio_seconds = Column(Float, nullable=False, default=0.0)
+
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now())
+    started_at = Column(DateTime, nullable=True)     # 처음으로 대기 상태를 벗어난 작업이 생긴 시각
+    finished_at = Column(DateTime, nullable=True)    # 대기/처리 중인 작업이 없어진 시각
+
+    @property
+    def active(self) -> int:
+        """대기 중이거나 처리 중인 작업 수"""
+        return self.pending + self.processing
+
+
+_PROCESSING = ", ".join(
+    f"'{status.name}'" for status in (JobStatus.PARSING, JobStatus.GENERATING_TTS, JobStatus.MIXING)
+)
+
+
+def _count(row: str, sign: str) -> str:
+    """row(new/old) 작업 하나를 row.batch_id 배치 집계에 더하거나(+) 뺌(-)"""
+    return f"""
+        UPDATE batches SET
+            total = total {sign} 1,
+            pending = pending {sign} ({row}.status = '{JobStatus.PENDING.name}'),
+            processing = processing {sign} ({row}.status IN ({_PROCESSING})),
+            completed = completed {sign} ({row}.status = '{JobStatus.COMPLETED.name}'),
+            failed = failed {sign} ({row}.status = '{JobStatus.FAILED.name}'),
+            cancelled = cancelled {sign} ({row}.status = '{JobStatus.CANCELLED.name}'),
+            progress_sum = progress_sum {sign} CASE WHEN {row}.status IN ('{JobStatus.PENDING.name}', {_PROCESSING})
+                THEN COALESCE({row}.progress, 0) ELSE 0 END,
+            audio_seconds = audio_seconds {sign} CASE WHEN {row}.status = '{JobStatus.COMPLETED.name}'
+                THEN COALESCE({row}.duration_seconds, 0) ELSE 0 END
+        WHERE id = {row}.batch_id;"""
+
+
+def _touch(row: str, condition: str = "") -> str:
+    """집계 변경 후 시작/종료 시각 갱신"""
+    return f"""
+        UPDATE batches SET
+            updated_at = datetime('now'),
+            started_at = CASE WHEN started_at IS NULL AND pending < total THEN datetime('now') ELSE started_at END,
+            finished_at = CASE WHEN pending + processing = 0 THEN COALESCE(finished_at, datetime('now')) ELSE NULL END
+        WHERE id = {row}.batch_id{condition};"""
+
+
+_BATCH_TRIGGERS_DDL = [
+    f"""CREATE TRIGGER IF NOT EXISTS batch_counters_insert AFTER INSERT ON jobs
+    WHEN new.batch_id IS NOT NULL BEGIN
+        {_count("new", "+")}
+        {_touch("new")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS batch_counters_update
+    AFTER UPDATE OF status, progress, duration_seconds, batch_id ON jobs
+    WHEN (old.batch_id IS NOT NULL OR new.batch_id IS NOT NULL) AND (
+        old.status IS NOT new.status OR old.progress IS NOT new.progress
+        OR old.duration_seconds IS NOT new.duration_seconds OR old.batch_id IS NOT new.batch_id
+    ) BEGIN
+        {_count("old", "-")}
+        {_count("new", "+")}
+        {_touch("old", " AND old.batch_id IS NOT new.batch_id")}
+        {_touch("new")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS batch_counters_delete AFTER DELETE ON jobs
+    WHEN old.batch_id IS NOT NULL BEGIN
+        {_count("old", "-")}
+        {_touch("old")}
+    END""",
+]
+
+
+def create_batch_triggers(conn: Connection):
+    """배치 집계 트리거 생성 (여러 번 실행해도 안전)"""
+    for ddl in _BATCH_TRIGGERS_DDL:
+        conn.exec_driver_sql(ddl)
+
+
+# Pydantic 스키마
+class BatchCounts(BaseModel):
+    """배치의 상태별 작업 수"""
+    total: int
+    pending: int
+    processing: int
+    completed: int
+    failed: int
+    cancelled: int
+
+
+class BatchResponse(BaseModel):
+    """배치 상태 응답"""
+    id: str
+    name: Optional[str] = None
+    status: str                           # pending / processing / completed / completed_with_errors / cancelled / empty
+    counts: BatchCounts
+    progress: float                       # 전체 진행률 (0-100)
+    audio_seconds: float                  # 완료된 오디오 길이 합계
+    eta_seconds: Optional[float] = None   # 남은 예상 시간 (진행률 기준, 시작 전/완료 후 None)
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @classmethod
+    def from_batch(cls, batch: Batch) -> "BatchResponse":
+        total = batch.total or 0
+        if total == 0:
+            status = "empty"
+        elif batch.active:
+            status = "pending" if batch.pending == total else "processing"
+        elif batch.cancelled == total:
+            status = "cancelled"
+        elif batch.failed or batch.cancelled:
+            status = "completed_with_errors"
+        else:
+            status = "completed"
+
+        # 끝난 작업(완료/실패/취소)은 진행률 100으로 본다
+        finished = batch.completed + batch.failed + batch.cancelled
+        progress = min(100.0, (100 * finished + batch.progress_sum) / total) if total else 0.0
+
+        eta = None
+        if batch.active and batch.started_at and progress > 0:
+            elapsed = (datetime.utcnow() - batch.started_at).total_seconds()
+            eta = round(max(0.0, elapsed * (100 - progress) / progress), 1)
+
+        return cls(
+            id=batch.id,
+            name=batch.name,
+            status=status,
+            counts=BatchCounts(
+                total=total,
+                pending=batch.pending,
+                processing=batch.processing,
+                completed=batch.completed,
+                failed=batch.failed,
+                cancelled=batch.cancelled,
+            ),
+            progress=round(progress, 1),
+            audio_seconds=round(batch.audio_seconds or 0.0, 3),
+            eta_seconds=eta,
+            created_at=batch.created_at,
+            updated_at=batch.updated_at,
+            started_at=batch.started_at,
+            finished_at=batch.finished_at,
+        )
@@ -0,0 +1,101 @@
+# [advice from AI] 작업 변경 추적 모델 - 트리거로 매기는 변경 순번(change_seq)과 삭제 기록(tombstone)
+from typing import List
+from pydantic import BaseModel
+from sqlalchemy import Column, String, Integer, Index
+from sqlalchemy.engine import Connection
+
+from backend.database import Base
+from backend.models.job import JobResponse
+
+
+# 삭제 기록 보관 기간 (이보다 오래된 순번으로 변경분을 요청하면 전체 다시 불러오기)
+TOMBSTONE_RETENTION_SECONDS = 7 * 24 * 3600
+
+SEQUENCE_JOBS = "jobs"                    # 마지막으로 매긴 변경 순번
+SEQUENCE_PRUNED = "tombstones_pruned"     # 보관 기간이 지나 지운 삭제 기록의 마지막 순번
+
+
+class JobSequence(Base):
+    """이름별 순번 (jobs 트리거가 같은 트랜잭션에서 증가)"""
+    __tablename__ = "job_sequence"
+
+    name = Column(String(32), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+
+class JobTombstone(Base):
+    """삭제된 작업 (변경분 조회에서 삭제를 알려 주기 위한 기록)"""
+    __tablename__ = "job_tombstones"
+
+    change_seq = Column(Integer, primary_key=True)
+    job_id = Column(String(36), nullable=False)
+    deleted_at = Column(Integer, nullable=False)    # UTC epoch 초
+
+    __table_args__ = (
+        Index("ix_job_tombstones_deleted_at", "deleted_at"),
+    )
+
+
+_NOW = "CAST(strftime('%s', 'now') AS INTEGER)"
+
+_NEXT_SEQ = f"UPDATE job_sequence SET value = value + 1 WHERE name = '{SEQUENCE_JOBS}';"
+_CURRENT_SEQ = f"(SELECT value FROM job_sequence WHERE name = '{SEQUENCE_JOBS}')"
+
+# 트리거 안의 UPDATE jobs는 (recursive_triggers가 꺼져 있으므로) 같은 트리거를 다시 부르지 않고,
+# change_seq만 바꾸므로 다른 UPDATE OF 트리거(카운터, 파일명 색인)도 부르지 않는다.
+# ORM은 트리거가 바꾼 change_seq를 알지 못하므로 필요하면 컬럼만 다시 조회한다.
+# 삭제 트리거의 MAX(+change_seq)는 기본 키 역순 탐색(삭제 기록 전체) 대신 deleted_at 인덱스 범위만 읽게 한다.
+_CHANGE_TRIGGERS_DDL = [
+    f"""CREATE TRIGGER IF NOT EXISTS jobs_change_insert AFTER INSERT ON jobs BEGIN
+        {_NEXT_SEQ}
+        UPDATE jobs SET change_seq = {_CURRENT_SEQ} WHERE rowid = new.rowid;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS jobs_change_update AFTER UPDATE ON jobs
+    WHEN new.change_seq IS old.change_seq BEGIN
+        {_NEXT_SEQ}
+        UPDATE jobs SET change_seq = {_CURRENT_SEQ} WHERE rowid = new.rowid;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS jobs_change_delete AFTER DELETE ON jobs BEGIN
+        {_NEXT_SEQ}
+        INSERT INTO job_tombstones (change_seq, job_id, deleted_at) VALUES ({_CURRENT_SEQ}, old.id, {_NOW});
+        UPDATE job_sequence SET value = MAX(value, COALESCE(
+            (SELECT MAX(+change_seq) FROM job_tombstones WHERE deleted_at < {_NOW} - {TOMBSTONE_RETENTION_SECONDS}),
+            value
+        )) WHERE name = '{SEQUENCE_PRUNED}';
+        DELETE FROM job_tombstones WHERE deleted_at < {_NOW} - {TOMBSTONE_RETENTION_SECONDS};
+    END""",
+]
+
+
+def recreate_change_delete_trigger(conn: Connection):
+    """삭제 트리거만 현재 정의로 다시 생성"""
+    conn.exec_driver_sql("DROP TRIGGER IF EXISTS jobs_change_delete")
+    conn.exec_driver_sql(_CHANGE_TRIGGERS_DDL[-1])
+
+
+def create_change_triggers(conn: Connection):
+    """순번 행과 변경 추적 트리거 생성 (여러 번 실행해도 안전)"""
+    for name in (SEQUENCE_JOBS, SEQUENCE_PRUNED):
+        conn.exec_driver_sql("INSERT OR IGNORE INTO job_sequence (name, value) VALUES (?, 0)", (name,))
+    for ddl in _CHANGE_TRIGGERS_DDL:
+        conn.exec_driver_sql(ddl)
+
+
+def backfill_change_seq(conn: Connection):
+    """순번이 없는 기존 작업에 순번 부여 (rowid 순, 순번 카운터도 맞춤)"""
+    base = conn.exec_driver_sql(f"SELECT value FROM job_sequence WHERE name = '{SEQUENCE_JOBS}'").scalar() or 0
+    conn.exec_driver_sql(f"UPDATE jobs SET change_seq = {base} + rowid WHERE change_seq IS NULL")
+    conn.exec_driver_sql(
+        "UPDATE job_sequence SET value = MAX(value, COALESCE((SELECT MAX(change_seq) FROM jobs), 0)) "
+        f"WHERE name = '{SEQUENCE_JOBS}'"
+    )
+
+
+# Pydantic 스키마
+class JobChangesResponse(BaseModel):
+    """작업 변경분 응답"""
+    token: str                   # 다음 요청의 since 값
+    jobs: List[JobResponse]      # 생성/변경된 작업 (변경 순)
+    deleted: List[str]           # 삭제된 작업 ID
+    has_more: bool               # 남은 변경분이 있으면 token으로 바로 다시 요청
+    reset: bool = False          # since가 너무 오래되었거나 잘못됨 - 목록을 다시 불러와야 함
@@ -0,0 +1,107 @@
+# [advice from AI] 데이터셋 내보내기(Export) 모델 정의 - tar 샤드 + 발화 매니페스트
+from sqlalchemy import Column, String, Integer, BigInteger, DateTime, Text, Enum as SQLEnum
+from sqlalchemy.sql import func
+from enum import Enum
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from datetime import datetime
+import json
+
+from backend.database import Base
+from backend.models.job import JobStatus
+
+
+class ExportStatus(str, Enum):
+    """내보내기 상태"""
+    PENDING = "pending"       # 대기 중
+    RUNNING = "running"       # 샤드 작성 중
+    COMPLETED = "completed"   # 완료
+    FAILED = "failed"         # 실패
+
+
+class Export(Base):
+    """내보내기 테이블"""
+    __tablename__ = "exports"
+
+    id = Column(String(36), primary_key=True)
+    status = Column(SQLEnum(ExportStatus), default=ExportStatus.PENDING, nullable=False)
+    progress = Column(Integer, default=0)
+
+    # 작업 필터 (JSON 문자열)
+    filters = Column(Text, nullable=True)
+    shard_size_mb = Column(Integer, nullable=False)
+
+    # 결과 요약
+    job_count = Column(Integer, default=0)
+    utterance_count = Column(Integer, default=0)
+    total_bytes = Column(BigInteger, default=0)
+    # 샤드 목록 (JSON: [{index, filename, size, job_count, sha256}, ...])
+    shards = Column(Text, nullable=True)
+
+    error_message = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    completed_at = Column(DateTime, nullable=True)
+
+    def load_filters(self) -> dict:
+        """필터(JSON) 조회"""
+        return json.loads(self.filters) if self.filters else {}
+
+    def load_shards(self) -> List[dict]:
+        """샤드 목록(JSON) 조회"""
+        return json.loads(self.shards) if self.shards else []
+
+
+# Pydantic 스키마
+class ExportCreate(BaseModel):
+    """내보내기 요청 (작업 목록 조회와 같은 필터)"""
+    status: JobStatus = JobStatus.COMPLETED
+    search: Optional[str] = None
+    date_from: Optional[str] = Field(None, description="시작일 (YYYY-MM-DD)")
+    date_to: Optional[str] = Field(None, description="종료일 (YYYY-MM-DD)")
+    shard_size_mb: Optional[int] = Field(None, ge=1, description="샤드 최대 크기 (MB, 없으면 설정값)")
+
+
+class ExportShard(BaseModel):
+    """샤드 정보"""
+    index: int
+    filename: str
+    size: int
+    job_count: int
+    sha256: str
+
+
+class ExportResponse(BaseModel):
+    """내보내기 응답"""
+    id: str
+    status: ExportStatus
+    progress: int
+    filters: dict
+    shard_size_mb: int
+    job_count: int
+    utterance_count: int
+    total_bytes: int
+    shards: List[ExportShard]
+    error_message: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    completed_at: Optional[datetime] = None
+
+    @classmethod
+    def from_export(cls, export: Export) -> "ExportResponse":
+        return cls(
+            id=export.id,
+            status=export.status,
+            progress=export.progress or 0,
+            filters=export.load_filters(),
+            shard_size_mb=export.shard_size_mb,
+            job_count=export.job_count or 0,
+            utterance_count=export.utterance_count or 0,
+            total_bytes=export.total_bytes or 0,
+            shards=[ExportShard(**shard) for shard in export.load_shards()],
+            error_message=export.error_message,
+            created_at=export.created_at,
+            updated_at=export.updated_at,
+            completed_at=export.completed_at,
+        )
@@ -1,10 +1,15 @@
 # [advice from AI] 작업(Job) 모델 정의
-from sqlalchemy import Column, String, Integer, Float, DateTime, Text, Enum as SQLEnum
+from sqlalchemy import (
+    or_, and_, column, text, type_coerce,
+    Index, Column, String, Integer, Float, DateTime, Text, Boolean, Enum as SQLEnum,
+)
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from enum import Enum
 from typing import Optional
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import datetime, timedelta
+import json
 
 from backend.database import Base
 
@@ -20,6 +25,17 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"       # 취소됨
 
 
+# [advice from AI] 아직 끝나지 않은 상태 (취소 가능)
+ACTIVE_STATUSES = (JobStatus.PENDING, JobStatus.PARSING, JobStatus.GENERATING_TTS, JobStatus.MIXING)
+
+
+class JobPriority(str, Enum):
+    """[advice from AI] 작업 우선순위 (스케줄러 대기열에서 먼저 시작되는 정도, 실행 중인 작업은 중단하지 않음)"""
+    LOW = "low"           # 야간 일괄 처리 등
+    NORMAL = "normal"     # 업로드 기본값
+    HIGH = "high"         # 사용자가 결과를 기다리는 작업 (명시적으로 지정)
+
+
 class Job(Base):
     """작업 테이블"""
     __tablename__ = "jobs"
@@ -35,18 +51,229 @@ class Job(Base):
     # 설정값 (JSON 문자열로 저장)
     settings = Column(Text, nullable=True)
     
+    # [advice from AI] 파싱 결과 (JSON, 재시도/재합성 시 재사용)
+    # 목록/변경 피드/일괄 처리 조회마다 읽히지 않도록 지연 로드 (필요한 곳에서 undefer)
+    parsed_script = deferred(Column(Text, nullable=True))
+    
+    # [advice from AI] 대화록 수정 시 증가하는 결과 버전
+    version = Column(Integer, default=1)
+    
     # 결과
     output_filename = Column(String(255), nullable=True)
     json_filename = Column(String(255), nullable=True)  # [advice from AI] 발화 정보 JSON 파일
     duration_seconds = Column(Float, nullable=True)
     
+    # [advice from AI] TTS로 보낸 글자 수 누적 (취소/실패로 중단된 요청 포함 - 실제 사용량)
+    tts_characters = Column(Integer, default=0)
+    
     # 에러 정보
     error_message = Column(Text, nullable=True)
     
+    # [advice from AI] 결과 캐시 (대화록 + 설정 해시)
+    content_hash = Column(String(64), nullable=True, index=True)
+    cache_hit = Column(Boolean, default=False)
+    cache_source_id = Column(String(36), nullable=True)  # 결과를 재사용한(또는 대기 중인) 원본 작업
+    
     # 타임스탬프
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     completed_at = Column(DateTime, nullable=True)
+    
+    # [advice from AI] 함께 등록된 배치 (다중 업로드/압축 업로드, 단일 업로드는 None)
+    batch_id = Column(String(36), nullable=True)
+    
+    # [advice from AI] 스케줄러 우선순위 (같은 배치 안에서는 순서대로, 배치 사이에서는 가중 공정 분배)
+    priority = Column(
+        SQLEnum(JobPriority), default=JobPriority.NORMAL, server_default=JobPriority.NORMAL.name, nullable=False
+    )
+    
+    # [advice from AI] 변경 순번 (INSERT/UPDATE마다 트리거가 증가시킴 - 변경분 조회, ETag용)
+    change_seq = Column(Integer, nullable=True)
+    
+    # [advice from AI] 파일명 검색(FTS) 행 번호 (INSERT 트리거가 부여, VACUUM에도 바뀌지 않음)
+    search_rowid = Column(Integer, nullable=True)
+    
+    # [advice from AI] 목록 필터/정렬, 통계, 캐시 후속 작업 조회에 맞춘 인덱스
+    # (기존 DB에는 backend.migrations에서 생성)
+    # 목록 정렬 인덱스는 id까지 포함해야 키셋 페이지네이션의 (정렬 값, id) 순서를 그대로 따라간다.
+    # 파일명은 NOCASE 인덱스라 대소문자 무시 정렬과 접두어 검색(LIKE 'abc%')에 함께 쓰인다.
+    __table_args__ = (
+        Index("ix_jobs_status_created_id", "status", "created_at", "id"),
+        Index("ix_jobs_created_id", "created_at", "id"),
+        Index("ix_jobs_status_completed", "status", "completed_at"),
+        Index("ix_jobs_cache_source_status", "cache_source_id", "status"),
+        Index("ix_jobs_filename_nocase", original_filename.collate("NOCASE"), "id"),
+        Index("ix_jobs_change_seq", "change_seq"),
+        Index("ix_jobs_batch_status", "batch_id", "status"),
+        Index("ix_jobs_search_rowid", "search_rowid", unique=True),
+    )
+    
+    def load_settings(self) -> dict:
+        """설정값(JSON) 조회"""
+        if not self.settings:
+            return {}
+        try:
+            return json.loads(self.settings)
+        except ValueError:
+            return {}
+    
+    @property
+    def seed(self) -> Optional[int]:
+        """작업 시드 (타임스탬프/음성 할당 재현용)"""
+        return self.load_settings().get("seed")
+    
+    def update_settings(self, **values):
+        """설정값(JSON) 일부 갱신"""
+        current = self.load_settings()
+        current.update(values)
+        self.settings = json.dumps(current, ensure_ascii=False)
+
+
+# [advice from AI] 파일명 검색 인덱스 (jobs.original_filename을 참조하는 external content FTS5 테이블)
+# jobs는 INTEGER PRIMARY KEY가 없어 내부 rowid가 VACUUM 때 바뀔 수 있으므로
+# INSERT 트리거가 부여하는 search_rowid 컬럼(고유 인덱스)으로 연결한다.
+JOB_FTS_TABLE = "jobs_fts"
+
+_JOB_FTS_TABLE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5("
+    "original_filename, content='jobs', content_rowid='search_rowid', tokenize='{tokenizer}')"
+)
+
+_JOB_FTS_TRIGGER_NAMES = ("jobs_fts_insert", "jobs_fts_delete", "jobs_fts_update")
+
+# 트리거 안의 UPDATE는 search_rowid만 바꾸므로 UPDATE OF 트리거(카운터, 파일명 색인)는 부르지 않는다.
+# 번호는 고유 인덱스의 최댓값 + 1 (삭제된 최댓값은 색인에서도 지워졌으므로 다시 써도 안전)
+_JOB_FTS_TRIGGERS_DDL = [
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+        UPDATE jobs SET search_rowid = (SELECT COALESCE(MAX(search_rowid), 0) + 1 FROM jobs)
+        WHERE rowid = new.rowid;
+        INSERT INTO jobs_fts(rowid, original_filename)
+        SELECT search_rowid, original_filename FROM jobs WHERE rowid = new.rowid;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, original_filename)
+        VALUES ('delete', old.search_rowid, old.original_filename);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF original_filename ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, original_filename)
+        VALUES ('delete', old.search_rowid, old.original_filename);
+        INSERT INTO jobs_fts(rowid, original_filename) VALUES (new.search_rowid, new.original_filename);
+    END""",
+]
+
+# 사용 중인 FTS5 토크나이저 (init_db에서 설정)
+_search_tokenizer = "trigram"
+
+# trigram 토크나이저가 색인으로 찾을 수 있는 최소 검색어 길이
+TRIGRAM_MIN_LENGTH = 3
+
+
+def create_job_search(connection) -> str:
+    """
+    파일명 FTS5 테이블과 동기화 트리거 생성 (동기 연결 - run_sync에서 호출)
+
+    Returns:
+        사용 중인 토크나이저 이름
+    """
+    global _search_tokenizer
+    from backend.migrations import create_fts_table
+
+    _search_tokenizer = create_fts_table(connection, JOB_FTS_TABLE, _JOB_FTS_TABLE_DDL)
+    for ddl in _JOB_FTS_TRIGGERS_DDL:
+        connection.exec_driver_sql(ddl)
+    return _search_tokenizer
+
+
+def drop_job_search(connection):
+    """파일명 FTS5 테이블과 트리거 삭제 (연결 방식이 바뀐 정의로 다시 만들 때, create_job_search가 재색인)"""
+    for name in _JOB_FTS_TRIGGER_NAMES:
+        connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+    connection.exec_driver_sql(f"DROP TABLE IF EXISTS {JOB_FTS_TABLE}")
+
+
+def job_search_condition(search: str):
+    """
+    파일명/ID 검색 조건 (전체 테이블 스캔 없이 인덱스로 찾음)
+
+    - 파일명: trigram FTS로 부분 문자열 검색 (대소문자 무시)
+      3글자 미만은 trigram 색인을 쓸 수 없으므로 NOCASE 인덱스로 접두어 검색
+    - ID: 접두어 검색 (기본키 인덱스 범위)
+    """
+    term = search.strip()
+    id_prefix = term.lower()
+    by_id = and_(Job.id >= id_prefix, Job.id < id_prefix + "\uffff")
+
+    if _search_tokenizer != "trigram" or len(term) >= TRIGRAM_MIN_LENGTH:
+        match = '"' + term.replace('"', '""') + '"'
+        if _search_tokenizer != "trigram":
+            match += "*"   # unicode61은 토큰 접두어 검색
+        matched = text(
+            "SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH :job_search_match"
+        ).bindparams(job_search_match=match).columns(column("rowid"))
+        by_name = Job.search_rowid.in_(matched)
+    else:
+        escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        by_name = Job.original_filename.like(escaped + "%", escape="\\")
+
+    return or_(by_name, by_id)
+
+
+# [advice from AI] 목록 정렬 기준 (키: sort_by 값, 값: (정렬 식, NULL 가능 여부))
+# 날짜/상태는 DB에 저장된 문자열 그대로 비교해야 커서 값이 저장 형식과 어긋나지 않는다.
+JOB_SORT_COLUMNS = {
+    "created_at": (type_coerce(Job.created_at, String), False),
+    "updated_at": (type_coerce(Job.updated_at, String), False),
+    "completed_at": (type_coerce(Job.completed_at, String), True),
+    "original_filename": (Job.original_filename.collate("NOCASE"), False),
+    "status": (type_coerce(Job.status, String), False),
+    "progress": (Job.progress, True),
+    "duration_seconds": (Job.duration_seconds, True),
+}
+
+DEFAULT_SORT = "created_at"
+
+
+# [advice from AI] 목록 조회/내보내기가 함께 쓰는 작업 필터
+def job_filters(
+    status: Optional[JobStatus] = None,
+    search: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    batch_id: Optional[str] = None,
+) -> list:
+    """
+    작업 필터 조건 목록 (상태, 파일명/ID 검색, 생성일 범위, 배치)
+    
+    날짜 형식(YYYY-MM-DD)이 잘못된 값은 무시한다.
+    """
+    conditions = []
+    
+    # 상태 필터
+    if status:
+        conditions.append(Job.status == status)
+    
+    # 배치 필터
+    if batch_id:
+        conditions.append(Job.batch_id == batch_id)
+    
+    # 파일명 검색
+    if search and search.strip():
+        conditions.append(job_search_condition(search))
+    
+    # 날짜 필터
+    if date_from:
+        try:
+            conditions.append(Job.created_at >= datetime.strptime(date_from, "%Y-%m-%d"))
+        except ValueError:
+            pass
+    
+    if date_to:
+        try:
+            conditions.append(Job.created_at < datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1))
+        except ValueError:
+            pass
+    
+    return conditions
 
 
 # Pydantic 스키마
@@ -66,7 +293,14 @@ class JobResponse(BaseModel):
     output_filename: Optional[str] = None
     json_filename: Optional[str] = None  # [advice from AI] 발화 정보 JSON 파일
     duration_seconds: Optional[float] = None
+    tts_characters: Optional[int] = 0
     error_message: Optional[str] = None
+    cache_hit: bool = False
+    cache_source_id: Optional[str] = None
+    batch_id: Optional[str] = None
+    priority: JobPriority = JobPriority.NORMAL
+    version: int = 1
+    seed: Optional[int] = None
     created_at: datetime
     updated_at: datetime
     completed_at: Optional[datetime] = None
@@ -81,4 +315,22 @@ class JobListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    # [advice from AI] 다음 페이지 커서 (마지막 페이지면 None), 총 개수가 캐시 값인지 여부
+    next_cursor: Optional[str] = None
+    total_cached: bool = False
+
+
+
+# [advice from AI] 대화록 수정(재합성) 요청/응답
+class ScriptUpdateRequest(BaseModel):
+    """대화록 수정 요청"""
+    content: str
+
 
+class ScriptUpdateResponse(BaseModel):
+    """대화록 수정 응답 (변경 요약 포함)"""
+    job: JobResponse
+    unchanged: int
+    changed: int
+    added: int
+    removed: int
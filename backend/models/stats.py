@@ -0,0 +1,123 @@
+# [advice from AI] 작업 통계 모델 - 트리거로 갱신하는 상태별 카운터와 분 단위 처리량
+from sqlalchemy import Column, String, Integer, Float
+from sqlalchemy.engine import Connection
+
+from backend.database import Base
+from backend.models.job import JobStatus
+
+
+# 처리량 버킷 크기 (초)와 보관 기간
+THROUGHPUT_BUCKET_SECONDS = 60
+THROUGHPUT_RETENTION_SECONDS = 8 * 24 * 3600
+
+
+class JobCounter(Base):
+    """상태별 작업 수와 작업 길이 합계 (jobs 트리거가 같은 트랜잭션에서 갱신)"""
+    __tablename__ = "job_counters"
+
+    status = Column(String(32), primary_key=True)   # JobStatus 이름 (jobs.status와 같은 값)
+    count = Column(Integer, nullable=False, default=0)
+    duration_total = Column(Float, nullable=False, default=0.0)
+    duration_count = Column(Integer, nullable=False, default=0)
+
+
+class JobThroughput(Base):
+    """분 단위 완료/실패 수와 생성된 오디오 길이 (최근 THROUGHPUT_RETENTION_SECONDS만 보관)"""
+    __tablename__ = "job_throughput"
+
+    bucket = Column(Integer, primary_key=True)      # 버킷 시작 시각 (UTC epoch 초)
+    completed = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    audio_seconds = Column(Float, nullable=False, default=0.0)
+
+
+_COMPLETED = JobStatus.COMPLETED.name
+_FAILED = JobStatus.FAILED.name
+_NOW = "CAST(strftime('%s', 'now') AS INTEGER)"
+
+
+def _count_in(row: str) -> str:
+    return f"""
+        INSERT INTO job_counters (status, count, duration_total, duration_count)
+        VALUES ({row}.status, 1, COALESCE({row}.duration_seconds, 0), {row}.duration_seconds IS NOT NULL)
+        ON CONFLICT(status) DO UPDATE SET
+            count = count + 1,
+            duration_total = duration_total + excluded.duration_total,
+            duration_count = duration_count + excluded.duration_count;"""
+
+
+def _count_out(row: str) -> str:
+    return f"""
+        UPDATE job_counters SET
+            count = count - 1,
+            duration_total = duration_total - COALESCE({row}.duration_seconds, 0),
+            duration_count = duration_count - ({row}.duration_seconds IS NOT NULL)
+        WHERE status = {row}.status;"""
+
+
+_RECORD_FINISHED = f"""
+        INSERT INTO job_throughput (bucket, completed, failed, audio_seconds)
+        VALUES (
+            {_NOW} / {THROUGHPUT_BUCKET_SECONDS} * {THROUGHPUT_BUCKET_SECONDS},
+            new.status = '{_COMPLETED}',
+            new.status = '{_FAILED}',
+            CASE WHEN new.status = '{_COMPLETED}' THEN COALESCE(new.duration_seconds, 0) ELSE 0 END
+        )
+        ON CONFLICT(bucket) DO UPDATE SET
+            completed = completed + excluded.completed,
+            failed = failed + excluded.failed,
+            audio_seconds = audio_seconds + excluded.audio_seconds;
+        DELETE FROM job_throughput WHERE bucket < {_NOW} - {THROUGHPUT_RETENTION_SECONDS};"""
+
+
+_STATS_TRIGGERS_DDL = [
+    f"""CREATE TRIGGER IF NOT EXISTS job_counters_insert AFTER INSERT ON jobs BEGIN
+        {_count_in("new")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS job_counters_update AFTER UPDATE OF status, duration_seconds ON jobs
+    WHEN old.status IS NOT new.status OR old.duration_seconds IS NOT new.duration_seconds BEGIN
+        {_count_out("old")}
+        {_count_in("new")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS job_counters_delete AFTER DELETE ON jobs BEGIN
+        {_count_out("old")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS job_throughput_insert AFTER INSERT ON jobs
+    WHEN new.status IN ('{_COMPLETED}', '{_FAILED}') BEGIN
+        {_RECORD_FINISHED}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS job_throughput_update AFTER UPDATE OF status ON jobs
+    WHEN new.status IN ('{_COMPLETED}', '{_FAILED}') AND old.status IS NOT new.status BEGIN
+        {_RECORD_FINISHED}
+    END""",
+]
+
+
+def create_stats_triggers(conn: Connection):
+    """카운터/처리량 트리거 생성 (여러 번 실행해도 안전)"""
+    for ddl in _STATS_TRIGGERS_DDL:
+        conn.exec_driver_sql(ddl)
+
+
+def rebuild_job_counters(conn: Connection):
+    """
+    jobs 테이블 전체를 집계해 카운터를 다시 계산
+
+    처리량은 완료 시각(completed_at)이 보관 기간 안에 있는 완료 작업만 복원한다.
+    (실패 시각은 기록되지 않으므로 실패 수는 복원하지 않음)
+    """
+    conn.exec_driver_sql("DELETE FROM job_counters")
+    conn.exec_driver_sql(
+        "INSERT INTO job_counters (status, count, duration_total, duration_count) "
+        "SELECT status, COUNT(*), COALESCE(SUM(duration_seconds), 0), COUNT(duration_seconds) "
+        "FROM jobs GROUP BY status"
+    )
+    conn.exec_driver_sql("DELETE FROM job_throughput")
+    conn.exec_driver_sql(
+        "INSERT INTO job_throughput (bucket, completed, failed, audio_seconds) "
+        f"SELECT CAST(strftime('%s', completed_at) AS INTEGER) / {THROUGHPUT_BUCKET_SECONDS} "
+        f"* {THROUGHPUT_BUCKET_SECONDS} AS bucket, COUNT(*), 0, COALESCE(SUM(duration_seconds), 0) "
+        f"FROM jobs WHERE status = '{_COMPLETED}' AND completed_at IS NOT NULL "
+        f"AND CAST(strftime('%s', completed_at) AS INTEGER) >= {_NOW} - {THROUGHPUT_RETENTION_SECONDS} "
+        "GROUP BY bucket"
+    )
@@ -0,0 +1,96 @@
+# [advice from AI] 발화(Utterance) 모델 정의 - 발화 JSON을 DB에 색인 (미리보기/전체 검색용)
+from sqlalchemy import Column, String, Integer, Float, Text, Index
+from typing import List, Optional
+from pydantic import BaseModel
+
+from backend.database import Base
+
+
+class Utterance(Base):
+    """발화 테이블 (렌더링 단계에서 작업별로 일괄 저장)"""
+    __tablename__ = "utterances"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(String(36), nullable=False)
+    turn_idx = Column(Integer, nullable=False)
+    role = Column(String(16), nullable=False)
+    text = Column(Text, nullable=False)
+    started_at = Column(Float, nullable=False)
+    ended_at = Column(Float, nullable=False)
+    start_sample = Column(Integer, nullable=True)
+    end_sample = Column(Integer, nullable=True)
+
+    __table_args__ = (
+        Index("ix_utterances_job_turn", "job_id", "turn_idx", unique=True),
+    )
+
+
+# 전문 검색 인덱스 (utterances.text를 참조하는 external content FTS5 테이블)
+# trigram 토크나이저는 띄어쓰기 없는 한국어 부분 문자열 검색이 가능 (SQLite 3.34+)
+FTS_TABLE = "utterances_fts"
+
+_FTS_TABLE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS utterances_fts USING fts5("
+    "text, content='utterances', content_rowid='id', tokenize='{tokenizer}')"
+)
+
+_FTS_TRIGGERS_DDL = [
+    """CREATE TRIGGER IF NOT EXISTS utterances_fts_insert AFTER INSERT ON utterances BEGIN
+        INSERT INTO utterances_fts(rowid, text) VALUES (new.id, new.text);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS utterances_fts_delete AFTER DELETE ON utterances BEGIN
+        INSERT INTO utterances_fts(utterances_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS utterances_fts_update AFTER UPDATE OF text ON utterances BEGIN
+        INSERT INTO utterances_fts(utterances_fts, rowid, text) VALUES ('delete', old.id, old.text);
+        INSERT INTO utterances_fts(rowid, text) VALUES (new.id, new.text);
+    END""",
+    # 작업이 어떤 경로로 삭제되든 발화도 함께 삭제
+    """CREATE TRIGGER IF NOT EXISTS jobs_delete_utterances AFTER DELETE ON jobs BEGIN
+        DELETE FROM utterances WHERE job_id = old.id;
+    END""",
+]
+
+
+def create_utterance_search(connection) -> str:
+    """
+    FTS5 테이블과 동기화 트리거 생성 (동기 연결 - run_sync에서 호출)
+
+    trigram 토크나이저를 지원하지 않는 SQLite면 unicode61로 만든다.
+    이미 있는 테이블은 그대로 두고, 처음 만들면 기존 발화로 다시 색인한다.
+
+    Returns:
+        사용 중인 토크나이저 이름
+    """
+    from backend.migrations import create_fts_table
+
+    tokenizer = create_fts_table(connection, FTS_TABLE, _FTS_TABLE_DDL)
+    for ddl in _FTS_TRIGGERS_DDL:
+        connection.exec_driver_sql(ddl)
+    return tokenizer
+
+
+# Pydantic 스키마
+class UtteranceHit(BaseModel):
+    """발화 검색 결과 한 건"""
+    job_id: str
+    original_filename: str
+    turn_idx: int
+    role: str
+    text: str
+    snippet: Optional[str] = None
+    started_at: float
+    ended_at: float
+    start_sample: Optional[int] = None
+    end_sample: Optional[int] = None
+    clip_url: str
+
+
+class UtteranceSearchResponse(BaseModel):
+    """발화 검색 응답"""
+    query: str
+    results: List[UtteranceHit]
+    limit: int
+    offset: int
+    has_more: bool
+    elapsed_ms: float
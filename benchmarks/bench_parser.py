@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+대화록 파서 마이크로 벤치마크
+[advice from AI] 기존 방식(검증 + 파싱 2회, 태그별 정규식)과 단일 스캔 토크나이저 비교,
+스트리밍 파서(파일 줄 단위)의 최대 메모리 사용량 비교
+
+사용법:
+    python benchmarks/bench_parser.py [--size-mb 8] [--repeat 3]
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.core.parser import (  # noqa: E402
+    SPEAKER_PATTERN,
+    ACTION_PATTERN,
+    DELAY_PATTERN,
+    SUMMARY_START,
+    Dialogue,
+    ScriptStream,
+    parse_and_validate,
+)
+from backend.core.timestamp import estimate_timeline  # noqa: E402
+
+SAMPLE_LINES = [
+    "상담사: 네, 고객님 확인해 보겠습니다. 잠시만 기다려 주세요.",
+    "고객: 지난주에 주문한 상품이 아직 도착하지 않아서요.",
+    "상담사: [ACTION: 주문 조회] 확인해보니 배송이 지연되고 있습니다. [DELAY: 2.5s] 죄송합니다.",
+    "고객: 언제쯤 받을 수 있을까요?",
+    "상담사: [ACTION: 택배사 확인] [DELAY: 3s] 내일 오전 중 도착 예정입니다.",
+    "",
+]
+
+
+def build_transcript(size_mb: float) -> str:
+    """지정 크기 이상의 합성 대화록 생성 (요약 포함)"""
+    target = int(size_mb * 1024 * 1024)
+    block = "\n".join(SAMPLE_LINES) + "\n"
+    repeat = target // len(block.encode("utf-8")) + 1
+    return block * repeat + "---\n<SCENARIO_SUMMARY>\n벤치마크용 요약\n</SCENARIO_SUMMARY>\n"
+
+
+def legacy_parse(content: str) -> int:
+    """기존 파서 동작 재현 (줄마다 ACTION/DELAY 정규식 2회 + 공백 re.sub)"""
+    main_content = SUMMARY_START.split(content, maxsplit=1)[0]
+    dialogues = []
+    for line_num, line in enumerate(main_content.split("\n"), start=1):
+        line = line.strip()
+        if not line:
+            continue
+        match = SPEAKER_PATTERN.match(line)
+        if match:
+            raw_text = match.group(2)
+            actions = ACTION_PATTERN.findall(raw_text)
+            delays = [float(d) for d in DELAY_PATTERN.findall(raw_text)]
+            text = ACTION_PATTERN.sub("", raw_text)
+            text = DELAY_PATTERN.sub("", text)
+            text = re.sub(r"\s+", " ", text).strip()
+            dialogues.append(Dialogue(line_num, match.group(1), text, raw_text, actions, delays))
+    return len(dialogues)
+
+
+def legacy_pipeline(content: str) -> int:
+    """기존 process_script 경로: validate_script(내부 파싱) 후 parse_script 재호출"""
+    legacy_parse(content)
+    return legacy_parse(content)
+
+
+def single_pass_pipeline(content: str) -> int:
+    """단일 스캔 토크나이저 + 파싱 1회"""
+    parsed, _ = parse_and_validate(content)
+    return len(parsed.dialogues)
+
+
+def bench(name: str, func, content: str, repeat: int) -> float:
+    """최소 실행 시간 측정"""
+    best = float("inf")
+    result = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(content)
+        best = min(best, time.perf_counter() - started)
+    size_mb = len(content.encode("utf-8")) / (1024 * 1024)
+    print(f"{name:<24} {best * 1000:9.1f} ms  {size_mb / best:7.1f} MB/s  ({result} dialogues)")
+    return best
+
+
+def read_and_parse(path: str) -> int:
+    """기존 방식: 파일 전체를 읽은 뒤 대화 목록 생성"""
+    with open(path, "r", encoding="utf-8") as f:
+        parsed, _ = parse_and_validate(f.read())
+    return len(parsed.dialogues)
+
+
+def stream_estimate(path: str) -> int:
+    """스트리밍 방식: 파일을 줄 단위로 읽으며 대화 목록 없이 집계"""
+    with open(path, "r", encoding="utf-8") as f:
+        return estimate_timeline(ScriptStream(f)).dialogue_count
+
+
+def peak_memory(name: str, func, path: str):
+    """tracemalloc 기준 최대 메모리 사용량 측정"""
+    tracemalloc.start()
+    result = func(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<24} peak {peak / (1024 * 1024):7.1f} MB  ({result} dialogues)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대화록 파서 벤치마크")
+    parser.add_argument("--size-mb", type=float, default=8.0, help="합성 대화록 크기 (MB)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    content = build_transcript(args.size_mb)
+    print(f"transcript: {len(content.encode('utf-8')) / (1024 * 1024):.1f} MB")
+
+    legacy = bench("legacy (validate+parse)", legacy_pipeline, content, args.repeat)
+    current = bench("single-pass", single_pass_pipeline, content, args.repeat)
+    print(f"speedup: {legacy / current:.2f}x")
+
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".txt", delete=False) as f:
+        f.write(content)
+        path = f.name
+    del content
+    try:
+        peak_memory("read + parse", read_and_parse, path)
+        peak_memory("streaming estimate", stream_estimate, path)
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
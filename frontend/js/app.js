@@ -4,10 +4,15 @@ const API_BASE = '/api';
 const state = {
     selectedFiles: [],
     selectedJobs: new Set(),
-    jobs: { data: [], total: 0, page: 1, pageSize: 20, search: '', status: '', sortBy: 'created_at', sortOrder: 'desc' },
+    jobs: { data: [], total: 0, page: 1, pageSize: 20, search: '', status: '', sortBy: 'created_at', sortOrder: 'desc', cursors: {}, cursorKey: '' },
     autoRefresh: null,
+    events: null,
+    changeToken: null,
+    refreshTimer: null,
+    pendingRefresh: { stats: false, jobs: false },
     currentJobId: null,
-    utterances: []
+    utterances: [],
+    waveform: null
 };
 
 // === 초기화 ===
@@ -19,15 +24,61 @@ document.addEventListener('DOMContentLoaded', () => {
     initSettingsModal();
     loadStats();
     loadJobs();
-    startAutoRefresh();
+    connectJobEvents();
 });
 
+// [advice from AI] 작업 이벤트 스트림(SSE) - 변경된 행만 갱신하고 목록/통계는 필요할 때만 다시 조회
+function connectJobEvents() {
+    if (!window.EventSource) {
+        startAutoRefresh();
+        return;
+    }
+    
+    const es = new EventSource(API_BASE + '/jobs/events');
+    state.events = es;
+    
+    es.addEventListener('created', () => scheduleRefresh(true, true));
+    es.addEventListener('updated', (e) => applyJobEvent(JSON.parse(e.data)));
+    es.addEventListener('deleted', (e) => {
+        const ev = JSON.parse(e.data);
+        scheduleRefresh(true, state.jobs.data.some(j => j.id === ev.id));
+    });
+    // 놓친 이벤트를 이어 받을 수 없으면 전체 다시 조회
+    es.addEventListener('reset', () => scheduleRefresh(true, true));
+}
+
+function applyJobEvent(ev) {
+    const job = state.jobs.data.find(j => j.id === ev.id);
+    if (job) {
+        Object.keys(ev).forEach(k => { if (k in job) job[k] = ev[k]; });
+        renderTable(state.jobs.data);
+    }
+    if (ev.status_changed) {
+        // 상태 필터/상태 정렬 중이면 목록 구성이 바뀔 수 있음
+        scheduleRefresh(true, !!(state.jobs.status || state.jobs.sortBy === 'status'));
+    }
+}
+
+function scheduleRefresh(stats, jobs) {
+    state.pendingRefresh.stats = state.pendingRefresh.stats || stats;
+    state.pendingRefresh.jobs = state.pendingRefresh.jobs || jobs;
+    if (state.refreshTimer) return;
+    
+    // 짧은 시간에 몰린 이벤트는 한 번의 조회로 합침
+    state.refreshTimer = setTimeout(() => {
+        const pending = state.pendingRefresh;
+        state.pendingRefresh = { stats: false, jobs: false };
+        state.refreshTimer = null;
+        if (pending.stats) loadStats();
+        if (pending.jobs) loadJobs();
+    }, 500);
+}
+
 function startAutoRefresh() {
-    if (state.autoRefresh) clearInterval(state.autoRefresh);
+    if (state.autoRefresh) clearTimeout(state.autoRefresh);
     
     async function refresh() {
-        await loadStats();
-        await loadJobs();
+        await pollChanges();
         
         // 처리 중인 작업이 있으면 2초, 없으면 10초 간격
         const hasProcessing = state.jobs.data.some(j => 
@@ -41,6 +92,35 @@ function startAutoRefresh() {
     refresh();
 }
 
+// [advice from AI] 이벤트 스트림을 쓸 수 없을 때 - 바뀐 작업만 받아 보이는 행 갱신
+async function pollChanges() {
+    try {
+        const data = await fetchAPI('/jobs/changes' + (state.changeToken ? '?since=' + state.changeToken : ''));
+        const first = !state.changeToken;
+        state.changeToken = data.token;
+        if (first || data.reset) {
+            scheduleRefresh(true, true);
+            return;
+        }
+        
+        let stats = data.deleted.length > 0;
+        let jobs = data.deleted.some(id => state.jobs.data.some(j => j.id === id));
+        data.jobs.forEach(changed => {
+            const row = state.jobs.data.find(j => j.id === changed.id);
+            if (!row) {
+                // 새 작업은 대기 상태로 시작
+                stats = true;
+                jobs = jobs || changed.status === 'pending';
+                return;
+            }
+            if (row.status !== changed.status) stats = true;
+            Object.assign(row, changed);
+        });
+        if (data.jobs.length) renderTable(state.jobs.data);
+        if (stats || jobs) scheduleRefresh(stats, jobs);
+    } catch (e) {}
+}
+
 // === 통계 ===
 async function loadStats() {
     try {
@@ -185,28 +265,29 @@ async function startUpload() {
     showLoading(total + '개 파일 업로드 중...');
     let ok = 0, fail = 0;
     
-    // 파일 배열 복사 (순회 중 변경 방지)
+    // 파일 배열 복사 (업로드 중 변경 방지)
     const filesToUpload = [...state.selectedFiles];
     
-    for (let i = 0; i < filesToUpload.length; i++) {
-        const file = filesToUpload[i];
-        try {
-            const fd = new FormData();
-            fd.append('file', file);
-            const res = await fetch(API_BASE + '/upload/', { method: 'POST', body: fd });
-            if (res.ok) {
-                ok++;
-            } else {
-                fail++;
-                console.error('Upload failed:', file.name, res.status);
-            }
-        } catch (e) {
-            fail++;
-            console.error('Upload error:', file.name, e);
+    // [advice from AI] 한 번 고른 파일들은 요청 하나로 보내 한 배치(스케줄러의 한 흐름)로 등록
+    // (파일마다 /upload/로 보내면 파일마다 흐름이 생겨 공정 분배를 독차지함)
+    const fd = new FormData();
+    const single = filesToUpload.length === 1;
+    filesToUpload.forEach(file => fd.append(single ? 'file' : 'files', file));
+    if (document.getElementById('urgentUpload').checked) fd.append('priority', 'high');
+    
+    try {
+        const res = await fetch(API_BASE + (single ? '/upload/' : '/upload/batch'), { method: 'POST', body: fd });
+        if (res.ok) {
+            const data = await res.json();
+            ok = single ? 1 : data.length;
+            fail = total - ok;
+        } else {
+            fail = total;
+            console.error('Upload failed:', res.status);
         }
-        // 진행률 업데이트
-        document.getElementById('loadingText').textContent = 
-            '업로드 중... (' + (i + 1) + '/' + total + ')';
+    } catch (e) {
+        fail = total;
+        console.error('Upload error:', e);
     }
     
     hideLoading();
@@ -227,6 +308,7 @@ function initToolbar() {
     
     document.getElementById('batchDownloadBtn').onclick = batchDownload;
     document.getElementById('batchRetryBtn').onclick = batchRetry;
+    document.getElementById('batchCancelBtn').onclick = batchCancel;
     document.getElementById('batchDeleteBtn').onclick = batchDelete;
 }
 
@@ -268,9 +350,19 @@ async function loadJobs() {
         if (state.jobs.search) p.append('search', state.jobs.search);
         if (state.jobs.status) p.append('status', state.jobs.status);
         
+        // [advice from AI] 앞 페이지에서 받은 커서가 있으면 키셋으로 조회 (필터/정렬이 바뀌면 초기화)
+        const cursorKey = [state.jobs.search, state.jobs.status, state.jobs.sortBy, state.jobs.sortOrder, state.jobs.pageSize].join('|');
+        if (cursorKey !== state.jobs.cursorKey) {
+            state.jobs.cursors = {};
+            state.jobs.cursorKey = cursorKey;
+        }
+        const cursor = state.jobs.cursors[state.jobs.page];
+        if (cursor) p.append('cursor', cursor);
+        
         const data = await fetchAPI('/jobs/?' + p);
         state.jobs.data = data.jobs;
         state.jobs.total = data.total;
+        if (data.next_cursor) state.jobs.cursors[data.page + 1] = data.next_cursor;
         
         renderTable(data.jobs);
         renderPagination(data.total, data.page, data.page_size);
@@ -314,6 +406,10 @@ function renderActions(j) {
     if (j.status === 'failed') {
         a.push('<button class="action-btn" onclick="retryJob(\'' + j.id + '\')">재시도</button>');
     }
+    // [advice from AI] 대기/처리 중인 작업 취소 (진행 중인 TTS 요청 중단)
+    if (['pending', 'parsing', 'generating_tts', 'mixing'].includes(j.status)) {
+        a.push('<button class="action-btn" onclick="cancelJob(\'' + j.id + '\')">취소</button>');
+    }
     a.push('<button class="action-btn delete" onclick="deleteJob(\'' + j.id + '\')">삭제</button>');
     return a.join('');
 }
@@ -398,6 +494,26 @@ async function batchRetry() {
     hideLoading();
 }
 
+// [advice from AI] 선택한 작업 중 끝나지 않은 작업 일괄 취소
+async function batchCancel() {
+    if (state.selectedJobs.size === 0) return;
+    if (!confirm(state.selectedJobs.size + '개 중 대기/처리 중인 작업을 취소하시겠습니까?')) return;
+    showLoading('취소 중...');
+    try {
+        const res = await fetchAPI('/jobs/batch/cancel', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(Array.from(state.selectedJobs))
+        });
+        showToast(res.cancelled_count + '개 작업 취소', 'success');
+        loadStats();
+        loadJobs();
+    } catch (e) {
+        showToast('취소 실패', 'error');
+    }
+    hideLoading();
+}
+
 async function batchDownload() {
     if (state.selectedJobs.size === 0) return;
     for (const id of state.selectedJobs) {
@@ -430,6 +546,16 @@ async function retryJob(id) {
     }
 }
 
+async function cancelJob(id) {
+    try {
+        await fetchAPI('/jobs/' + id + '/cancel', { method: 'POST' });
+        showToast('작업 취소됨', 'success');
+        loadJobs();
+    } catch (e) {
+        showToast('취소 실패: ' + e.message, 'error');
+    }
+}
+
 function downloadAll(id) {
     window.open(API_BASE + '/files/' + id + '/download-all', '_blank');
 }
@@ -446,12 +572,26 @@ function initPreviewModal() {
     player.ontimeupdate = () => {
         document.getElementById('currentTime').textContent = formatTime(player.currentTime);
         updateActiveUtterance(player.currentTime);
+        drawWaveform(player.currentTime);
+    };
+    
+    // [advice from AI] 파형 클릭 시 해당 위치로 이동
+    document.getElementById('waveformCanvas').onclick = (e) => {
+        if (!state.waveform) return;
+        const rect = e.currentTarget.getBoundingClientRect();
+        player.currentTime = (e.clientX - rect.left) / rect.width * state.waveform.duration_seconds;
     };
     
     player.onloadedmetadata = () => {
         document.getElementById('totalTime').textContent = formatTime(player.duration);
     };
     
+    // [advice from AI] 미리듣기 파일을 만들 수 없으면 원본 WAV 스트리밍으로 전환
+    player.onerror = () => {
+        const fallback = API_BASE + '/files/' + state.currentJobId + '/stream';
+        if (state.currentJobId && !player.src.endsWith(fallback)) player.src = fallback;
+    };
+    
     // 다운로드 버튼
     document.getElementById('downloadWavBtn').onclick = () => {
         if (state.currentJobId) window.open(API_BASE + '/files/' + state.currentJobId + '/download', '_blank');
@@ -464,6 +604,13 @@ function initPreviewModal() {
     };
 }
 
+// [advice from AI] 저용량 미리듣기 URL (Opus를 재생할 수 없는 브라우저는 MP3)
+function previewAudioUrl(jobId) {
+    const probe = document.createElement('audio');
+    const format = probe.canPlayType('audio/ogg; codecs="opus"') ? 'opus' : 'mp3';
+    return API_BASE + '/files/' + jobId + '/preview?format=' + format;
+}
+
 async function openPreview(jobId, filename) {
     state.currentJobId = jobId;
     
@@ -471,7 +618,8 @@ async function openPreview(jobId, filename) {
     const player = document.getElementById('audioPlayer');
     
     document.getElementById('previewTitle').textContent = filename;
-    player.src = API_BASE + '/files/' + jobId + '/stream';
+    player.src = previewAudioUrl(jobId);
+    loadWaveform(jobId);
     
     // JSON 로드
     try {
@@ -487,6 +635,7 @@ async function openPreview(jobId, filename) {
         document.getElementById('utteranceCount').textContent = sizeInfo;
         
         renderUtterances();
+        drawWaveform(0);
     } catch (e) {
         state.utterances = [];
         document.getElementById('utteranceCount').textContent = '0개';
@@ -503,6 +652,66 @@ function closePreview() {
     modal.classList.remove('active');
     state.currentJobId = null;
     state.utterances = [];
+    state.waveform = null;
+}
+
+// [advice from AI] 파형 피크 로드 (WAV 전체를 받지 않고 화면 폭만큼의 min/max만 조회)
+async function loadWaveform(jobId) {
+    const canvas = document.getElementById('waveformCanvas');
+    state.waveform = null;
+    canvas.width = canvas.clientWidth * (window.devicePixelRatio || 1);
+    drawWaveform(0);
+    
+    try {
+        const data = await fetchAPI('/files/' + jobId + '/peaks?points=' + canvas.width);
+        if (state.currentJobId !== jobId) return;
+        state.waveform = data;
+        drawWaveform(0);
+    } catch (e) {
+        state.waveform = null;
+    }
+}
+
+function drawWaveform(currentTime) {
+    const canvas = document.getElementById('waveformCanvas');
+    const ctx = canvas.getContext('2d');
+    const width = canvas.width;
+    const height = canvas.height;
+    const wf = state.waveform;
+    const styles = getComputedStyle(document.documentElement);
+    
+    ctx.clearRect(0, 0, width, height);
+    if (!wf || !wf.peak_count || !wf.duration_seconds) return;
+    
+    const duration = wf.duration_seconds;
+    const mid = height / 2;
+    
+    // 발화 구간 마커 (상담사/고객 색 구분)
+    ctx.globalAlpha = 0.12;
+    state.utterances.forEach(u => {
+        ctx.fillStyle = u.role === 'agent' ? styles.getPropertyValue('--accent-color') : styles.getPropertyValue('--text-muted');
+        const x1 = u.started_at / duration * width;
+        const x2 = u.ended_at / duration * width;
+        ctx.fillRect(x1, 0, Math.max(1, x2 - x1), height);
+    });
+    ctx.globalAlpha = 1;
+    
+    // 픽셀마다 해당 구간의 min/max 막대
+    const playedX = currentTime / duration * width;
+    const perPixel = wf.peak_count / width;
+    for (let x = 0; x < width; x++) {
+        const from = Math.floor(x * perPixel);
+        const to = Math.max(from + 1, Math.floor((x + 1) * perPixel));
+        let min = 0, max = 0;
+        for (let i = from; i < to && i < wf.peak_count; i++) {
+            min = Math.min(min, wf.data[i * 2]);
+            max = Math.max(max, wf.data[i * 2 + 1]);
+        }
+        ctx.fillStyle = x < playedX ? styles.getPropertyValue('--accent-color') : styles.getPropertyValue('--text-secondary');
+        const top = mid - (max / 32768) * mid;
+        const bottom = mid - (min / 32768) * mid;
+        ctx.fillRect(x, top, 1, Math.max(1, bottom - top));
+    }
 }
 
 function renderUtterances() {
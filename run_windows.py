@@ -11,6 +11,7 @@ import socket
 import webbrowser
 import threading
 import signal
+import multiprocessing
 from pathlib import Path
 
 # [advice from AI] PyInstaller 번들 환경에서 경로 처리
@@ -116,5 +117,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # [advice from AI] 프로세스 풀(대량 파싱) 사용 시 PyInstaller 번들 지원
+    multiprocessing.freeze_support()
     main()
 